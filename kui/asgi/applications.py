@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import dataclasses
 import functools
+import mmap
 from pathlib import PurePath
 from types import AsyncGeneratorType
 from typing import (
@@ -24,20 +25,22 @@ from baize.typing import Receive, Scope, Send
 from pydantic import BaseModel
 from typing_extensions import Literal
 
-from ..cors import CORSConfig
+from ..cors import CORSConfig, CORSPolicy
+from ..exceptions import ValidationErrorRenderer
 from ..responses import create_json_encoder
 from ..routing import AsyncViewType, BaseRoute, MiddlewareType, NoMatchFound
 from ..utils import ImmutableAttribute, State
 from ..utils.contextvars import context_setter
-from .cors import allow_cors
+from .background import BackgroundExecutor
+from .cors import cors_middleware, get_preflight_response
 from .exceptions import ErrorHandlerType, ExceptionMiddleware, HTTPException
 from .lifespan import Lifespan, LifespanCallback
+from .processpool import ProcessPool
 from .requests import (
+    ConnectionContext,
     HttpRequest,
     WebSocket,
-    http_connection_var,
-    request_var,
-    websocket_var,
+    connection_context_var,
 )
 from .responses import (
     FileResponse,
@@ -49,6 +52,7 @@ from .responses import (
 )
 from .routing import Router
 from .templates import BaseTemplates
+from .threadpool import ThreadPool
 
 LifespanCallbackTypeVar = TypeVar("LifespanCallbackTypeVar", bound=LifespanCallback)
 
@@ -73,9 +77,13 @@ class Kui:
         socket_middlewares: List[MiddlewareType] = [],
         exception_handlers: Mapping[int | Type[BaseException], ErrorHandlerType] = {},
         cors_config: Optional[CORSConfig] = None,
+        validation_error_renderer: ValidationErrorRenderer = ValidationErrorRenderer(),
         factory_class: FactoryClass = FactoryClass(),
         response_converters: Mapping[type, Callable[..., HttpResponse]] = {},
         json_encoder: Mapping[type, Callable[[Any], Any]] = {},
+        background_executor: Optional[BackgroundExecutor] = None,
+        thread_pool: Optional[ThreadPool] = None,
+        process_pool: Optional[ProcessPool] = None,
     ) -> None:
         self.should_exit = False
 
@@ -84,18 +92,42 @@ class Kui:
         self.json_encoder = create_json_encoder(*json_encoder.items())
         self.factory_class = factory_class
         self.templates = templates
-        self.lifespan = Lifespan(copy.copy(on_startup), copy.copy(on_shutdown))
+        self.background_executor = background_executor
+        self.thread_pool = thread_pool if thread_pool is not None else ThreadPool()
+        self.process_pool = process_pool if process_pool is not None else ProcessPool()
+        self.lifespan = Lifespan(
+            copy.copy(on_startup),
+            copy.copy(on_shutdown),
+            background_executor,
+            self.thread_pool,
+            self.process_pool,
+        )
 
         http_middlewares = [*http_middlewares]
 
-        self.exception_middleware = ExceptionMiddleware(exception_handlers)
+        self.exception_middleware = ExceptionMiddleware(
+            exception_handlers, validation_error_renderer
+        )
         http_middlewares.append(self.exception_middleware)
 
+        self.cors_policy: Optional[CORSPolicy] = None
         if cors_config is not None:
-            http_middlewares.append(allow_cors(**cors_config))
+            self.cors_policy = CORSPolicy(**cors_config)
+            http_middlewares.append(cors_middleware(self.cors_policy))
 
         self.router = Router(routes, http_middlewares, socket_middlewares)
 
+    @property
+    def should_exit(self) -> bool:
+        return self._should_exit
+
+    @should_exit.setter
+    def should_exit(self, value: bool) -> None:
+        self._should_exit = value
+        if value:
+            # Wake up the long-lived connections waiting for the routes to change
+            self.router.notify()
+
     def add_exception_handler(
         self, exc_class_or_status_code: int | Type[Exception], handler: ErrorHandlerType
     ) -> None:
@@ -126,25 +158,20 @@ class Kui:
 
     async def http(self, scope: Scope, receive: Receive, send: Send) -> None:
         request = self.factory_class.http(scope, receive, send)
-        with (
-            context_setter(http_connection_var, request),
-            context_setter(request_var, request),
-        ):
+        with context_setter(connection_context_var, ConnectionContext(request)):
             try:
                 try:
                     path_params, handler = self.router.search("http", request["path"])
+                    request.internals.path_params = path_params
+                    # Kept for middlewares and handlers that read the scope
                     request["path_params"] = path_params
-                    response = await handler()
+                    # Answer the preflight request without calling the endpoint
+                    response = (
+                        self.cors_policy is not None
+                        and get_preflight_response(self.cors_policy)
+                    ) or await handler()
                 except NoMatchFound:
-                    http_exception: HTTPException[None] = HTTPException(404)
-                    error_handler = self.exception_middleware.lookup_handler(
-                        http_exception
-                    )
-                    if error_handler is None:
-                        raise RuntimeError(
-                            "No exception handler found for HTTPException(404)"
-                        )
-                    response = await error_handler(http_exception)
+                    response = await self.exception_middleware.not_found()
 
                 if isinstance(response, tuple):
                     response = self.response_converter(*response)
@@ -153,29 +180,45 @@ class Kui:
 
                 return await response(scope, receive, send)
             finally:
-                try:
-                    await request.background_tasks.run()
-                finally:
-                    await request.close()
+                background_tasks = request.internals.background_tasks
+                executor = self.background_executor
+                if background_tasks is not None and executor is not None:
+                    # Close the request after the tasks, they may read the body
+                    await executor.submit(background_tasks, request.close)
+                else:
+                    try:
+                        if background_tasks is not None:
+                            await background_tasks.run()
+                    finally:
+                        await request.close()
 
     async def websocket(self, scope: Scope, receive: Receive, send: Send) -> None:
         websocket = self.factory_class.websocket(scope, receive, send)
-        with (
-            context_setter(http_connection_var, websocket),
-            context_setter(websocket_var, websocket),
+        with context_setter(
+            connection_context_var, ConnectionContext(websocket=websocket)
         ):
             try:
                 try:
                     path_params, handler = self.router.search(
                         "websocket", websocket["path"]
                     )
+                    websocket.internals.path_params = path_params
+                    # Kept for middlewares and handlers that read the scope
                     websocket["path_params"] = path_params
                 except NoMatchFound:
                     return await websocket.close(1001)
                 else:
                     return await handler()
             finally:
-                await websocket.background_tasks.run()
+                websocket._run_close_callbacks()
+                await websocket._stop_send_queue()
+                await websocket._stop_receive_pump()
+                background_tasks = websocket.internals.background_tasks
+                if background_tasks is not None:
+                    if self.background_executor is None:
+                        await background_tasks.run()
+                    else:
+                        await self.background_executor.submit(background_tasks)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         scope["app"] = self
@@ -212,6 +255,9 @@ def create_response_converter(
     response_converter.register(list, JSONResponse)
     response_converter.register(tuple, JSONResponse)
     response_converter.register(bytes, PlainTextResponse)
+    response_converter.register(bytearray, PlainTextResponse)
+    response_converter.register(memoryview, PlainTextResponse)
+    response_converter.register(mmap.mmap, PlainTextResponse)
     response_converter.register(str, PlainTextResponse)
     # Because of we can't call `await anext(ag)` in the `response_converter` function,
     # so we can't convert `AsyncGenerator` to `SendEventResponse | StreamResponse`.
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import inspect
 import sys
 from collections import deque
-from typing import Any, Callable, Generic, Iterable, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 if sys.version_info >= (3, 10):  # pragma: no cover
     from typing import ParamSpec
@@ -41,3 +53,127 @@ class BackgroundTasks(BackgroundTask):
             result = task()
             if inspect.isawaitable(result):
                 await result
+
+
+_QueueItem = Tuple[
+    contextvars.Context, BackgroundTasks, Optional[Callable[[], Awaitable[None]]]
+]
+
+
+class BackgroundExecutor:
+    """
+    App-wide executor that runs the background tasks of requests after the
+    response has been sent.
+
+    At most `concurrency` requests' tasks run at the same time, and at most
+    `max_queue_size` wait in the queue. When the queue is full, the request
+    waits for a free slot before it completes.
+
+    Kui closes the request after its tasks have run, so the tasks can still
+    read the request body, form and uploaded files.
+    """
+
+    def __init__(self, concurrency: int = 16, max_queue_size: int = 1024) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be greater than 0")
+        self.concurrency = concurrency
+        self.max_queue_size = max_queue_size
+        self.running = False
+        self.active = 0
+        self._queue: Optional[asyncio.Queue[_QueueItem]] = None
+        self._workers: List[asyncio.Task[None]] = []
+
+    @property
+    def queue_length(self) -> int:
+        """
+        Number of requests whose tasks are waiting to run.
+        """
+        return 0 if self._queue is None else self._queue.qsize()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._workers = [
+            asyncio.ensure_future(self._worker()) for _ in range(self.concurrency)
+        ]
+        self.running = True
+
+    async def submit(
+        self,
+        tasks: BackgroundTasks,
+        cleanup: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """
+        Queue the tasks, they run in a copy of the current context. If the
+        executor is not running, run them immediately.
+
+        `cleanup` is awaited after the tasks, even if they fail.
+        """
+        if not tasks.tasks or not self.running or self._queue is None:
+            try:
+                await tasks.run()
+            finally:
+                if cleanup is not None:
+                    await cleanup()
+            return
+        try:
+            await self._queue.put((contextvars.copy_context(), tasks, cleanup))
+        except BaseException:
+            if cleanup is not None:
+                await cleanup()
+            raise
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting tasks and wait for the queued tasks to finish, the
+        tasks still running after `timeout` seconds are cancelled.
+        """
+        if not self.running or self._queue is None:
+            return
+        self.running = False
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            # The tasks that never ran still have to be cleaned up
+            while not self._queue.empty():
+                _, _, cleanup = self._queue.get_nowait()
+                await self._cleanup(cleanup)
+            self._workers = []
+            self._queue = None
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            context, tasks, cleanup = await queue.get()
+            self.active += 1
+            try:
+                # Task copies the current context when it is created
+                await context.run(asyncio.ensure_future, tasks.run())
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                asyncio.get_running_loop().call_exception_handler(
+                    {"message": "Exception in background task", "exception": exc}
+                )
+            finally:
+                await self._cleanup(cleanup)
+                self.active -= 1
+                queue.task_done()
+
+    @staticmethod
+    async def _cleanup(cleanup: Optional[Callable[[], Awaitable[None]]]) -> None:
+        if cleanup is None:
+            return
+        try:
+            await cleanup()
+        except Exception as exc:
+            asyncio.get_running_loop().call_exception_handler(
+                {"message": "Exception in background task cleanup", "exception": exc}
+            )
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import errno
+import functools
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from baize.typing import Message
+from typing_extensions import Literal
+
+from .requests import WebSocket, websocket_var
+
+__all__ = ["Broadcast", "BroadcastBackend", "MemoryBackend", "UnixSocketBackend"]
+
+MessageHandler = Callable[[str, Message], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastBackend(abc.ABC):
+    """
+    Deliver the messages published to a group to every process that
+    subscribes the group.
+    """
+
+    @abc.abstractmethod
+    async def connect(self, on_message: MessageHandler) -> None:
+        """
+        Start receiving messages, `on_message(group, message)` is called for each.
+        """
+
+    @abc.abstractmethod
+    async def disconnect(self) -> None:
+        """
+        Stop receiving messages.
+        """
+
+    @abc.abstractmethod
+    async def publish(self, group: str, message: Message) -> None:
+        """
+        Send the message to all processes.
+        """
+
+
+class MemoryBackend(BroadcastBackend):
+    """
+    Deliver the messages in the current process.
+    """
+
+    def __init__(self) -> None:
+        self._on_message: Optional[MessageHandler] = None
+
+    async def connect(self, on_message: MessageHandler) -> None:
+        self._on_message = on_message
+
+    async def disconnect(self) -> None:
+        self._on_message = None
+
+    async def publish(self, group: str, message: Message) -> None:
+        if self._on_message is not None:
+            await self._on_message(group, message)
+
+
+class UnixSocketBackend(BroadcastBackend):
+    """
+    Deliver the messages to the processes on the same machine. Each process
+    binds a Unix datagram socket in `directory`, and a message is sent to
+    every socket in it.
+
+    A message must fit in one datagram of `max_message_size` bytes, larger
+    messages raise `ValueError`. The sockets in `directory` are listed again
+    after `refresh_interval` seconds. A message to a process whose socket
+    buffer is full is dropped, counted in `dropped_messages`.
+    """
+
+    max_message_size = 65536 * 4
+
+    def __init__(self, directory: str, *, refresh_interval: float = 1.0) -> None:
+        self.directory = directory
+        self.path = os.path.join(directory, f"{os.getpid()}-{uuid.uuid4().hex}.sock")
+        self.refresh_interval = refresh_interval
+        self.dropped_messages = 0
+        self._socket: Optional[socket.socket] = None
+        self._send_socket: Optional[socket.socket] = None
+        self._peers: List[str] = []
+        self._peers_expire = 0.0
+
+    async def connect(self, on_message: MessageHandler) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(self.path)
+        self._socket = sock
+        self._peers_expire = 0.0
+
+        def read() -> None:
+            while True:
+                try:
+                    data = sock.recv(self.max_message_size)
+                except BlockingIOError:
+                    return
+                group, message = self._decode(data)
+                asyncio.ensure_future(on_message(group, message))
+
+        asyncio.get_running_loop().add_reader(sock.fileno(), read)
+
+    async def disconnect(self) -> None:
+        if self._send_socket is not None:
+            self._send_socket.close()
+            self._send_socket = None
+        if self._socket is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._socket.fileno())
+        self._socket.close()
+        self._socket = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def publish(self, group: str, message: Message) -> None:
+        data = self._encode(group, message)
+        if len(data) > self.max_message_size:
+            raise ValueError(
+                f"Message of {len(data)} bytes is larger than {self.max_message_size}"
+            )
+        if self._send_socket is None:
+            self._send_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._send_socket.setblocking(False)
+        for path in self._get_peers():
+            try:
+                self._send_socket.sendto(data, path)
+            except BlockingIOError:
+                self.dropped_messages += 1
+                logger.warning("Broadcast message to %s is dropped", path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # The process has exited without removing its socket
+                self._peers_expire = 0.0
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            except OSError as exc:
+                if exc.errno != errno.EMSGSIZE:
+                    raise
+                raise ValueError(
+                    f"Message of {len(data)} bytes is too large for a datagram"
+                ) from exc
+
+    def _get_peers(self) -> List[str]:
+        now = time.monotonic()
+        if now >= self._peers_expire:
+            self._peers = [
+                os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)
+                if name.endswith(".sock")
+            ]
+            self._peers_expire = now + self.refresh_interval
+        return self._peers
+
+    @staticmethod
+    def _encode(group: str, message: Message) -> bytes:
+        group_bytes = group.encode("utf-8")
+        if message.get("text") is not None:
+            kind, payload = b"T", message["text"].encode("utf-8")
+        else:
+            kind, payload = b"B", message["bytes"]
+        return kind + len(group_bytes).to_bytes(2, "big") + group_bytes + payload
+
+    @staticmethod
+    def _decode(data: bytes) -> Tuple[str, Message]:
+        length = int.from_bytes(data[1:3], "big")
+        group = data[3 : 3 + length].decode("utf-8")
+        payload = data[3 + length :]
+        if data[:1] == b"T":
+            return group, {"type": "websocket.send", "text": payload.decode("utf-8")}
+        return group, {"type": "websocket.send", "bytes": payload}
+
+
+class _Subscriber:
+    def __init__(self, websocket: WebSocket, queue_size: int) -> None:
+        self.websocket = websocket
+        self.groups: Set[str] = set()
+        self.queue: Deque[Message] = deque(maxlen=queue_size)
+        self.ready = asyncio.Event()
+        self.writer: Optional[asyncio.Task[None]] = None
+
+
+class Broadcast:
+    """
+    Send one message to all websockets in a group.
+
+    Every websocket has a send queue of `queue_size` messages. When the queue
+    of a slow consumer is full, `overflow="disconnect"` closes it with code
+    1013, and `overflow="coalesce"` drops its oldest queued message.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[BroadcastBackend] = None,
+        *,
+        queue_size: int = 32,
+        overflow: Literal["disconnect", "coalesce"] = "disconnect",
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.groups: Dict[str, Set[int]] = {}
+        self.dropped_messages = 0
+        self.dropped_subscribers = 0
+        self._subscribers: Dict[int, _Subscriber] = {}
+        self._connected = False
+
+    async def connect(self) -> None:
+        if not self._connected:
+            await self.backend.connect(self._fan_out)
+            self._connected = True
+
+    async def disconnect(self) -> None:
+        if self._connected:
+            await self.backend.disconnect()
+            self._connected = False
+        for subscriber in list(self._subscribers.values()):
+            self._remove(subscriber)
+
+    async def join(self, group: str, websocket: Optional[WebSocket] = None) -> None:
+        """
+        Add the websocket (current websocket by default) to the group.
+        """
+        await self.connect()
+        websocket = websocket if websocket is not None else websocket_var.get()
+        subscriber = self._subscribers.get(id(websocket))
+        if subscriber is None:
+            subscriber = _Subscriber(websocket, self.queue_size)
+            subscriber.writer = asyncio.ensure_future(self._write(subscriber))
+            self._subscribers[id(websocket)] = subscriber
+            websocket.add_close_callback(functools.partial(self._remove, subscriber))
+        subscriber.groups.add(group)
+        self.groups.setdefault(group, set()).add(id(websocket))
+
+    async def leave(self, group: str, websocket: Optional[WebSocket] = None) -> None:
+        """
+        Remove the websocket (current websocket by default) from the group.
+        """
+        websocket = websocket if websocket is not None else websocket_var.get()
+        subscriber = self._subscribers.get(id(websocket))
+        if subscriber is None:
+            return
+        subscriber.groups.discard(group)
+        self._discard_member(group, id(websocket))
+        if not subscriber.groups:
+            self._remove(subscriber)
+
+    async def leave_all(self, websocket: Optional[WebSocket] = None) -> None:
+        """
+        Remove the websocket (current websocket by default) from all groups.
+        """
+        websocket = websocket if websocket is not None else websocket_var.get()
+        subscriber = self._subscribers.get(id(websocket))
+        if subscriber is not None:
+            self._remove(subscriber)
+
+    async def publish(self, group: str, data: Any) -> None:
+        """
+        Send `str` as text, `bytes` as binary and others as JSON text. The
+        data is serialized once for all websockets.
+        """
+        message: Message
+        if isinstance(data, str):
+            message = {"type": "websocket.send", "text": data}
+        elif isinstance(data, bytes):
+            message = {"type": "websocket.send", "bytes": data}
+        else:
+            message = {"type": "websocket.send", "text": json.dumps(data)}
+        await self.connect()
+        await self.backend.publish(group, message)
+
+    def count(self, group: str) -> int:
+        return len(self.groups.get(group, ()))
+
+    async def _fan_out(self, group: str, message: Message) -> None:
+        for key in list(self.groups.get(group, ())):
+            subscriber = self._subscribers[key]
+            if len(subscriber.queue) == self.queue_size:
+                if self.overflow == "disconnect":
+                    self.dropped_subscribers += 1
+                    self._remove(subscriber)
+                    asyncio.ensure_future(self._close(subscriber.websocket))
+                    continue
+                self.dropped_messages += 1
+            subscriber.queue.append(message)
+            subscriber.ready.set()
+
+    async def _write(self, subscriber: _Subscriber) -> None:
+        try:
+            while True:
+                while not subscriber.queue:
+                    subscriber.ready.clear()
+                    await subscriber.ready.wait()
+                await subscriber.websocket.send(subscriber.queue.popleft())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The websocket is closed
+            subscriber.writer = None
+            self._remove(subscriber)
+
+    def _remove(self, subscriber: _Subscriber) -> None:
+        key = id(subscriber.websocket)
+        if self._subscribers.get(key) is not subscriber:
+            return
+        del self._subscribers[key]
+        for group in subscriber.groups:
+            self._discard_member(group, key)
+        subscriber.groups.clear()
+        if subscriber.writer is not None:
+            subscriber.writer.cancel()
+
+    def _discard_member(self, group: str, key: int) -> None:
+        members = self.groups.get(group)
+        if members is not None:
+            members.discard(key)
+            if not members:
+                del self.groups[group]
+
+    @staticmethod
+    async def _close(websocket: WebSocket) -> None:
+        try:
+            await websocket.close(1013)
+        except Exception:
+            pass
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from baize.asgi import FileResponse as BaiZeFileResponse
+from baize.asgi.helper import empty_receive, send_http_body, send_http_start
+from baize.asgi.responses import StreamingResponse
+from baize.datastructures import MutableHeaders
+from baize.typing import Message, Receive, Scope, Send
+
+from ..cache import (
+    CacheBackend,
+    CacheEntry,
+    MemoryCache,
+    create_cache_key,
+    is_cacheable,
+    replay_headers,
+)
+from ..etag import etag_matches
+from .requests import request
+from .responses import (
+    HttpResponse,
+    convert_response,
+    get_if_none_match,
+    send_not_modified,
+)
+from .routing import AsyncViewType
+
+# Render the response as an unconditional GET, so that the cached entry
+# does not depend on the conditional headers of the first request.
+_RENDER_SCOPE: Scope = {"type": "http", "method": "GET", "headers": []}
+
+
+class CachedResponse(HttpResponse):
+    """
+    Send a cached entry, respond 304 if its ETag matches `If-None-Match`.
+    """
+
+    def __init__(self, entry: CacheEntry) -> None:
+        super().__init__(entry.status_code, MutableHeaders(entry.headers))
+        self.entry = entry
+        self.body = entry.body
+
+    def list_headers(self, *, as_bytes: bool) -> Any:
+        headers = [
+            *replay_headers(self.entry, self.headers),
+            *(("set-cookie", str(cookie)) for cookie in self.cookies),
+        ]
+        if as_bytes:
+            return [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+        return headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        etag = self.headers.get("etag")
+        if etag is not None and etag_matches(get_if_none_match(scope), etag):
+            return await send_not_modified(send, self)
+        self.headers["content-length"] = str(len(self.body))
+        await send_http_start(send, self.status_code, self.list_headers(as_bytes=True))
+        await send_http_body(send, self.body)
+
+
+async def render_response(response: HttpResponse) -> CacheEntry:
+    """
+    Render the response to status, headers and body bytes.
+    """
+    start_message: Optional[Message] = None
+    body: List[bytes] = []
+
+    async def capture_send(message: Message) -> None:
+        nonlocal start_message
+        if message["type"] == "http.response.start":
+            start_message = message
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+        else:
+            raise RuntimeError(f"Unexpected message type: {message['type']}")
+
+    await response(_RENDER_SCOPE, empty_receive, capture_send)
+    assert start_message is not None, "http.response.start must be sent first"
+    headers: List[Tuple[str, str]] = [
+        (k.decode("latin-1"), v.decode("latin-1"))
+        for k, v in start_message.get("headers", ())
+    ]
+    return CacheEntry(start_message["status"], headers, b"".join(body))
+
+
+def cache_response(
+    ttl: float = 60,
+    *,
+    query_params: Optional[Iterable[str]] = None,
+    vary: Iterable[str] = (),
+    methods: Iterable[str] = ("GET", "HEAD"),
+    backend: Optional[CacheBackend] = None,
+) -> Callable[[AsyncViewType], AsyncViewType]:
+    """
+    Cache fully rendered responses
+
+    Concurrent misses of the same key are coalesced, only one handler call runs.
+    """
+    cache: CacheBackend = MemoryCache() if backend is None else backend
+    selected_query_params = None if query_params is None else tuple(query_params)
+    vary_headers = tuple(name.lower() for name in vary)
+    allow_methods = frozenset(method.upper() for method in methods)
+    pending: Dict[str, asyncio.Future[Optional[CacheEntry]]] = {}
+
+    def decorator(endpoint: AsyncViewType) -> AsyncViewType:
+        async def call_endpoint(key: str) -> Any:
+            future: asyncio.Future[Optional[CacheEntry]]
+            future = asyncio.get_running_loop().create_future()
+            pending[key] = future
+            cached_entry: Optional[CacheEntry] = None
+            try:
+                response = convert_response(await endpoint())
+                if not isinstance(response, HttpResponse) or isinstance(
+                    response, (StreamingResponse, BaiZeFileResponse)
+                ):
+                    return response
+                entry = await render_response(response)
+                if is_cacheable(entry.status_code, entry.headers):
+                    cache.set(key, entry, ttl)
+                    cached_entry = entry
+                return CachedResponse(entry)
+            finally:
+                del pending[key]
+                future.set_result(cached_entry)
+
+        async def cache_wrapper() -> Any:
+            if request.method not in allow_methods:
+                return await endpoint()
+
+            key = create_cache_key(
+                request.method,
+                request.url.path,
+                request.query_params.multi_items(),
+                selected_query_params,
+                request.headers,
+                vary_headers,
+            )
+            entry = cache.get(key)
+            if entry is not None:
+                return CachedResponse(entry)
+
+            future = pending.get(key)
+            if future is None:
+                return await call_endpoint(key)
+
+            entry = await asyncio.shield(future)
+            if entry is not None:
+                return CachedResponse(entry)
+            # The first call failed or its response can't be cached
+            return await endpoint()
+
+        return cache_wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from baize.typing import Message, Receive, Scope, Send
+
+from ..compression import (
+    DEFAULT_ENCODINGS,
+    DEFAULT_EXCLUDED_CONTENT_TYPES,
+    Compressor,
+    compressed_headers,
+    create_compressor_factories,
+    negotiate_encoding,
+    should_compress,
+)
+from .requests import request
+from .responses import HttpResponse, convert_response
+from .routing import AsyncViewType
+
+
+def _decode_headers(headers: Iterable[Tuple[bytes, bytes]]) -> List[Tuple[str, str]]:
+    return [(k.decode("latin-1"), v.decode("latin-1")) for k, v in headers]
+
+
+def _encode_headers(headers: Iterable[Tuple[str, str]]) -> List[Tuple[bytes, bytes]]:
+    return [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+
+
+class CompressResponse(HttpResponse):
+    """
+    Wrap a response and compress the body sent by it.
+
+    The small body is compressed in one piece, the streaming body
+    is compressed chunk by chunk and flushed after each chunk.
+    """
+
+    def __init__(
+        self,
+        response: HttpResponse,
+        encoding: str,
+        compressor_factory: Callable[[], Compressor],
+        minimum_size: int,
+        excluded_content_types: AbstractSet[str],
+    ) -> None:
+        super().__init__(response.status_code)
+        # Share headers and cookies, so the outer middlewares can still modify them
+        self.headers = response.headers
+        self.cookies = response.cookies
+        self.response = response
+        self.encoding = encoding
+        self.compressor_factory = compressor_factory
+        self.minimum_size = minimum_size
+        self.excluded_content_types = excluded_content_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        start_message: Optional[Message] = None
+        compressor: Optional[Compressor] = None
+        passthrough = False
+
+        async def compress_send(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if passthrough:
+                return await send(message)
+
+            if message["type"] == "http.response.start":
+                if should_compress(
+                    message["status"],
+                    _decode_headers(message.get("headers", ())),
+                    self.excluded_content_types,
+                ):
+                    # Wait for the first body to decide how to compress
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            if compressor is not None:
+                more_body = message.get("more_body", False)
+                chunk = compressor.compress(message.get("body", b""))
+                chunk += compressor.flush() if more_body else compressor.finish()
+                if chunk or not more_body:
+                    await send({**message, "body": chunk})
+                return
+
+            assert start_message is not None, "http.response.start must be sent first"
+
+            if message["type"] != "http.response.body":
+                # e.g. http.response.zerocopysend, which can't be compressed
+                passthrough = True
+                await send(start_message)
+                return await send(message)
+
+            body: bytes = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if not more_body and len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                return await send(message)
+
+            compressor = self.compressor_factory()
+            headers = _decode_headers(start_message.get("headers", ()))
+            if more_body:
+                chunk = compressor.compress(body) + compressor.flush()
+                headers = compressed_headers(headers, self.encoding)
+            else:
+                chunk = compressor.compress(body) + compressor.finish()
+                headers = compressed_headers(headers, self.encoding, len(chunk))
+            await send({**start_message, "headers": _encode_headers(headers)})
+            await send({**message, "body": chunk})
+
+        await self.response(scope, receive, compress_send)
+
+
+def compress_response(
+    minimum_size: int = 500,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    levels: Mapping[str, int] = {},
+    excluded_content_types: Iterable[str] = DEFAULT_EXCLUDED_CONTENT_TYPES,
+) -> Callable[[AsyncViewType], AsyncViewType]:
+    """
+    Compress response body by the `Accept-Encoding` of request
+    """
+    compressor_factories = create_compressor_factories(encodings, levels)
+    available_encodings = tuple(compressor_factories.keys())
+    excluded = frozenset(excluded_content_types)
+
+    def decorator(endpoint: AsyncViewType) -> AsyncViewType:
+        async def compression_wrapper() -> Any:
+            encoding = negotiate_encoding(
+                request.headers.get("accept-encoding", ""), available_encodings
+            )
+            if encoding is None:
+                return await endpoint()
+            return CompressResponse(
+                convert_response(await endpoint()),
+                encoding,
+                compressor_factories[encoding],
+                minimum_size,
+                excluded,
+            )
+
+        return compression_wrapper  # type: ignore
+
+    return decorator
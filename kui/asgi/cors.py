@@ -1,58 +1,59 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Callable, Dict, Iterable, Pattern
+from typing import Any, Callable, Iterable, List, Optional, Pattern, Tuple, Union
 
+from baize.asgi.helper import send_http_body, send_http_start
+from baize.typing import Receive, Scope, Send
+
+from ..cors import DEFAULT_ALLOW_METHODS, CORSPolicy
 from .requests import request
 from .responses import HttpResponse, convert_response
 from .routing import AsyncViewType
 
 
-def allow_cors(
-    allow_origins: Iterable[Pattern] = (re.compile(".*"),),
-    allow_methods: Iterable[str] = (
-        "GET",
-        "POST",
-        "PUT",
-        "PATCH",
-        "DELETE",
-        "HEAD",
-        "OPTIONS",
-        "TRACE",
-    ),
-    allow_headers: Iterable[str] = (),
-    expose_headers: Iterable[str] = (),
-    allow_credentials: bool = False,
-    max_age: int = 600,
-) -> Callable[[AsyncViewType], AsyncViewType]:
+class PreflightResponse(HttpResponse):
     """
-    Cross-Origin Resource Sharing
+    Respond the preflight request with the pre-encoded CORS headers.
     """
 
-    config_dict: Dict[str, str] = {
-        "Access-Control-Allow-Methods": ", ".join(allow_methods),
-        "Access-Control-Allow-Headers": ", ".join(
-            {"Accept", "Accept-Language", "Content-Language", "Content-Type"}
-            | set(allow_headers)
-        ),
-        "Access-Control-Expose-Headers": ", ".join(expose_headers),
-        "Access-Control-Allow-Credentials": "true" if allow_credentials else "false",
-        "Access-Control-Max-Age": str(max_age),
-    }
-    config_dict = {k: v for k, v in config_dict.items() if v}
+    def __init__(self, raw_headers: List[Tuple[bytes, bytes]], origin: str) -> None:
+        super().__init__()
+        self.raw_headers = [
+            *raw_headers,
+            (b"access-control-allow-origin", origin.encode("latin-1")),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = self.raw_headers + self.list_headers(as_bytes=True)
+        await send_http_start(send, self.status_code, headers)
+        await send_http_body(send)
+
+
+def get_preflight_response(policy: CORSPolicy) -> Optional[PreflightResponse]:
+    """
+    Return the response if current request is a preflight request from an
+    allowed origin.
+    """
+    if request.method != "OPTIONS":
+        return None
+    origin = request.headers.get("origin", None)
+    if origin and policy.is_allowed_origin(origin):
+        return PreflightResponse(policy.raw_headers, origin)
+    return None
 
+
+def cors_middleware(policy: CORSPolicy) -> Callable[[AsyncViewType], AsyncViewType]:
     def decorator(endpoint: AsyncViewType) -> AsyncViewType:
         async def cors_wrapper() -> Any:
             origin = request.headers.get("origin", None)
-            if origin and any(
-                origin_pattern.fullmatch(origin) for origin_pattern in allow_origins
-            ):
+            if origin and policy.is_allowed_origin(origin):
                 # Preflight request
                 if request.method == "OPTIONS":
-                    response = HttpResponse()
-                else:
-                    response = convert_response(await endpoint())
-                response.headers.update(config_dict)
+                    return PreflightResponse(policy.raw_headers, origin)
+                response = convert_response(await endpoint())
+                response.headers.update(policy.headers)
                 response.headers["Access-Control-Allow-Origin"] = origin
                 return response
             else:
@@ -61,3 +62,26 @@ def allow_cors(
         return cors_wrapper  # type: ignore
 
     return decorator
+
+
+def allow_cors(
+    allow_origins: Iterable[Union[Pattern, str]] = (re.compile(".*"),),
+    allow_methods: Iterable[str] = DEFAULT_ALLOW_METHODS,
+    allow_headers: Iterable[str] = (),
+    expose_headers: Iterable[str] = (),
+    allow_credentials: bool = False,
+    max_age: int = 600,
+) -> Callable[[AsyncViewType], AsyncViewType]:
+    """
+    Cross-Origin Resource Sharing
+    """
+    return cors_middleware(
+        CORSPolicy(
+            allow_origins,
+            allow_methods,
+            allow_headers,
+            expose_headers,
+            allow_credentials,
+            max_age,
+        )
+    )
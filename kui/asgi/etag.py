@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from baize.typing import Message, Receive, Scope, Send
+
+from ..etag import create_etag, etag_matches
+from .responses import (
+    HttpResponse,
+    convert_response,
+    get_if_none_match,
+    send_not_modified,
+)
+from .routing import AsyncViewType
+
+
+class ETagResponse(HttpResponse):
+    """
+    Wrap a response, add ETag generated from the rendered body and
+    respond 304 if it matches `If-None-Match`.
+
+    Streaming responses are sent as is.
+    """
+
+    def __init__(self, response: HttpResponse) -> None:
+        super().__init__(response.status_code)
+        # Share headers and cookies, so the outer middlewares can still modify them
+        self.headers = response.headers
+        self.cookies = response.cookies
+        self.response = response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] not in ("GET", "HEAD"):
+            return await self.response(scope, receive, send)
+
+        if_none_match = get_if_none_match(scope)
+
+        etag = self.headers.get("etag")
+        if etag is not None:
+            # Precomputed version tag, no need to render the body
+            if etag_matches(if_none_match, etag):
+                return await send_not_modified(send, self)
+            return await self.response(scope, receive, send)
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def etag_send(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                return await send(message)
+
+            if message["type"] == "http.response.start":
+                if message["status"] == 200:
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            assert start_message is not None, "http.response.start must be sent first"
+            passthrough = True
+
+            if message["type"] != "http.response.body" or message.get(
+                "more_body", False
+            ):
+                await send(start_message)
+                return await send(message)
+
+            etag = create_etag(message.get("body", b""))
+            self.headers["etag"] = etag
+            if etag_matches(if_none_match, etag):
+                return await send_not_modified(send, self)
+            headers = [*start_message.get("headers", ()), (b"etag", etag.encode())]
+            await send({**start_message, "headers": headers})
+            await send(message)
+
+        await self.response(scope, receive, etag_send)
+
+
+def etag_response() -> Callable[[AsyncViewType], AsyncViewType]:
+    """
+    Generate ETag for response and answer conditional GET with 304
+    """
+
+    def decorator(endpoint: AsyncViewType) -> AsyncViewType:
+        async def etag_wrapper() -> Any:
+            return ETagResponse(convert_response(await endpoint()))
+
+        return etag_wrapper  # type: ignore
+
+    return decorator
@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing
 from http import HTTPStatus
 
+from baize.asgi import SmallResponse
 from typing_extensions import Annotated
 
 from ..exceptions import ExceptionMiddlewareBase, HTTPException, RequestValidationError
@@ -51,18 +52,36 @@ class ExceptionMiddleware(ExceptionMiddlewareBase[ErrorHandlerType]):
                 exc.headers,
             )
 
+    async def not_found(self) -> typing.Any:
+        """
+        Respond HTTPException(404). If it is handled by the default handler,
+        the response is built once and copied for each request. Only a
+        `SmallResponse` is reused, others may be consumed when sent.
+        """
+        if self._not_found_response is not None:
+            return self._copy_response(self._not_found_response)
+        http_exception: HTTPException[None] = HTTPException(status_code=404)
+        handler = self.lookup_handler(http_exception)
+        if handler is None:
+            raise RuntimeError("No exception handler found for HTTPException(404)")
+        response = await handler(http_exception)
+        if handler is ExceptionMiddleware.http_exception and isinstance(
+            response, SmallResponse
+        ):
+            self._not_found_response = response
+            return self._copy_response(response)
+        return response
+
     async def validation_error(
         self, exc: RequestValidationError
     ) -> Annotated[
         HttpResponse, JSONResponse[422, {}, RequestValidationError.schema()]
     ]:
         if exc.in_ == "path":
-            http_exception: HTTPException[None] = HTTPException(status_code=404)
-            handler = self.lookup_handler(http_exception)
-            if handler is None:
-                raise RuntimeError("No exception handler found for HTTPException(404)")
-            return await handler(http_exception)
+            return await self.not_found()
         else:
             return PlainTextResponse(
-                exc.json(), status_code=422, media_type="application/json"
+                self.validation_error_renderer.render(exc, request.app.json_encoder),
+                status_code=422,
+                media_type="application/json",
             )
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import inspect
 import traceback
 from contextlib import asynccontextmanager, nullcontext
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, List, Tuple
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, List, Optional, Tuple
 
 from baize.typing import Receive, Scope, Send
 
+from .background import BackgroundExecutor
+from .processpool import ProcessPool
+from .threadpool import ThreadPool
+
 if TYPE_CHECKING:
     from .applications import Kui
 
@@ -19,17 +24,26 @@ LifespanCallback = Callable[["Kui"], Any]
 class Lifespan:
     on_startup: List[LifespanCallback] = dataclasses.field(default_factory=list)
     on_shutdown: List[LifespanCallback] = dataclasses.field(default_factory=list)
+    background_executor: Optional[BackgroundExecutor] = None
+    thread_pool: Optional[ThreadPool] = None
+    process_pool: Optional[ProcessPool] = None
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Handle ASGI lifespan messages, which allows us to manage application
         startup and shutdown events.
+
+        The background executor starts before `on_startup` and is drained
+        after `on_shutdown`, then the thread pool and the process pool are
+        shut down.
         """
         app: Kui = scope["app"]
 
         message = await receive()
         assert message["type"] == "lifespan.startup"
         try:
+            if self.background_executor is not None:
+                await self.background_executor.start()
             for handler in self.on_startup:
                 result = handler(app)
                 if inspect.isawaitable(result):
@@ -47,6 +61,14 @@ class Lifespan:
                 result = handler(app)
                 if inspect.isawaitable(result):
                     await result
+            if self.background_executor is not None:
+                await self.background_executor.shutdown()
+            # Waiting for the running calls must not block the event loop
+            loop = asyncio.get_running_loop()
+            if self.thread_pool is not None:
+                await loop.run_in_executor(None, self.thread_pool.shutdown)
+            if self.process_pool is not None:
+                await loop.run_in_executor(None, self.process_pool.shutdown)
         except BaseException:
             msg = traceback.format_exc()
             await send({"type": "lifespan.shutdown.failed", "message": msg})
@@ -1,12 +1,8 @@
 from __future__ import annotations
 
-import asyncio
-import json
-from hashlib import md5
-
 from ..openapi import OpenAPI as _OpenAPI
 from .requests import request
-from .responses import HTMLResponse, JSONResponse
+from .responses import HTMLResponse, JSONResponse, PlainTextResponse
 from .routing import HttpRoute, Routes
 
 
@@ -20,24 +16,32 @@ class OpenAPI(_OpenAPI):
             return HTMLResponse(self.html_template)
 
         async def json_docs():
-            openapi = self.create_docs(request)
-            return JSONResponse(
-                openapi,
-                headers={
-                    "hash": md5(json.dumps(openapi).encode()).hexdigest(),
-                    "reload": str(self.reload).lower(),
-                },
-            )
+            headers = {
+                "hash": self.docs_hash(request.app),
+                "reload": str(self.reload).lower(),
+            }
+            if self.prebuilt_docs is not None:
+                return PlainTextResponse(
+                    self.prebuilt_docs,
+                    headers=headers,
+                    media_type="application/json",
+                    etag=self.prebuilt_etag,
+                )
+            return JSONResponse(self.create_docs(request), headers=headers)
 
         async def heartbeat():
             async def g():
-                openapi = self.create_docs(request)
-                yield {
-                    "id": md5(json.dumps(openapi).encode()).hexdigest(),
-                    "data": json.dumps(openapi),
-                }
-                while not request.app.should_exit:
-                    await asyncio.sleep(0.5)
+                app = request.app
+                version = app.router.version
+                docs_hash = ""
+                while not app.should_exit:
+                    if self.docs_hash(app) != docs_hash:
+                        docs_hash = self.docs_hash(app)
+                        yield {
+                            "id": docs_hash,
+                            "data": self.dumps_docs(request),
+                        }
+                    version = await app.router.wait_for_change(version)
 
             return g()
 
@@ -24,8 +24,10 @@ from ..parameters import (
     _update_docs,
     _validate_parameters_and_request_body,
     create_auto_params,
+    defer_docs,
 )
 from ..utils import is_async_gen_callable, is_coroutine_callable, is_gen_callable
+from ..utils.profiler import startup_profiler
 from .requests import http_connection, request
 
 CallableObject = TypeVar("CallableObject", bound=Callable)
@@ -36,23 +38,85 @@ __all__ = [
 ]
 
 
-def _create_new_callback(callback: CallableObject) -> CallableObject:
-    sig = inspect.signature(callback)
+async def _call_in_threadpool(callback: Callable, *args: Any, **kwargs: Any) -> Any:
+    result = await http_connection.app.thread_pool.run(callback, *args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
 
-    (
-        parameters,
-        request_body,
-        exclusive_models,
-        security_info,
-    ) = _parse_parameters_and_request_body_to_model(sig)
 
-    depend_attrs = _parse_depends_attrs(sig)
+def _create_new_callback(
+    callback: CallableObject, threadpool: bool = False, *, dependency: bool = False
+) -> CallableObject:
+    # Only plain sync callables can be called in the thread pool
+    offloadable = not (
+        is_coroutine_callable(callback)
+        or is_gen_callable(callback)
+        or is_async_gen_callable(callback)
+    )
+    threadpool = offloadable and (
+        threadpool or getattr(callback, "__threadpool__", False)
+    )
+    processpool = offloadable and getattr(callback, "__processpool__", False)
+
+    with startup_profiler.phase("signature"):
+        sig = inspect.signature(callback)
+
+        (
+            parameters,
+            request_body,
+            exclusive_models,
+            security_info,
+        ) = _parse_parameters_and_request_body_to_model(sig)
+
+        depend_attrs = _parse_depends_attrs(sig)
     depend_functions = {
-        name: _create_new_callback(info.call) for name, info in depend_attrs.items()
+        name: _create_new_callback(info.call, info.threadpool, dependency=True)
+        for name, info in depend_attrs.items()
     }
+    # Sync dependencies without parameters are called as they are
+    has_sync_dependency = any(
+        function is depend_attrs[name].call
+        and not (
+            is_coroutine_callable(function)
+            or is_gen_callable(function)
+            or is_async_gen_callable(function)
+        )
+        for name, function in depend_functions.items()
+    )
 
     if not (parameters or request_body or depend_attrs):
-        callback_with_auto_bound_params = callback  # type: ignore
+        if processpool:
+
+            @functools.wraps(callback)
+            async def callback_with_auto_bound_params(*args, **kwargs) -> Any:
+                return await http_connection.app.process_pool.run(
+                    callback, *args, **kwargs
+                )
+
+            del callback_with_auto_bound_params.__wrapped__  # type: ignore
+        elif threadpool:
+
+            @functools.wraps(callback)
+            async def callback_with_auto_bound_params(*args, **kwargs) -> Any:
+                return await _call_in_threadpool(callback, *args, **kwargs)
+
+            del callback_with_auto_bound_params.__wrapped__  # type: ignore
+        elif offloadable and not dependency:
+            # Views await the endpoint, so a sync one is never left unwrapped.
+            # Dependencies are, the wrapper of their dependant calls them.
+            @functools.wraps(callback)
+            async def callback_with_auto_bound_params(*args, **kwargs) -> Any:
+                if http_connection.app.thread_pool.offload_sync:
+                    return await _call_in_threadpool(callback, *args, **kwargs)
+                result = callback(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+
+            del callback_with_auto_bound_params.__wrapped__  # type: ignore
+        else:
+            callback_with_auto_bound_params = callback  # type: ignore
     else:
 
         @functools.wraps(callback)
@@ -64,10 +128,15 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
             ] = []
             try:
                 # try to call depend functions
-                cache = http_connection.state.setdefault("depend_functions_cache", {})
+                internals = http_connection.internals
+                offload_sync = (
+                    has_sync_dependency and http_connection.app.thread_pool.offload_sync
+                )
                 for name, function in depend_functions.items():
                     info = depend_attrs[name]
-                    if info.cache and info.call in cache:
+                    # Read it each time, the dependencies may create the cache
+                    cache = internals.dependency_cache
+                    if info.cache and cache is not None and info.call in cache:
                         keyword_params[name] = cache[info.call]
                         continue
                     if is_async_gen_callable(info.call):
@@ -94,6 +163,8 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
                             )
                         else:
                             need_closes.append(generator)
+                    elif offload_sync and function is info.call:
+                        keyword_params[name] = await _call_in_threadpool(function)
                     else:
                         result = function()
                         if inspect.isawaitable(result):
@@ -101,7 +172,9 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
                         keyword_params[name] = result
 
                     if info.cache:
-                        cache[info.call] = keyword_params[name]
+                        if internals.dependency_cache is None:
+                            internals.dependency_cache = {}
+                        internals.dependency_cache[info.call] = keyword_params[name]
 
                 data: List[Tuple[Type[BaseModel], Any]]
 
@@ -123,6 +196,16 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
                     _convert_model_data_to_keyword_arguments(data, exclusive_models)
                 )
 
+                if processpool:
+                    return await http_connection.app.process_pool.run(
+                        callback, *args, **{**keyword_params, **kwargs}
+                    )
+                if offloadable and (
+                    threadpool or http_connection.app.thread_pool.offload_sync
+                ):
+                    return await _call_in_threadpool(
+                        callback, *args, **{**keyword_params, **kwargs}
+                    )
                 result = callback(*args, **{**keyword_params, **kwargs})
                 if inspect.isawaitable(result):
                     result = await result
@@ -140,13 +223,18 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
             callback_with_auto_bound_params, "__signature__", _create_new_signature(sig)
         )
 
-    _update_docs(
-        callback,
+    # Generate the docs when they are read by OpenAPI
+    defer_docs(
         callback_with_auto_bound_params,
-        parameters,
-        request_body,
-        depend_functions,
-        security_info,
+        functools.partial(
+            _update_docs,
+            callback,
+            callback_with_auto_bound_params,
+            parameters,
+            request_body,
+            depend_functions,
+            security_info,
+        ),
     )
 
     return typing_cast(CallableObject, callback_with_auto_bound_params)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+if sys.version_info >= (3, 10):  # pragma: no cover
+    from typing import ParamSpec
+else:  # pragma: no cover
+    from typing_extensions import ParamSpec
+
+from ..utils import is_async_gen_callable, is_coroutine_callable, is_gen_callable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+CallableObject = TypeVar("CallableObject", bound=Callable)
+
+__all__ = ["ProcessPool", "in_processpool"]
+
+
+def _call_pickled(payload: bytes) -> Any:
+    func, args, kwargs = pickle.loads(payload)
+    return func(*args, **kwargs)
+
+
+def _describe_unpicklable(
+    func: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> str:
+    name = getattr(func, "__qualname__", repr(func))
+    try:
+        pickle.dumps(func)
+    except Exception as exc:
+        return (
+            f"Cannot pickle {name} to call it in the process pool, "
+            f"define it at the module level: {exc}"
+        )
+    arguments = [(str(index), value) for index, value in enumerate(args)]
+    arguments.extend(kwargs.items())
+    for argument, value in arguments:
+        try:
+            pickle.dumps(value)
+        except Exception as exc:
+            return (
+                f"Cannot pickle argument {argument!r} ({type(value).__name__}) "
+                f"of {name} to call it in the process pool: {exc}"
+            )
+    return f"Cannot pickle the arguments of {name} to call it in the process pool"
+
+
+class ProcessPool:
+    """
+    App-wide process pool that runs CPU-bound sync handlers outside the
+    main process.
+
+    The executor is created on first use and shut down by the lifespan.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.max_workers)
+        return self.executor
+
+    async def run(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """
+        Call `func` in the process pool. `func`, its arguments and its return
+        value must be picklable.
+        """
+        try:
+            payload = pickle.dumps((func, args, kwargs))
+        except Exception as exc:
+            raise TypeError(_describe_unpicklable(func, args, kwargs)) from exc
+        return await asyncio.get_running_loop().run_in_executor(
+            self.get_executor(), _call_pickled, payload
+        )
+
+    def shutdown(self) -> None:
+        """
+        Wait for the running calls to finish and stop the worker processes.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+def in_processpool(handler: CallableObject) -> CallableObject:
+    """
+    Mark a sync handler to be called in the app's process pool. The validated
+    parameters and dependencies are pickled to the worker process, and the
+    return value is converted to a response in the main process.
+
+    Example:
+
+        @app.router.http.get("/report")
+        @in_processpool
+        def report(year: Annotated[int, Query()]): ...
+    """
+    if (
+        is_coroutine_callable(handler)
+        or is_gen_callable(handler)
+        or is_async_gen_callable(handler)
+    ):
+        raise TypeError("Only sync function can be called in the process pool")
+    setattr(handler, "__processpool__", True)
+    return handler
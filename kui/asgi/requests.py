@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import json
 import typing
 from contextvars import ContextVar
@@ -12,15 +13,34 @@ from baize.asgi import WebSocket as BaiZeWebSocket
 from baize.asgi import WebSocketDisconnect, WebSocketState
 from baize.datastructures import URL, ContentType
 from baize.exceptions import HTTPException
+from baize.typing import Message, Receive, Scope, Send
 from baize.utils import cached_property
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Literal
 
 from .background import BackgroundTasks
 
 if typing.TYPE_CHECKING:
     from .applications import Kui
 
-from ..utils import State, bind_contextvar
+from ..utils import ContextSlotVar, State, bind_contextvar
+
+
+class ConnectionInternals:
+    """
+    Kui's bookkeeping of a connection, kept apart from the user's `state`.
+    The dependency cache and the background tasks are created on first use.
+    """
+
+    __slots__ = ("path_params", "dependency_cache", "background_tasks")
+
+    path_params: typing.Optional[typing.Dict[str, typing.Any]]
+    dependency_cache: typing.Optional[typing.Dict[typing.Any, typing.Any]]
+    background_tasks: typing.Optional[BackgroundTasks]
+
+    def __init__(self) -> None:
+        self.path_params = None
+        self.dependency_cache = None
+        self.background_tasks = None
 
 
 class HTTPConnection(BaiZeHTTPConnection, typing.MutableMapping[str, typing.Any]):
@@ -42,8 +62,23 @@ class HTTPConnection(BaiZeHTTPConnection, typing.MutableMapping[str, typing.Any]
         return self.url.replace(path=self.app.router.url_for(name, path_params))
 
     @cached_property
+    def internals(self) -> ConnectionInternals:
+        return ConnectionInternals()
+
+    @property
+    def path_params(self) -> typing.Dict[str, typing.Any]:
+        """
+        The path parameters parsed by the framework.
+        """
+        path_params = self.internals.path_params
+        return path_params if path_params is not None else self.get("path_params", {})
+
+    @property
     def background_tasks(self) -> BackgroundTasks:
-        return BackgroundTasks()
+        internals = self.internals
+        if internals.background_tasks is None:
+            internals.background_tasks = BackgroundTasks()
+        return internals.background_tasks
 
 
 class HttpRequest(BaiZeRequest, HTTPConnection):
@@ -68,22 +103,113 @@ class HttpRequest(BaiZeRequest, HTTPConnection):
 
 
 class WebSocket(BaiZeWebSocket, HTTPConnection):
+    # Max number of client messages buffered by the receive pump, it stops
+    # receiving while the buffer is full. 0 means unbounded.
+    receive_queue_size: int = 64
+
+    def __init__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        super().__init__(scope, receive, send)
+        self._disconnected = asyncio.Event()
+        self._receive_pump: typing.Optional[asyncio.Task[None]] = None
+        self._client_send = self._send
+        self._send = self._send_to_client
+        self.send_queue: typing.Optional[SendQueue] = None
+        self._close_callbacks: typing.List[typing.Callable[[], None]] = []
+
+    def add_close_callback(self, callback: typing.Callable[[], None]) -> None:
+        """
+        Call `callback` when the websocket handler returns.
+        """
+        self._close_callbacks.append(callback)
+
+    def start_send_queue(
+        self,
+        max_size: int = 64,
+        *,
+        high_watermark: typing.Optional[int] = None,
+        low_watermark: typing.Optional[int] = None,
+        overflow: Literal["block", "drop_oldest", "close"] = "block",
+        close_timeout: typing.Optional[float] = 5.0,
+    ) -> SendQueue:
+        """
+        Send the messages through a bounded queue and a writer task, see `SendQueue`.
+        """
+        if self.send_queue is None:
+            self.send_queue = SendQueue(
+                self._send,
+                max_size,
+                high_watermark=high_watermark,
+                low_watermark=low_watermark,
+                overflow=overflow,
+                close_timeout=close_timeout,
+            )
+            self._send = self.send_queue.put
+        return self.send_queue
+
     async def is_disconnected(self) -> bool:
         """
         The method used to determine whether the connection is interrupted.
 
-        NOTE: The call may discard the information sent by the client.
+        The first call starts a task that receives the client's messages into
+        a queue, so `receive` still gets every message. While the queue is
+        full, the disconnect is only seen when sending to the client fails.
         """
-        if not hasattr(self, "_is_disconnected"):
-            self._is_disconnected = False
+        if self._receive_pump is None:
+            self._start_receive_pump()
+        return self._disconnected.is_set()
 
-        if not self._is_disconnected:
-            try:
-                message = await asyncio.wait_for(self._receive(), timeout=0.0000001)
-                self._is_disconnected = message.get("type") == "websocket.disconnect"
-            except asyncio.TimeoutError:
-                pass
-        return self._is_disconnected
+    async def wait_disconnected(self) -> None:
+        """
+        Wait until the client disconnects.
+        """
+        if self._receive_pump is None:
+            self._start_receive_pump()
+        await self._disconnected.wait()
+
+    def _start_receive_pump(self) -> None:
+        receive = self._receive
+        queue: asyncio.Queue[Message] = asyncio.Queue(self.receive_queue_size)
+
+        async def pump() -> None:
+            while True:
+                try:
+                    message = await receive()
+                except Exception:
+                    message = {"type": "websocket.disconnect", "code": 1006}
+                disconnected = message["type"] == "websocket.disconnect"
+                if disconnected:
+                    self._disconnected.set()
+                # Backpressure, stop receiving until `receive` makes room
+                await queue.put(message)
+                if disconnected:
+                    return
+
+        self._receive = queue.get
+        self._receive_pump = asyncio.ensure_future(pump())
+
+    async def _send_to_client(self, message: Message) -> None:
+        try:
+            await self._client_send(message)
+        except OSError:
+            # ASGI servers raise it when the connection is closed, the
+            # disconnect message may be behind the buffered client messages
+            self._disconnected.set()
+            raise
+
+    def _run_close_callbacks(self) -> None:
+        callbacks, self._close_callbacks = self._close_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def _stop_send_queue(self) -> None:
+        if self.send_queue is not None:
+            await self.send_queue.aclose()
+
+    async def _stop_receive_pump(self) -> None:
+        if self._receive_pump is not None and not self._receive_pump.done():
+            self._receive_pump.cancel()
+            # Unlike awaiting the task, a cancellation of the caller is raised
+            await asyncio.wait([self._receive_pump])
 
     async def receive_json(self, mode: str = "text") -> typing.Any:
         assert mode in ("text", "binary")
@@ -105,6 +231,49 @@ class WebSocket(BaiZeWebSocket, HTTPConnection):
         else:
             await self.send({"type": "websocket.send", "bytes": text.encode("utf-8")})
 
+    async def send_json_many(
+        self,
+        items: typing.Iterable[typing.Any],
+        mode: str = "text",
+        format: Literal["array", "ndjson"] = "array",
+    ) -> None:
+        """
+        Send several JSON values in one frame, as a JSON array or as
+        newline-delimited JSON.
+        """
+        assert mode in ("text", "binary")
+        if format == "array":
+            text = json.dumps(list(items))
+        elif format == "ndjson":
+            text = "\n".join(map(json.dumps, items))
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+        if mode == "text":
+            await self.send({"type": "websocket.send", "text": text})
+        else:
+            await self.send({"type": "websocket.send", "bytes": text.encode("utf-8")})
+
+    async def receive_json_many(
+        self,
+        mode: str = "text",
+        format: Literal["array", "ndjson"] = "array",
+    ) -> typing.List[typing.Any]:
+        """
+        Receive a frame sent by `send_json_many`.
+        """
+        if format == "array":
+            return await self.receive_json(mode)
+        assert mode in ("text", "binary")
+        assert self.application_state == WebSocketState.CONNECTED
+        message = await self.receive()
+        self._raise_on_disconnect(message)
+
+        if mode == "text":
+            text = message["text"]
+        else:
+            text = message["bytes"].decode("utf-8")
+        return [json.loads(line) for line in text.split("\n") if line]
+
     async def iter_json(self) -> typing.AsyncIterator[typing.Any]:
         try:
             while True:
@@ -113,14 +282,183 @@ class WebSocket(BaiZeWebSocket, HTTPConnection):
             pass
 
 
-http_connection_var: ContextVar[HTTPConnection] = ContextVar("http_connection")
+class SendQueue:
+    """
+    Bounded outbound queue of a websocket, a writer task sends the queued
+    messages to the client.
+
+    When the queue reaches `high_watermark` (`max_size` by default, and never
+    above it), it is not `writable` until it falls to `low_watermark` (half of
+    `high_watermark` by default). What happens when a message is sent to a
+    full queue depends on `overflow`:
+
+    - block: wait until the queue is writable again
+    - drop_oldest: drop the oldest queued message
+    - close: discard the queued messages and close the connection with 1013
+
+    `aclose` waits at most `close_timeout` seconds for the queued messages to
+    be sent, then drops the rest and cancels the writer task.
+    """
+
+    def __init__(
+        self,
+        send: Send,
+        max_size: int = 64,
+        *,
+        high_watermark: typing.Optional[int] = None,
+        low_watermark: typing.Optional[int] = None,
+        overflow: Literal["block", "drop_oldest", "close"] = "block",
+        close_timeout: typing.Optional[float] = 5.0,
+    ) -> None:
+        self.max_size = max_size
+        self.high_watermark = (
+            min(high_watermark, max_size) if high_watermark is not None else max_size
+        )
+        self.low_watermark = (
+            low_watermark if low_watermark is not None else self.high_watermark // 2
+        )
+        self.overflow = overflow
+        self.close_timeout = close_timeout
+        self.queue: typing.Deque[Message] = collections.deque()
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.closed = False
+        self._send = send
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._not_empty = asyncio.Event()
+        self._empty = asyncio.Event()
+        self._empty.set()
+        self._writer = asyncio.ensure_future(self._write())
+
+    @property
+    def depth(self) -> int:
+        return len(self.queue)
+
+    @property
+    def writable(self) -> bool:
+        return self._writable.is_set()
+
+    async def put(self, message: Message) -> None:
+        if self.closed:
+            if message["type"] == "websocket.close":
+                return
+            raise WebSocketDisconnect(1013 if self.dropped else 1006)
+        if message["type"] != "websocket.close":
+            if self.overflow == "block":
+                # Other waiters may have filled the queue again before this
+                # one resumes
+                while not self._writable.is_set():
+                    await self._writable.wait()
+                if self.closed:
+                    raise WebSocketDisconnect(1006)
+            elif len(self.queue) >= self.max_size:
+                if self.overflow == "drop_oldest":
+                    self.queue.popleft()
+                    self.dropped += 1
+                else:
+                    self.dropped += len(self.queue) + 1
+                    self.queue.clear()
+                    self._append({"type": "websocket.close", "code": 1013})
+                    self.closed = True
+                    raise WebSocketDisconnect(1013)
+        self._append(message)
+
+    async def drain(self) -> None:
+        """
+        Wait until all queued messages are sent.
+        """
+        await self._empty.wait()
+
+    async def aclose(self) -> None:
+        """
+        Send the queued messages and stop the writer task.
+        """
+        if not self._writer.done():
+            try:
+                await asyncio.wait_for(self.drain(), self.close_timeout)
+            except asyncio.TimeoutError:
+                # The client stopped reading, give up the queued messages
+                self.closed = True
+                self.dropped += len(self.queue)
+                self.queue.clear()
+                self._empty.set()
+                self._writable.set()
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+
+    def _append(self, message: Message) -> None:
+        self.queue.append(message)
+        self.max_depth = max(self.max_depth, len(self.queue))
+        self._empty.clear()
+        self._not_empty.set()
+        if len(self.queue) >= self.high_watermark:
+            self._writable.clear()
+
+    async def _write(self) -> None:
+        while True:
+            while not self.queue:
+                self._empty.set()
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            message = self.queue.popleft()
+            if len(self.queue) <= self.low_watermark:
+                self._writable.set()
+            try:
+                await self._send(message)
+            except Exception:
+                # The client is gone, wake up the blocked producers
+                self.closed = True
+                self.queue.clear()
+                self._empty.set()
+                self._writable.set()
+                return
+            self.sent += 1
+
+
+class ConnectionContext:
+    """
+    The current connection, set by one `connection_context_var.set` for each
+    request or websocket.
+    """
+
+    __slots__ = ("http_connection", "request", "websocket")
+
+    http_connection: HTTPConnection
+    request: HttpRequest
+    websocket: WebSocket
+
+    def __init__(
+        self,
+        request: typing.Optional[HttpRequest] = None,
+        websocket: typing.Optional[WebSocket] = None,
+    ) -> None:
+        if request is not None:
+            self.http_connection = self.request = request
+        if websocket is not None:
+            self.http_connection = self.websocket = websocket
+
+
+connection_context_var: ContextVar[ConnectionContext] = ContextVar("connection_context")
+
+http_connection_var: ContextSlotVar[HTTPConnection] = ContextSlotVar(
+    connection_context_var, "http_connection", ConnectionContext
+)
 
 http_connection = bind_contextvar(http_connection_var)
 
-request_var: ContextVar[HttpRequest] = ContextVar("request")
+request_var: ContextSlotVar[HttpRequest] = ContextSlotVar(
+    connection_context_var, "request", ConnectionContext
+)
 
 request = bind_contextvar(request_var)
 
-websocket_var: ContextVar[WebSocket] = ContextVar("websocket")
+websocket_var: ContextSlotVar[WebSocket] = ContextSlotVar(
+    connection_context_var, "websocket", ConnectionContext
+)
 
 websocket = bind_contextvar(websocket_var)
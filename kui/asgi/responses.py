@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import collections
 import json
+import os
+import stat
 import typing
+import weakref
 
 from baize import asgi as baize_asgi
-from baize.typing import ServerSentEvent
+from baize.asgi.helper import send_http_body, send_http_start
+from baize.asgi.responses import Sendfile
+from baize.concurrency import run_in_threadpool
+from baize.responses import build_bytes_from_sse
+from baize.typing import Receive, Scope, Send, ServerSentEvent
 
+from ..etag import etag_matches, not_modified_headers, quote_etag
 from ..responses import (
+    EventReplayBuffer,
     FileResponseMixin,
     HTMLResponseMixin,
     JSONResponseMixin,
@@ -34,15 +45,153 @@ __all__ = [
 HttpResponse = baize_asgi.Response
 
 
-class JSONResponse(JSONResponseMixin, baize_asgi.JSONResponse):
+def get_if_none_match(scope: Scope) -> str:
+    if scope["method"] not in ("GET", "HEAD"):
+        return ""
+    for key, value in scope["headers"]:
+        if key == b"if-none-match":
+            return value.decode("latin-1")
+    return ""
+
+
+async def send_not_modified(send: Send, response: HttpResponse) -> None:
+    headers = not_modified_headers(response.list_headers(as_bytes=True))
+    await send_http_start(send, 304, headers)
+    await send_http_body(send)
+
+
+class ConditionalResponseMixin(HttpResponse):
+    """
+    If the ETag matches `If-None-Match`, respond 304 without rendering the body.
+
+    Use `etag` to supply a precomputed version tag.
+    """
+
+    def __init__(
+        self, *args: typing.Any, etag: typing.Optional[str] = None, **kwargs: typing.Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        if etag is not None:
+            self.headers["etag"] = quote_etag(etag)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        etag = self.headers.get("etag")
+        if etag is not None and etag_matches(get_if_none_match(scope), etag):
+            return await send_not_modified(send, self)
+        return await super().__call__(scope, receive, send)
+
+
+class BufferResponseMixin(HttpResponse):
+    """
+    Send `bytearray`, `memoryview` and `mmap` content without copying it into
+    `bytes`, large buffers are sent in chunks.
+    """
+
+    content: typing.Any
+    media_type: str
+    charset: str
+    chunk_size: int = 4096 * 64
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if isinstance(self.content, (str, bytes)):
+            return await super().__call__(scope, receive, send)
+
+        with memoryview(self.content) as view, view.cast("B") as body:
+            body_length = len(body)
+            if "content-length" not in self.headers:
+                self.headers["content-length"] = str(body_length)
+            content_type = self.media_type
+            if content_type and "content-type" not in self.headers:
+                if content_type.startswith("text/"):
+                    content_type += "; charset=" + self.charset
+                self.headers["content-type"] = content_type
+            await send_http_start(
+                send, self.status_code, self.list_headers(as_bytes=True)
+            )
+            for offset in range(0, body_length, self.chunk_size):
+                end = offset + self.chunk_size
+                # ASGI servers write any bytes-like object to the transport
+                await send_http_body(
+                    send,
+                    body[offset:end],  # type: ignore[arg-type]
+                    more_body=end < body_length,
+                )
+            if body_length == 0:
+                await send_http_body(send)
+
+
+class JSONResponse(
+    JSONResponseMixin, ConditionalResponseMixin, baize_asgi.JSONResponse
+):
     async def render(self, content: typing.Any) -> bytes:
         if not self.json_kwargs.get("default"):
             self.json_kwargs["default"] = request.app.json_encoder
         return json.dumps(content, **self.json_kwargs).encode(self.charset)
 
 
+class SendfileResponseMixin(baize_asgi.FileResponse):
+    """
+    Let the server send the file by `http.response.pathsend` or
+    `http.response.zerocopysend` when it supports them, otherwise read each
+    chunk by `os.pread` in the thread pool, without seeking first.
+    """
+
+    async def handle_all(
+        self, send_header_only: bool, file_size: int, scope: Scope, send: Send
+    ) -> None:
+        if send_header_only or "http.response.pathsend" not in scope.get(
+            "extensions", {}
+        ):
+            return await super().handle_all(send_header_only, file_size, scope, send)
+
+        # https://asgi.readthedocs.io/en/latest/extensions.html#path-send
+        self.headers["content-type"] = str(self.content_type)
+        self.headers["content-length"] = str(file_size)
+        await send_http_start(send, 200, self.list_headers(as_bytes=True))
+        await send(
+            {"type": "http.response.pathsend", "path": os.path.abspath(self.filepath)}
+        )
+
+    def create_send_or_zerocopy(self, scope: Scope, send: Send) -> Sendfile:
+        if (
+            "http.response.zerocopysend" in scope.get("extensions", {})
+            or not stat.S_ISREG(self.stat_result.st_mode)
+            or not hasattr(os, "pread")
+        ):
+            return super().create_send_or_zerocopy(scope, send)
+
+        async def pread_sendfile(
+            file_descriptor: int,
+            offset: typing.Optional[int] = None,
+            count: typing.Optional[int] = None,
+            more_body: bool = False,
+        ) -> None:
+            here = offset or 0
+            end = os.fstat(file_descriptor).st_size if count is None else here + count
+            if hasattr(os, "posix_fadvise") and here < end:  # pragma: no branch
+                os.posix_fadvise(
+                    file_descriptor, here, end - here, os.POSIX_FADV_SEQUENTIAL
+                )
+            while here < end:
+                # Page cache misses block the thread, not the event loop
+                data = await run_in_threadpool(
+                    os.pread, file_descriptor, min(self.chunk_size, end - here), here
+                )
+                if not data:  # The file is truncated
+                    break
+                here += len(data)
+                if here >= end:
+                    return await send_http_body(send, data, more_body=more_body)
+                await send_http_body(send, data, more_body=True)
+            await send_http_body(send, more_body=more_body)
+
+        return pread_sendfile
+
+
 class FileResponse(
     FileResponseMixin,
+    ConditionalResponseMixin,
+    SendfileResponseMixin,
     baize_asgi.FileResponse,
 ):
     pass
@@ -50,6 +199,8 @@ class FileResponse(
 
 class PlainTextResponse(
     PlainTextResponseMixin,
+    ConditionalResponseMixin,
+    BufferResponseMixin,
     baize_asgi.PlainTextResponse,
 ):
     pass
@@ -57,6 +208,7 @@ class PlainTextResponse(
 
 class HTMLResponse(
     HTMLResponseMixin,
+    ConditionalResponseMixin,
     baize_asgi.HTMLResponse,
 ):
     pass
@@ -69,8 +221,151 @@ class RedirectResponse(
     pass
 
 
+class _PingTimer:
+    """
+    One timer per event loop and interval calls the `tick` of every stream.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.ticks: typing.Set[typing.Callable[[], None]] = set()
+        self.handle: typing.Optional[asyncio.TimerHandle] = None
+
+    def add(self, tick: typing.Callable[[], None]) -> None:
+        self.ticks.add(tick)
+        if self.handle is None:
+            self._schedule()
+
+    def discard(self, tick: typing.Callable[[], None]) -> None:
+        self.ticks.discard(tick)
+        if not self.ticks and self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+    def _schedule(self) -> None:
+        self.handle = asyncio.get_running_loop().call_later(self.interval, self._tick)
+
+    def _tick(self) -> None:
+        for tick in tuple(self.ticks):
+            tick()
+        self._schedule()
+
+
+_ping_timers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, typing.Dict[float, _PingTimer]
+] = weakref.WeakKeyDictionary()
+
+
+def get_ping_timer(interval: float) -> _PingTimer:
+    timers = _ping_timers.setdefault(asyncio.get_running_loop(), {})
+    if interval not in timers:
+        timers[interval] = _PingTimer(interval)
+    return timers[interval]
+
+
+class EventStreamResponseMixin(baize_asgi.SendEventResponse):
+    """
+    Ping all idle streams by a shared timer instead of a timer per event, and
+    write the events produced within `batch_window` seconds at once.
+
+    If `replay` is given, the events after the client's `Last-Event-ID` are
+    sent before the others.
+    """
+
+    # Max number of events waiting to be written, the generator waits when full
+    max_pending: int = 64
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        batch_window: float = 0,
+        replay: typing.Optional[EventReplayBuffer] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.batch_window = batch_window
+        self.replay = replay
+        self.last_event_id: typing.Optional[str] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        for key, value in scope["headers"]:
+            if key == b"last-event-id":
+                self.last_event_id = value.decode("latin-1")
+        return await super().__call__(scope, receive, send)
+
+    def encode_events(self, events: typing.Iterable[typing.Any]) -> bytes:
+        # `build_bytes_from_sse` pops `data`, the events may be shared by streams
+        return b"".join(
+            build_bytes_from_sse(
+                typing.cast(ServerSentEvent, dict(event)), self.charset
+            )
+            for event in events
+        )
+
+    async def render_stream(self) -> typing.AsyncGenerator[bytes, None]:
+        pending: typing.Deque[ServerSentEvent] = collections.deque()
+        wake = asyncio.Event()
+        writable = asyncio.Event()
+        writable.set()
+        ping_due = written = done = False
+
+        def tick() -> None:
+            nonlocal ping_due, written
+            if written:
+                written = False
+            else:
+                ping_due = True
+                wake.set()
+
+        async def push() -> None:
+            nonlocal done
+            try:
+                async for event in self.iterable:
+                    pending.append(event)
+                    wake.set()
+                    if len(pending) >= self.max_pending:
+                        writable.clear()
+                        await writable.wait()
+            finally:
+                done = True
+                wake.set()
+                g = self.iterable
+                if hasattr(g, "aclose"):
+                    await g.aclose()
+
+        if self.replay is not None:
+            replayed = self.replay.since(self.last_event_id)
+            if replayed:
+                yield self.encode_events(replayed)
+
+        timer = get_ping_timer(self.ping_interval)
+        timer.add(tick)
+        push_future = asyncio.ensure_future(push())
+        try:
+            while not (done and not pending):
+                await wake.wait()
+                wake.clear()
+                if pending and self.batch_window > 0 and not done:
+                    await asyncio.sleep(self.batch_window)
+                if pending:
+                    events = [pending.popleft() for _ in range(len(pending))]
+                    writable.set()
+                    ping_due, written = False, True
+                    yield self.encode_events(events)
+                elif ping_due:
+                    ping_due = False
+                    yield b": ping\n\n"
+        finally:
+            timer.discard(tick)
+            if not push_future.cancel():
+                exc = push_future.exception()
+                if exc is not None:
+                    raise exc
+
+
 class SendEventResponse(
     SendEventResponseMixin,
+    EventStreamResponseMixin,
     baize_asgi.SendEventResponse,
 ):
     pass
@@ -90,6 +385,8 @@ def TemplateResponse(
     headers: typing.Optional[typing.Mapping[str, str]] = None,
     media_type: typing.Optional[str] = None,
     charset: typing.Optional[str] = None,
+    *,
+    etag: typing.Optional[str] = None,
 ) -> HttpResponse:
     templates = request.app.templates
     if templates is None:
@@ -97,9 +394,12 @@ def TemplateResponse(
             "You must assign a value to `app.templates` to use TemplateResponse"
         )
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         name, context, status_code, headers, media_type, charset
     )
+    if etag is not None:
+        response.headers["etag"] = quote_etag(etag)
+    return response
 
 
 def convert_response(response: typing.Any) -> HttpResponse:
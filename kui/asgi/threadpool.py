@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+if sys.version_info >= (3, 10):  # pragma: no cover
+    from typing import ParamSpec
+else:  # pragma: no cover
+    from typing_extensions import ParamSpec
+
+P = ParamSpec("P")
+R = TypeVar("R")
+CallableObject = TypeVar("CallableObject", bound=Callable)
+
+__all__ = ["ThreadPool", "in_threadpool"]
+
+
+class ThreadPool:
+    """
+    App-wide thread pool that runs sync handlers and sync dependencies
+    outside the event loop.
+
+    The executor is created on first use and shut down by the lifespan. If
+    `offload_sync` is true, every sync handler and dependency is offloaded,
+    otherwise only those marked by `in_threadpool` or `Depends(threadpool=True)`.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, *, offload_sync: bool = False
+    ) -> None:
+        self.max_workers = max_workers
+        self.offload_sync = offload_sync
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="kui"
+            )
+        return self.executor
+
+    async def run(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """
+        Call `func` in the thread pool with a copy of the current context, so
+        `request` and `http_connection` can be used in the thread.
+        """
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self.get_executor(),
+            functools.partial(context.run, func, *args, **kwargs),  # type: ignore
+        )
+
+    def shutdown(self) -> None:
+        """
+        Wait for the running calls to finish and release the threads.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+def in_threadpool(handler: CallableObject) -> CallableObject:
+    """
+    Mark a sync handler to be called in the app's thread pool.
+
+    Example:
+
+        @app.router.http.get("/report")
+        @in_threadpool
+        def report(year: Annotated[int, Query()]): ...
+    """
+    setattr(handler, "__threadpool__", True)
+    return handler
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import io
 import json
 from inspect import isfunction
-from typing import TYPE_CHECKING, Any, Callable, Generator, List
+from typing import TYPE_CHECKING, Any, Callable, Generator, List, Optional
 from typing import cast as typing_cast
 
 from baize.typing import Message
@@ -12,6 +13,16 @@ from ..routing import AsyncViewType
 from .requests import request, websocket
 from .responses import HttpResponse
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
 
 def required_method(method: str) -> Callable[[AsyncViewType], AsyncViewType]:
     """
@@ -74,13 +85,26 @@ class HttpView:
         return HttpResponse(headers={"Allow": ", ".join(cls.__methods__)})
 
 
+def _require_codec(module: Any, name: str) -> Any:
+    if module is None:  # pragma: no cover
+        raise RuntimeError(f"Install {name!r} to use it as SocketView.encoding")
+    return module
+
+
 class SocketView:
-    encoding: Literal["anystr", "text", "bytes", "json"] = "anystr"
+    encoding: Literal["anystr", "text", "bytes", "json", "msgpack", "cbor"] = "anystr"
+    # Send through a bounded queue when set, see `WebSocket.start_send_queue`
+    send_queue_size: Optional[int] = None
+    send_overflow: Literal["block", "drop_oldest", "close"] = "block"
 
     def __await__(self):
         return self.__impl__().__await__()
 
     async def __impl__(self) -> None:
+        if self.send_queue_size is not None:
+            websocket.start_send_queue(
+                self.send_queue_size, overflow=self.send_overflow
+            )
         close_code = 1000
         try:
             await self.on_connect()
@@ -125,8 +149,57 @@ class SocketView:
                 await websocket.close(code=1003)
                 raise RuntimeError("Malformed JSON data received.")
 
+        if self.encoding in ("msgpack", "cbor"):
+            if message.get("bytes") is None:
+                await websocket.close(code=1003)
+                raise RuntimeError("Expected bytes websocket messages, but got text")
+            if self.encoding == "msgpack":
+                loads = _require_codec(msgpack, "msgpack").unpackb
+            else:
+                if getattr(self, "_cbor_decoder", None) is None:
+                    # Reuse the decoder across messages, only its input changes
+                    self._cbor_decoder = _require_codec(cbor2, "cbor2").CBORDecoder(
+                        io.BytesIO()
+                    )
+                loads = self._cbor_loads
+            try:
+                return loads(message["bytes"])
+            except Exception:
+                await websocket.close(code=1003)
+                raise RuntimeError(f"Malformed {self.encoding} data received.")
+
         return message["text"] if message.get("text") else message["bytes"]
 
+    def _cbor_loads(self, data: bytes) -> Any:
+        self._cbor_decoder.fp = io.BytesIO(data)
+        return self._cbor_decoder.decode()
+
+    async def send(self, data: Any) -> None:
+        """
+        Send data encoded by `encoding`.
+        """
+        if self.encoding == "json":
+            return await websocket.send_json(data)
+        if self.encoding == "msgpack":
+            if getattr(self, "_packer", None) is None:
+                # Reuse the packer and its buffer across messages
+                self._packer = _require_codec(msgpack, "msgpack").Packer()
+            return await websocket.send_bytes(self._packer.pack(data))
+        if self.encoding == "cbor":
+            if getattr(self, "_cbor_encoder", None) is None:
+                # Reuse the encoder and its buffer across messages
+                self._cbor_buffer = io.BytesIO()
+                self._cbor_encoder = _require_codec(cbor2, "cbor2").CBOREncoder(
+                    self._cbor_buffer
+                )
+            self._cbor_buffer.seek(0)
+            self._cbor_buffer.truncate()
+            self._cbor_encoder.encode(data)
+            return await websocket.send_bytes(self._cbor_buffer.getvalue())
+        if isinstance(data, str):
+            return await websocket.send_text(data)
+        return await websocket.send_bytes(data)
+
     async def on_connect(self) -> None:
         """Override to handle an incoming websocket connection"""
         await websocket.accept()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from typing_extensions import Protocol
+
+__all__ = [
+    "CacheEntry",
+    "CacheBackend",
+    "MemoryCache",
+    "create_cache_key",
+    "is_cacheable",
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """
+    A fully rendered response.
+    """
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the entry if it exists and has not expired.
+        """
+
+    def set(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        """
+        Store the entry for `ttl` seconds.
+        """
+
+
+class MemoryCache:
+    """
+    In-process cache with TTL and LRU eviction.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self._data: OrderedDict[str, Tuple[float, CacheEntry]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, entry)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def create_cache_key(
+    method: str,
+    path: str,
+    query_params: Sequence[Tuple[str, str]],
+    selected_query_params: Optional[Iterable[str]],
+    headers: Mapping[str, str],
+    vary: Iterable[str],
+) -> str:
+    """
+    Build the cache key from method, path, query parameters and `Vary` headers.
+
+    If `selected_query_params` is None, all query parameters are used.
+    """
+    if selected_query_params is not None:
+        selected = set(selected_query_params)
+        query_params = [(k, v) for k, v in query_params if k in selected]
+    parts = [method, path, repr(sorted(query_params))]
+    parts.extend(f"{name}={headers.get(name, '')}" for name in vary)
+    return "\n".join(parts)
+
+
+def is_cacheable(status_code: int, headers: Sequence[Tuple[str, str]]) -> bool:
+    """
+    Only successful responses without cookies and private data are stored.
+    """
+    if status_code != 200:
+        return False
+    for key, value in headers:
+        key = key.lower()
+        if key == "set-cookie":
+            return False
+        if key == "cache-control" and any(
+            directive in value.lower() for directive in ("no-store", "private")
+        ):
+            return False
+    return True
+
+
+def replay_headers(
+    entry: CacheEntry, headers: Mapping[str, str]
+) -> List[Tuple[str, str]]:
+    """
+    Return the headers of the cached entry unchanged, repeated headers such as
+    `Link` and `Vary` are kept. The headers modified in `headers` after the
+    response was created from the entry replace the original ones.
+    """
+    original: Dict[str, str] = {}
+    for key, value in entry.headers:
+        key = key.lower()
+        original[key] = f"{original[key]}, {value}" if key in original else value
+
+    result: List[Tuple[str, str]] = []
+    unchanged = set()
+    for key, value in entry.headers:
+        key = key.lower()
+        if headers.get(key) == original[key]:
+            result.append((key, value))
+            unchanged.add(key)
+    result.extend((k, v) for k, v in headers.items() if k not in unchanged)
+    return result
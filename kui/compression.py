@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import functools
+import zlib
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from typing_extensions import Protocol
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+__all__ = [
+    "Compressor",
+    "DEFAULT_ENCODINGS",
+    "DEFAULT_EXCLUDED_CONTENT_TYPES",
+    "create_compressor_factories",
+    "negotiate_encoding",
+    "should_compress",
+    "compressed_headers",
+]
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """
+        Feed data to the compressor, the result may be buffered.
+        """
+
+    def flush(self) -> bytes:
+        """
+        Flush all buffered data, so the client can decode it immediately.
+        """
+
+    def finish(self) -> bytes:
+        """
+        End of stream.
+        """
+
+
+class GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressobj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressobj.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+COMPRESSORS: Dict[str, Tuple[Callable[[int], Compressor], int]] = {
+    "gzip": (GzipCompressor, 6),
+}
+if brotli is not None:  # pragma: no cover
+    COMPRESSORS["br"] = (BrotliCompressor, 4)
+if zstandard is not None:  # pragma: no cover
+    COMPRESSORS["zstd"] = (ZstdCompressor, 3)
+
+DEFAULT_ENCODINGS = ("zstd", "br", "gzip")
+
+DEFAULT_EXCLUDED_CONTENT_TYPES = frozenset(
+    {
+        "image/*",
+        "video/*",
+        "audio/*",
+        "font/woff",
+        "font/woff2",
+        "application/gzip",
+        "application/x-gzip",
+        "application/zip",
+        "application/x-bzip2",
+        "application/x-xz",
+        "application/x-7z-compressed",
+        "application/x-rar-compressed",
+        "application/zstd",
+    }
+)
+
+
+def create_compressor_factories(
+    encodings: Iterable[str], levels: Mapping[str, int]
+) -> Dict[str, Callable[[], Compressor]]:
+    """
+    Create compressor factories for the encodings installed in the environment,
+    in the order of server preference.
+    """
+    factories: Dict[str, Callable[[], Compressor]] = {}
+    for encoding in encodings:
+        if encoding not in COMPRESSORS:
+            continue
+        compressor_class, default_level = COMPRESSORS[encoding]
+        level = levels.get(encoding, default_level)
+        factories[encoding] = functools.partial(compressor_class, level)
+    return factories
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """
+    Choose the encoding with the highest q-value in `Accept-Encoding`,
+    ties are broken by the order of `encodings`.
+    """
+    if not accept_encoding:
+        return None
+
+    qvalues: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        qvalue = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                qvalue = float(params[2:])
+            except ValueError:
+                qvalue = 0.0
+        qvalues[coding] = qvalue
+
+    best_encoding, best_qvalue = None, 0.0
+    for encoding in encodings:
+        qvalue = qvalues.get(encoding, qvalues.get("*", 0.0))
+        if qvalue > best_qvalue:
+            best_encoding, best_qvalue = encoding, qvalue
+    return best_encoding
+
+
+def _is_excluded_content_type(content_type: str, excluded: AbstractSet[str]) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    if not media_type:
+        return True
+    wildcard = media_type.partition("/")[0] + "/*"
+    return media_type in excluded or wildcard in excluded
+
+
+def should_compress(
+    status_code: int,
+    headers: Sequence[Tuple[str, str]],
+    excluded_content_types: AbstractSet[str],
+) -> bool:
+    """
+    Judge whether the response can be compressed by its status code and headers.
+    """
+    if status_code < 200 or status_code in (204, 206, 304):
+        return False
+
+    content_type = ""
+    for key, value in headers:
+        key = key.lower()
+        if key in ("content-encoding", "content-range"):
+            return False
+        elif key == "cache-control" and "no-transform" in value.lower():
+            return False
+        elif key == "content-type":
+            content_type = value
+    return not _is_excluded_content_type(content_type, excluded_content_types)
+
+
+def compressed_headers(
+    headers: Sequence[Tuple[str, str]],
+    encoding: str,
+    content_length: Optional[int] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Rewrite the headers for the compressed body.
+
+    A strong ETag is weakened, because the compressed body is no longer
+    byte-for-byte identical to the original representation.
+    """
+    result: List[Tuple[str, str]] = []
+    vary = ""
+    for key, value in headers:
+        lower_key = key.lower()
+        if lower_key == "content-length":
+            continue
+        elif lower_key == "vary":
+            vary = value
+            continue
+        elif lower_key == "etag" and not value.startswith("W/"):
+            value = "W/" + value
+        result.append((key, value))
+
+    if not vary:
+        vary = "Accept-Encoding"
+    elif vary.strip() != "*" and "accept-encoding" not in vary.lower():
+        vary += ", Accept-Encoding"
+    result.append(("vary", vary))
+    result.append(("content-encoding", encoding))
+    if content_length is not None:
+        result.append(("content-length", str(content_length)))
+    return result
@@ -1,12 +1,122 @@
-from typing import Iterable, Pattern
+from __future__ import annotations
+
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple, Union
 
 from typing_extensions import TypedDict
 
 
 class CORSConfig(TypedDict, total=False):
-    allow_origins: Iterable[Pattern]
+    allow_origins: Iterable[Union[Pattern, str]]
     allow_methods: Iterable[str]
     allow_headers: Iterable[str]
     expose_headers: Iterable[str]
     allow_credentials: bool
     max_age: int
+
+
+DEFAULT_ALLOW_METHODS = (
+    "GET",
+    "POST",
+    "PUT",
+    "PATCH",
+    "DELETE",
+    "HEAD",
+    "OPTIONS",
+    "TRACE",
+)
+
+_NUMBERED_BACKREFERENCE = re.compile(r"\\(?:[1-9]|g<\d)")
+
+
+class CORSPolicy:
+    """
+    Precomputed decision and headers of Cross-Origin Resource Sharing.
+
+    `str` in `allow_origins` is matched exactly by a set, all patterns are
+    compiled into one regular expression, and the decisions of the latest
+    `memo_size` origins are memoized.
+
+    Joining the patterns renumbers their groups, so the patterns are matched
+    one by one when any of them uses a numbered backreference such as `\\1`.
+    """
+
+    def __init__(
+        self,
+        allow_origins: Iterable[Union[Pattern, str]] = (re.compile(".*"),),
+        allow_methods: Iterable[str] = DEFAULT_ALLOW_METHODS,
+        allow_headers: Iterable[str] = (),
+        expose_headers: Iterable[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+        *,
+        memo_size: int = 1024,
+    ) -> None:
+        self.exact_origins: Set[str] = set()
+        patterns: List[Pattern] = []
+        for origin in allow_origins:
+            if isinstance(origin, str):
+                self.exact_origins.add(origin)
+            else:
+                patterns.append(origin)
+
+        self.allow_all = any(pattern.pattern in (".*", ".+") for pattern in patterns)
+        self.origin_pattern: Optional[Pattern] = None
+        if (
+            patterns
+            and all(pattern.flags == patterns[0].flags for pattern in patterns)
+            and not any(
+                _NUMBERED_BACKREFERENCE.search(pattern.pattern) for pattern in patterns
+            )
+        ):
+            try:
+                self.origin_pattern = re.compile(
+                    "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+                    patterns[0].flags,
+                )
+            except re.error:  # e.g. inline flags or duplicate group names
+                pass
+        self._patterns = patterns
+        self.memo_size = memo_size
+        self._memo: Dict[str, bool] = {}
+        self._memo_lock = threading.Lock()
+
+        headers: Dict[str, str] = {
+            "Access-Control-Allow-Methods": ", ".join(allow_methods),
+            "Access-Control-Allow-Headers": ", ".join(
+                {"Accept", "Accept-Language", "Content-Language", "Content-Type"}
+                | set(allow_headers)
+            ),
+            "Access-Control-Expose-Headers": ", ".join(expose_headers),
+            "Access-Control-Allow-Credentials": "true"
+            if allow_credentials
+            else "false",
+            "Access-Control-Max-Age": str(max_age),
+        }
+        self.headers: Dict[str, str] = {k: v for k, v in headers.items() if v}
+        # Pre-encoded for WSGI (str) and ASGI (bytes) preflight responses
+        self.header_list: List[Tuple[str, str]] = [
+            (k.lower(), v) for k, v in self.headers.items()
+        ]
+        self.raw_headers: List[Tuple[bytes, bytes]] = [
+            (k.encode("latin-1"), v.encode("latin-1")) for k, v in self.header_list
+        ]
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all or origin in self.exact_origins:
+            return True
+        if not self._patterns:
+            return False
+        allowed = self._memo.get(origin)
+        if allowed is None:
+            if self.origin_pattern is not None:
+                allowed = self.origin_pattern.fullmatch(origin) is not None
+            else:
+                allowed = any(pattern.fullmatch(origin) for pattern in self._patterns)
+            # Handlers in a thread pool may evict at the same time
+            with self._memo_lock:
+                if len(self._memo) >= self.memo_size:
+                    self._memo.pop(next(iter(self._memo)), None)
+                self._memo[origin] = allowed
+        return allowed
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable, List, Tuple, TypeVar
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
+__all__ = [
+    "create_etag",
+    "quote_etag",
+    "etag_matches",
+    "not_modified_headers",
+]
+
+if xxhash is not None:  # pragma: no cover
+
+    def _hexdigest(body: bytes) -> str:
+        return xxhash.xxh3_128_hexdigest(body)
+
+else:
+
+    def _hexdigest(body: bytes) -> str:
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def create_etag(body: bytes) -> str:
+    """
+    Create a strong ETag from the rendered body.
+    """
+    return f'"{_hexdigest(body)}"'
+
+
+def quote_etag(version: str, weak: bool = False) -> str:
+    """
+    Create an ETag from the version tag supplied by handler.
+    """
+    if not (version.startswith('"') or version.startswith('W/"')):
+        version = f'"{version}"'
+    if weak and not version.startswith("W/"):
+        version = "W/" + version
+    return version
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of `If-None-Match` and ETag.
+
+    https://www.rfc-editor.org/rfc/rfc9110#section-13.1.2
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+_HeaderType = TypeVar("_HeaderType", str, bytes)
+
+# https://www.rfc-editor.org/rfc/rfc9110#section-15.4.5
+_NOT_MODIFIED_HEADERS = frozenset(
+    {"cache-control", "content-location", "date", "etag", "expires", "vary"}
+)
+
+
+def not_modified_headers(
+    headers: Iterable[Tuple[_HeaderType, _HeaderType]],
+) -> List[Tuple[_HeaderType, _HeaderType]]:
+    """
+    Filter the headers that should be sent in 304 response.
+    """
+    return [
+        (key, value)
+        for key, value in headers
+        if (key.decode("latin-1") if isinstance(key, bytes) else key).lower()
+        in _NOT_MODIFIED_HEADERS
+    ]
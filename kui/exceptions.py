@@ -1,8 +1,23 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Callable, Dict, Generic, List, Mapping, Type, TypeVar, Union
+import copy
+import itertools
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from baize.datastructures import MutableHeaders
 from baize.exceptions import HTTPException
 from pydantic import ValidationError
 from typing_extensions import Literal
@@ -49,10 +64,14 @@ class RequestValidationError(Exception):
                         "description": "error message",
                         "type": "string",
                     },
+                    "input": {
+                        "title": "Input",
+                        "description": "input value, may be truncated",
+                    },
                     "ctx": {
                         "title": "Context",
                         "description": "error context",
-                        "type": "string",
+                        "type": "object",
                     },
                     "in": {
                         "title": "In",
@@ -65,6 +84,85 @@ class RequestValidationError(Exception):
         }
 
 
+class ValidationErrorRenderer:
+    """
+    Render RequestValidationError to compact JSON bytes.
+
+    At most `max_errors` errors are rendered. `str` and `bytes` inputs longer
+    than `max_input_length` are cut, and so are `list`, `tuple` and `dict`
+    inputs with more items.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_errors: Optional[int] = 32,
+        max_input_length: Optional[int] = None,
+        include_input: bool = True,
+        include_url: bool = False,
+    ) -> None:
+        self.max_errors = max_errors
+        self.max_input_length = max_input_length
+        self.include_input = include_input
+        self.include_url = include_url
+
+    def render(
+        self, exc: RequestValidationError, json_encoder: Callable[[Any], Any]
+    ) -> bytes:
+        errors = exc.validation_error.errors(
+            include_url=self.include_url, include_input=self.include_input
+        )
+        if self.max_errors is not None:
+            errors = errors[: self.max_errors]
+        for error in errors:
+            error["in"] = exc.in_  # type: ignore
+            if "ctx" in error:
+                error["ctx"] = {
+                    key: str(value) if isinstance(value, BaseException) else value
+                    for key, value in error["ctx"].items()
+                }
+            if self.max_input_length is not None and "input" in error:
+                error["input"] = self._truncate(error["input"], self.max_input_length)
+
+        def default(obj: Any) -> Any:
+            try:
+                return json_encoder(obj)
+            except Exception:  # e.g. an uploaded file in `input`
+                return str(obj)
+
+        return json.dumps(
+            errors, ensure_ascii=False, separators=(",", ":"), default=default
+        ).encode("utf-8")
+
+    @classmethod
+    def _truncate(cls, value: Any, length: int) -> Any:
+        if isinstance(value, (str, bytes)):
+            return value[:length]
+        if isinstance(value, (list, tuple)):
+            return [cls._truncate(item, length) for item in value[:length]]
+        if isinstance(value, dict):
+            return {
+                key: cls._truncate(item, length)
+                for key, item in itertools.islice(value.items(), length)
+            }
+        return value
+
+    def schema(self) -> Dict[str, Any]:
+        schema = RequestValidationError.schema()
+        if self.max_errors is not None:
+            schema["maxItems"] = self.max_errors
+        properties = schema["items"]["properties"]
+        if not self.include_input:
+            del properties["input"]
+        if self.include_url:
+            properties["url"] = {
+                "title": "URL",
+                "description": "documentation of the error type",
+                "type": "string",
+            }
+        return schema
+
+
 ErrorHandlerType = TypeVar("ErrorHandlerType", bound=Callable)
 
 
@@ -72,9 +170,15 @@ class ExceptionMiddlewareBase(Generic[ErrorHandlerType], abc.ABC):
     def __init__(
         self,
         handlers: Mapping[Union[int, Type[BaseException]], ErrorHandlerType] = {},
+        validation_error_renderer: ValidationErrorRenderer = ValidationErrorRenderer(),
     ) -> None:
+        self.validation_error_renderer = validation_error_renderer
         self._status_handlers: Dict[int, ErrorHandlerType] = {}
         self._exception_handlers: Dict[Type[BaseException], ErrorHandlerType] = {}
+        # Resolved handlers by exception type, cleared by `add_exception_handler`
+        self._handler_cache: Dict[Type[BaseException], Optional[ErrorHandlerType]] = {}
+        # Built once when HTTPException(404) is handled by the default handler
+        self._not_found_response: Any = None
         self._init_internal_handlers()
         for key, value in handlers.items():
             self.add_exception_handler(key, value)
@@ -92,6 +196,8 @@ class ExceptionMiddlewareBase(Generic[ErrorHandlerType], abc.ABC):
             self._status_handlers[exc_class_or_status_code] = handler
         else:
             self._exception_handlers[exc_class_or_status_code] = handler
+        self._handler_cache.clear()
+        self._not_found_response = None
 
     def lookup_handler(self, exc: BaseException) -> ErrorHandlerType | None:
         handler = None
@@ -104,7 +210,25 @@ class ExceptionMiddlewareBase(Generic[ErrorHandlerType], abc.ABC):
     def _lookup_exception_handler(
         self, exc_type: Type[BaseException]
     ) -> ErrorHandlerType | None:
+        try:
+            return self._handler_cache[exc_type]
+        except KeyError:
+            pass
+        handler = None
         for cls in exc_type.__mro__:
             if cls in self._exception_handlers:
-                return self._exception_handlers[cls]
-        return None
+                handler = self._exception_handlers[cls]
+                break
+        self._handler_cache[exc_type] = handler
+        return handler
+
+    @staticmethod
+    def _copy_response(response: Any) -> Any:
+        """
+        Copy the prebuilt response, the headers and cookies will be modified
+        while it is sent.
+        """
+        response = copy.copy(response)
+        response.headers = MutableHeaders(response.headers)
+        response.cookies = []
+        return response
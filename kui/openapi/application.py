@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import copy
+import json
+import os
 import typing
+from hashlib import md5
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from typing_extensions import Literal, TypedDict
 
 if TYPE_CHECKING:
     from ..asgi import HttpRequest as ASGIHttpRequest
     from ..asgi import Kui as ASGIKui
+    from ..routing import Router
     from ..wsgi import HttpRequest as WSGIHttpRequest
     from ..wsgi import Kui as WSGIKui
 
+from ..etag import create_etag
 from ..exceptions import RequestValidationError
-from ..parameters import _get_response_docs
+from ..parameters import _get_response_docs, resolve_docs
 from ..pydantic_compatible import DEFINITIONS_KEY
 from . import specification as spec
 from .extra_docs import merge_openapi_info
@@ -39,6 +54,7 @@ class OpenAPI:
         template_name: Literal["redoc", "swagger", "rapidoc"] = "swagger",
         template: str = "",
         reload: bool = True,
+        prebuilt_docs: str | os.PathLike[str] | None = None,
     ) -> None:
         if template == "":
             template = (
@@ -69,6 +85,16 @@ class OpenAPI:
             for path in tag_info.get("paths", []):
                 self.path2tag.setdefault(path, []).append(tag_name)
 
+        # (router, router.version, document without servers, hash of document)
+        self._docs_cache: Optional[Tuple[Router, int, spec.OpenAPI, str]] = None
+
+        # JSON document exported by `python -m kui.openapi export`
+        self.prebuilt_docs: Optional[bytes] = None
+        self.prebuilt_etag = ""
+        if prebuilt_docs is not None:
+            self.prebuilt_docs = Path(prebuilt_docs).read_bytes()
+            self.prebuilt_etag = create_etag(self.prebuilt_docs)
+
     def _generate_paths(self, application: ASGIKui | WSGIKui) -> spec.Paths:
         return {
             path: openapi_path_item
@@ -116,6 +142,8 @@ class OpenAPI:
     ) -> spec.Operation:
         result: Dict[str, Any] = {}
 
+        resolve_docs(func)
+
         # generate summary and description
         if hasattr(func, "__docs_summary__") and isinstance(func.__docs_summary__, str):
             result["summary"] = func.__docs_summary__
@@ -152,7 +180,16 @@ class OpenAPI:
             )
             if handler is None:
                 raise RuntimeError
-            __docs_responses__.extend(_get_response_docs(handler))
+            validation_error_docs = _get_response_docs(handler)
+            if handler == application.exception_middleware.validation_error:
+                # Document the errors rendered by the configured renderer
+                renderer = application.exception_middleware.validation_error_renderer
+                for response_docs in validation_error_docs:
+                    for media_type in response_docs.get("422", {}).get("content", {}):
+                        response_docs["422"]["content"][media_type]["schema"] = (
+                            renderer.schema()
+                        )
+            __docs_responses__.extend(validation_error_docs)
 
         for response_docs in __docs_responses__:
             for k, v in list(response_docs.items()):
@@ -195,31 +232,10 @@ class OpenAPI:
         )
         return operation
 
-    def create_docs(self, request: ASGIHttpRequest | WSGIHttpRequest) -> spec.OpenAPI:
+    def _generate_docs(self, application: ASGIKui | WSGIKui) -> spec.OpenAPI:
         openapi = copy.deepcopy(self.openapi)
-        openapi["servers"] = [
-            {
-                "url": "/",
-                "description": "Current server",
-            },
-            spec.Server(
-                url="{scheme}://{address}/",
-                description="Custom API Server Host",
-                variables={
-                    "scheme": {
-                        "default": request.url.scheme,
-                        "enum": ["http", "https"],
-                        "description": "http or https",
-                    },
-                    "address": {
-                        "default": request.url.netloc,
-                        "description": "api server's host[:port]",
-                    },
-                },
-            ),
-        ]
         self.security_schemes = {}
-        paths = copy.deepcopy(self._generate_paths(request.app))
+        paths = copy.deepcopy(self._generate_paths(application))
         for path_item in paths.values():
             for operation in filter(lambda x: isinstance(x, dict), path_item.values()):
                 operation = typing.cast(spec.Operation, operation)
@@ -233,6 +249,80 @@ class OpenAPI:
         openapi["paths"] = paths
         return openapi
 
+    def _get_cached_docs(
+        self, application: ASGIKui | WSGIKui
+    ) -> Tuple[spec.OpenAPI, str]:
+        """
+        Generate the document without `servers` and its hash,
+        they are cached until a route is appended to the router.
+        """
+        router = application.router
+        cache = self._docs_cache
+        if cache is not None and cache[0] is router and cache[1] == router.version:
+            return cache[2], cache[3]
+
+        version = router.version
+        openapi = self._generate_docs(application)
+        docs_hash = md5(json.dumps(openapi).encode()).hexdigest()
+        self._docs_cache = (router, version, openapi, docs_hash)
+        return openapi, docs_hash
+
+    def clear_docs_cache(self) -> None:
+        """
+        Regenerate the document on next request, e.g. after `self.openapi` is modified.
+        """
+        self._docs_cache = None
+
+    def docs_hash(self, application: ASGIKui | WSGIKui) -> str:
+        if self.prebuilt_docs is not None:
+            return self.prebuilt_etag.strip('"')
+        return self._get_cached_docs(application)[1]
+
+    def dumps_docs(self, request: ASGIHttpRequest | WSGIHttpRequest) -> str:
+        if self.prebuilt_docs is not None:
+            return self.prebuilt_docs.decode("utf8")
+        return json.dumps(self.create_docs(request))
+
+    def export_docs(self, application: ASGIKui | WSGIKui) -> spec.OpenAPI:
+        """
+        Generate the document without a request, only the current server in `servers`.
+        """
+        openapi, _ = self._get_cached_docs(application)
+        return typing.cast(spec.OpenAPI, {**openapi, "servers": [_CURRENT_SERVER]})
+
+    def create_docs(self, request: ASGIHttpRequest | WSGIHttpRequest) -> spec.OpenAPI:
+        """
+        The returned document shares everything except `servers` with the cache,
+        don't modify it.
+        """
+        openapi, _ = self._get_cached_docs(request.app)
+        return typing.cast(
+            spec.OpenAPI,
+            {
+                **openapi,
+                "servers": [
+                    _CURRENT_SERVER,
+                    spec.Server(
+                        url="{scheme}://{address}/",
+                        description="Custom API Server Host",
+                        variables={
+                            "scheme": {
+                                "default": request.url.scheme,
+                                "enum": ["http", "https"],
+                                "description": "http or https",
+                            },
+                            "address": {
+                                "default": request.url.netloc,
+                                "description": "api server's host[:port]",
+                            },
+                        },
+                    ),
+                ],
+            },
+        )
+
+
+_CURRENT_SERVER = spec.Server(url="/", description="Current server")
 
 _DictType = TypeVar("_DictType", bound=Dict)
 
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import typing
+from pathlib import Path
+
+from typing_extensions import Literal
+
+from ..utils import import_from_string
+from . import specification as spec
+from .application import OpenAPI
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+
+def dump_docs(openapi: spec.OpenAPI, format: Literal["json", "yaml"]) -> bytes:
+    """
+    Dump the document to minified JSON or YAML.
+    """
+    if format == "json":
+        return json.dumps(openapi, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf8"
+        )
+    elif format == "yaml":
+        if yaml is None:  # pragma: no cover
+            raise RuntimeError("Export YAML document requires `pip install pyyaml`")
+        return yaml.safe_dump(
+            openapi, allow_unicode=True, sort_keys=False, width=float("inf")
+        ).encode("utf8")
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+
+def export_docs(
+    application: str,
+    output: str,
+    *,
+    openapi: str = "",
+    format: Literal["json", "yaml"] | None = None,
+) -> None:
+    """
+    Import the application, generate its document and write it to `output`.
+    """
+    sys.path.insert(0, os.getcwd())
+    app: typing.Any = import_from_string(application)
+    openapi_instance: OpenAPI = import_from_string(openapi) if openapi else OpenAPI()
+    if format is None:
+        format = "yaml" if Path(output).suffix in (".yaml", ".yml") else "json"
+    Path(output).write_bytes(dump_docs(openapi_instance.export_docs(app), format))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m kui.openapi")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser(
+        "export", help="Export the OpenAPI document of application"
+    )
+    export_parser.add_argument(
+        "application", type=str, help="Application path like: module:attr"
+    )
+    export_parser.add_argument(
+        "--openapi",
+        type=str,
+        default="",
+        help="OpenAPI instance path like: module:attr, default is `OpenAPI()`",
+    )
+    export_parser.add_argument(
+        "-o", "--output", type=str, default="openapi.json", help="Output file path"
+    )
+    export_parser.add_argument(
+        "--format",
+        choices=["json", "yaml"],
+        default=None,
+        help="Output format, default is inferred from the output file suffix",
+    )
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export_docs(
+            args.application, args.output, openapi=args.openapi, format=args.format
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing
 
+from ..parameters import update_docs
 from ..routing import ViewType
 
 
@@ -9,17 +10,20 @@ def merge_openapi_info(
     operation_info: typing.Dict[str, typing.Any],
     more_info: typing.Dict[str, typing.Any],
 ) -> typing.Dict[str, typing.Any]:
+    """
+    Return the merged copy, `operation_info` may share objects with the schema cache.
+    """
+    result = dict(operation_info)
     for key, value in more_info.items():
-        if key in operation_info:
-            if isinstance(operation_info[key], typing.Sequence):
-                operation_info[key] = _ = list(operation_info[key])
-                _.extend(value)
+        if key in result:
+            if isinstance(result[key], typing.Sequence):
+                result[key] = [*result[key], *value]
                 continue
-            elif isinstance(operation_info[key], dict):
-                operation_info[key] = merge_openapi_info(operation_info[key], value)
+            elif isinstance(result[key], dict):
+                result[key] = merge_openapi_info(result[key], value)
                 continue
-        operation_info[key] = value
-    return operation_info
+        result[key] = value
+    return result
 
 
 def describe_extra_docs(
@@ -32,14 +36,19 @@ def describe_extra_docs(
     """
     if isinstance(handler, type):
         for method in getattr(handler, "__methods__"):
-            handler_method = getattr(handler, method.lower())
-            __extra_docs__ = merge_openapi_info(
-                getattr(handler_method, "__docs_extra__", {}), info
-            )
-            setattr(handler_method, "__docs_extra__", __extra_docs__)
+            _describe_extra_docs(getattr(handler, method.lower()), info)
     else:
+        _describe_extra_docs(handler, info)
+    return typing.cast(ViewType, handler)
+
+
+def _describe_extra_docs(
+    handler: typing.Any, info: typing.Dict[str, typing.Any]
+) -> None:
+    def merge() -> None:
         __extra_docs__ = merge_openapi_info(
             getattr(handler, "__docs_extra__", {}), info
         )
         setattr(handler, "__docs_extra__", __extra_docs__)
-    return typing.cast(ViewType, handler)
+
+    update_docs(handler, merge)
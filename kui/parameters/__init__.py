@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
 import functools
 import inspect
+import threading
+import weakref
 from itertools import groupby
 from typing import (
     TYPE_CHECKING,
@@ -10,6 +13,7 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Hashable,
     List,
     Optional,
     Sequence,
@@ -40,6 +44,7 @@ if TYPE_CHECKING:
 
 from ..exceptions import RequestValidationError
 from ..utils import safe_issubclass
+from ..utils.profiler import startup_profiler
 from .fields import (
     BaseHTTPFieldInfo,
     Depends,
@@ -80,6 +85,54 @@ def _merge_multi_value(
     }
 
 
+# Endpoints with the same parameters share one model and its validator
+_temporary_models: weakref.WeakValueDictionary[Hashable, Type[BaseModel]] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Hashable key of `value`. Functions are compared by identity, values that
+    are unhashable raise `TypeError`.
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value), tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return dict, tuple((key, _freeze(item)) for key, item in value.items())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return type(value), tuple(
+            _freeze(getattr(value, field.name)) for field in dataclasses.fields(value)
+        )
+    # The type keeps 1, 1.0 and True apart
+    return type(value), value
+
+
+def _create_temporary_model(params: Dict[str, Any]) -> Type[BaseModel]:
+    """
+    Create the model of parameters, or reuse the one with the same fields.
+    """
+    try:
+        key = tuple(
+            (
+                name,
+                type_,
+                tuple(
+                    _freeze(getattr(field_info, attr, None))
+                    for attr in FieldInfo.__slots__
+                ),
+            )
+            for name, (type_, field_info) in params.items()
+        )
+        hash(key)
+    except TypeError:  # Unhashable type or attribute, e.g. a dict default
+        return create_model("temporary_model", **params)
+    model = _temporary_models.get(key)
+    if model is None:
+        model = _temporary_models[key] = create_model("temporary_model", **params)
+    return model
+
+
 def _parse_parameters_and_request_body_to_model(
     sig: inspect.Signature,
 ) -> Tuple[
@@ -124,7 +177,8 @@ def _parse_parameters_and_request_body_to_model(
             continue
 
         if kui_field.exclusive:
-            model = create_root_model(type_)
+            with startup_profiler.phase("create_model"):
+                model = create_root_model(type_)
             raw_parameters[kui_field._in] = model
             exclusive_models[model] = name
         else:
@@ -152,7 +206,8 @@ def _parse_parameters_and_request_body_to_model(
         if safe_issubclass(params, BaseModel):
             model = params
         else:
-            model = create_model("temporary_model", **params)
+            with startup_profiler.phase("create_model"):
+                model = _create_temporary_model(params)
         raw_parameters[key] = model
 
     request_body: Type[BaseModel] | None
@@ -227,14 +282,22 @@ def _get_parameters_docs(
     properties: Dict[str, Any] = _schemas["properties"]
     required: Sequence[str] = _schemas.get("required", ())
 
+    # Don't modify the schemas in place, they are shared with the schema cache
     return [
         {
             "in": position,
             "name": name,
-            "description": schema.pop("description", ""),
+            "description": schema.get("description", ""),
             "required": name in required,
-            "schema": schema,
-            "deprecated": schema.pop("deprecated", False),
+            "schema": typing_cast(
+                "spec.Schema",
+                {
+                    k: v
+                    for k, v in schema.items()
+                    if k not in ("description", "deprecated")
+                },
+            ),
+            "deprecated": schema.get("deprecated", False),
         }
         for name, schema in properties.items()
         if name not in security_fields
@@ -276,6 +339,75 @@ def _get_response_docs(handler: Callable[..., Any]) -> List[Dict[Any, Any]]:
     return copy.deepcopy(response_docs)
 
 
+def _docs_holder(handler: Any) -> Any:
+    return handler.__func__ if inspect.ismethod(handler) else handler
+
+
+def _has_pending_docs(handler: Any) -> bool:
+    return bool(getattr(_docs_holder(handler), "__dict__", {}).get("__pending_docs__"))
+
+
+def defer_docs(handler: Any, update: Callable[[], None]) -> None:
+    """
+    Defer the update of `__docs_*__` attributes until `resolve_docs(handler)`.
+    """
+    holder = _docs_holder(handler)
+    pending = holder.__dict__.get("__pending_docs__", ())
+    setattr(holder, "__pending_docs__", (*pending, (holder, update)))
+
+
+def update_docs(handler: Any, update: Callable[[], None]) -> None:
+    """
+    Update `__docs_*__` attributes now, or after the pending updates if any.
+    """
+    if _has_pending_docs(handler):
+        defer_docs(handler, update)
+    else:
+        update()
+
+
+_resolve_docs_lock = threading.RLock()
+_resolving_docs: Set[Any] = set()
+
+
+def resolve_docs(handler: Any) -> None:
+    """
+    Run the pending updates of `__docs_*__` attributes.
+    """
+    holder = _docs_holder(handler)
+    if not _has_pending_docs(holder) and holder not in _resolving_docs:
+        return
+
+    # Threaded servers may generate the document at the same time, the other
+    # threads wait until the handler is resolved
+    with _resolve_docs_lock:
+        pending = holder.__dict__.get("__pending_docs__", ())
+        if not pending:  # Resolved, or being resolved by this thread
+            return
+        _resolving_docs.add(holder)
+        setattr(holder, "__pending_docs__", ())
+        try:
+            with startup_profiler.route(holder), startup_profiler.phase("docs"):
+                # The updates of other handlers were copied by `functools.wraps`,
+                # copy the docs of the last wrapped handler instead of running
+                # them.
+                copied = [target for target, _ in pending if target is not holder]
+                if copied:
+                    _copy_docs(copied[-1], holder)
+                for target, update in pending:
+                    if target is holder:
+                        update()
+        finally:
+            _resolving_docs.discard(holder)
+
+
+def _copy_docs(source: Any, target: Any) -> None:
+    resolve_docs(source)
+    for attr in dir(source):
+        if attr.startswith("__docs_"):
+            setattr(target, attr, getattr(source, attr))
+
+
 def _update_docs(
     old_handler: Callable[..., Any],
     handler: Callable[..., Any],
@@ -288,6 +420,10 @@ def _update_docs(
     if inspect.ismethod(handler):
         handler = handler.__func__  # type: ignore
 
+    resolve_docs(old_handler)
+    for func in depend_functions.values():
+        resolve_docs(func)
+
     if isinstance(handler.__doc__, str):
         clean_doc = inspect.cleandoc(handler.__doc__)
         if not hasattr(handler, "__docs_summary__") and not hasattr(
@@ -427,6 +563,10 @@ def create_auto_params(
     """
 
     def auto_params(handler: CallableObject) -> CallableObject:
+        with startup_profiler.phase("auto_params"):
+            return _auto_params(handler)
+
+    def _auto_params(handler: CallableObject) -> CallableObject:
         if hasattr(handler, "__methods__"):
             new_class = _create_new_class(handler)
             for method in map(lambda x: x.lower(), handler.__methods__):
@@ -458,10 +598,15 @@ def update_wrapper(
     """
     Update wrapper for auto-bound parameters.
     """
-    for attr in dir(old_handler):
-        if attr.startswith("__docs_") or attr in ("__method__", "__methods__"):
+    for attr in ("__method__", "__methods__"):
+        if hasattr(old_handler, attr):
             setattr(new_handler, attr, getattr(old_handler, attr))
 
+    if _has_pending_docs(old_handler):
+        defer_docs(new_handler, lambda: _copy_docs(old_handler, new_handler))
+    else:
+        update_docs(new_handler, lambda: _copy_docs(old_handler, new_handler))
+
     setattr(new_handler, "__raw_handler__", old_handler)
 
     return new_handler
@@ -174,11 +174,12 @@ def Body(
     return Annotated[Any, field_info, InBody(exclusive=exclusive)]
 
 
-def Depends(call: Callable, *, cache=True) -> Any:
+def Depends(call: Callable, *, cache=True, threadpool=False) -> Any:
     """
     Used to provide extra information about a field.
 
     :param call: callable that will be called when a dependency is needed for this field
     :param cache: whether to cache the result of the dependency call in the request state
+    :param threadpool: whether to call the sync dependency in the app's thread pool (ASGI only)
     """
-    return DependInfo(call, cache=cache)
+    return DependInfo(call, cache=cache, threadpool=threadpool)
@@ -54,3 +54,4 @@ class InBody(BaseHTTPFieldInfo):
 class Depends:
     call: Callable
     cache: bool = True
+    threadpool: bool = False
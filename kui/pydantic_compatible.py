@@ -1,11 +1,19 @@
 import copy
+import weakref
 from typing import Any, Dict, Tuple, Type
 
 from pydantic import BaseModel
 from pydantic import __version__ as pydantic_version
 
+from .utils.profiler import startup_profiler
+
 IS_V1 = pydantic_version.startswith("1.")
 
+# JSON schema of each model is generated only once, and released with the model
+_json_schema_cache: weakref.WeakKeyDictionary[Type[BaseModel], Dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
 REF_TEMPLATE = "#/components/schemas/{model}"
 
 __all__ = [
@@ -35,7 +43,7 @@ if IS_V1:
     def get_model_fields(model: Type[BaseModel]) -> Dict[str, ModelField]:  # type: ignore
         return model.__fields__  # type: ignore
 
-    def get_model_json_schema(model: Type[BaseModel]) -> Dict[str, str]:
+    def _generate_model_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
         return copy.deepcopy(model.schema(ref_template=REF_TEMPLATE))
 
     def create_root_model(type_: Any) -> Type[BaseModel]:
@@ -58,8 +66,23 @@ else:
     def get_model_fields(model: Type[BaseModel]) -> Dict[str, FieldInfo]:  # type: ignore
         return model.model_fields
 
-    def get_model_json_schema(model: Type[BaseModel]) -> Dict[str, str]:
-        return copy.deepcopy(model.model_json_schema(ref_template=REF_TEMPLATE))
+    def _generate_model_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+        return model.model_json_schema(ref_template=REF_TEMPLATE)
 
     def create_root_model(type_: Any) -> Type[BaseModel]:
         return RootModel[type_]
+
+
+def get_model_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Return a shallow copy of the memoized JSON schema of model. Callers can
+    add or remove its keys, but the nested objects are shared with the cache
+    and must be copied before they are modified.
+    """
+    try:
+        schema = _json_schema_cache[model]
+    except KeyError:
+        with startup_profiler.phase("json_schema"):
+            schema = _generate_model_json_schema(model)
+        _json_schema_cache[model] = schema
+    return dict(schema)
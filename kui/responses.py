@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import collections
 import typing
 from http import HTTPStatus
 
@@ -249,6 +250,45 @@ class SendEventResponseMixin(metaclass=SendEventResponseDocsMetaclass):
     """
 
 
+class EventReplayBuffer:
+    """
+    Keep the latest `maxlen` server-sent events, so a reconnecting client can
+    receive the events after its `Last-Event-ID`.
+
+    Events without `id` are given an increasing integer id.
+    """
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        self.events: typing.Deque[typing.Dict[str, typing.Any]] = collections.deque(
+            maxlen=maxlen
+        )
+        self._next_id = 1
+
+    def append(
+        self, event: typing.Dict[str, typing.Any]
+    ) -> typing.Dict[str, typing.Any]:
+        if "id" not in event:
+            event = {**event, "id": str(self._next_id)}
+            self._next_id += 1
+        self.events.append(event)
+        return event
+
+    def since(
+        self, last_event_id: typing.Optional[str]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        The events after `last_event_id`. If the id is no longer in the buffer,
+        all buffered events are returned.
+        """
+        if last_event_id is None:
+            return []
+        events = list(self.events)
+        for index in range(len(events) - 1, -1, -1):
+            if str(events[index]["id"]) == last_event_id:
+                return events[index + 1 :]
+        return events
+
+
 class StreamResponseDocsMetaclass(abc.ABCMeta):
     def __getitem__(
         cls,
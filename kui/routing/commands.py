@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import argparse
 import inspect
+import json
 import os
 import sys
 import typing
 
 from ..utils import import_from_string
 from ..utils.inspect import get_object_filepath, get_raw_handler
+from ..utils.profiler import startup_profiler
 from .extensions.multimethod import is_multimethod_view
 
 
@@ -16,11 +18,35 @@ def display_urls() -> None:
     parser.add_argument(
         "application", type=str, help="Application path like: module:attr"
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print the time spent on registering each route instead of urls",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        default="",
+        help="Write the startup profile as JSON to this file",
+    )
     args = parser.parse_args()
     application = args.application
 
+    profile = args.profile_startup or args.profile_output
+    if profile:
+        startup_profiler.enabled = True
+
     sys.path.insert(0, os.getcwd())
     app: typing.Any = import_from_string(application)
+
+    if profile:
+        if args.profile_output:
+            with open(args.profile_output, "w", encoding="utf8") as file:
+                json.dump(startup_profiler.to_dict(), file, indent=2)
+        if args.profile_startup:
+            print(startup_profiler.format_report())
+        return
+
     for path, handler in app.router.http_tree.iterator():
         print("* ", end="")
         print(path, end="")
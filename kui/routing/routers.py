@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import inspect
 import operator
 import typing
@@ -11,7 +12,9 @@ from baize.routing import compile_path
 from baize.utils import cached_property
 from typing_extensions import Literal, Self, get_args, get_origin
 
+from ..parameters import update_docs
 from ..utils import FF, F, safe_issubclass
+from ..utils.profiler import startup_profiler
 from .routes import BaseRoute, HttpRoute, SocketRoute
 from .tree import RadixTree, RouteType
 from .typing import AsyncViewType, MiddlewareType, SyncViewType, ViewType
@@ -348,8 +351,12 @@ def _set_tags(tags: typing.Iterable[str] | None = None):
             w = stupid_type_checker.__func__
         else:
             w = endpoint
-        all_tags = list(getattr(w, "__docs_tags__", [])) + list(tags or [])
-        setattr(w, "__docs_tags__", all_tags)
+
+        def add_tags() -> None:
+            all_tags = list(getattr(w, "__docs_tags__", [])) + list(tags or [])
+            setattr(w, "__docs_tags__", all_tags)
+
+        update_docs(w, add_tags)
         return endpoint
 
     return _set_tags_middleware
@@ -491,6 +498,9 @@ class Router(RouteRegisterMixin[ViewType], typing.Generic[ViewType]):
         self.websocket_tree = RadixTree[ViewType]()
 
         self.routes_mapping: typing.Dict[str, RouteType] = {}
+        # Incremented when a route is appended, used to invalidate caches
+        self.version = 0
+        self._change_event: typing.Optional[asyncio.Event] = None
 
         self._http_middlewares = list(http_middlewares)
         self._socket_middlewares = list(socket_middlewares)
@@ -514,8 +524,11 @@ class Router(RouteRegisterMixin[ViewType], typing.Generic[ViewType]):
         if route.name in self.routes_mapping:
             raise ValueError(f"Duplicate route name: {route.name}")
 
-        radix_tree.append(route.path, route.endpoint)
-        path_format, path_convertors = compile_path(route.path)
+        startup_profiler.add_path(route.endpoint, route.path)
+        with startup_profiler.route(route.endpoint):
+            with startup_profiler.phase("radix_tree"):
+                radix_tree.append(route.path, route.endpoint)
+                path_format, path_convertors = compile_path(route.path)
 
         if route.name:  # name not in ("", None)
             self.routes_mapping[route.name] = (
@@ -524,8 +537,29 @@ class Router(RouteRegisterMixin[ViewType], typing.Generic[ViewType]):
                 route.endpoint,
             )
 
+        self.version += 1
+        self.notify()
         return self
 
+    def notify(self) -> None:
+        """
+        Wake up all coroutines waiting in `wait_for_change`.
+        """
+        event, self._change_event = self._change_event, None
+        if event is not None:
+            event.set()
+
+    async def wait_for_change(self, version: int) -> int:
+        """
+        Wait until the routes are changed from `version` or `notify` is called,
+        return the current version.
+        """
+        if self.version == version:
+            if self._change_event is None:
+                self._change_event = asyncio.Event()
+            await self._change_event.wait()
+        return self.version
+
     def search(
         self, protocol: Literal["http", "websocket"], path: str
     ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Callable[[], typing.Any]]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import operator
 import typing
@@ -8,7 +9,8 @@ from functools import reduce
 
 from typing_extensions import Self
 
-from ..parameters import update_wrapper
+from ..parameters import update_docs, update_wrapper
+from ..utils.profiler import startup_profiler
 from .typing import MiddlewareType, ViewType
 
 
@@ -34,21 +36,29 @@ class BaseRoute(typing.Generic[ViewType]):
         if hasattr(endpoint, "__methods__"):
             for method in map(str.lower, endpoint.__methods__):
                 old_callback = getattr(endpoint, method)
-                new_callback = middleware(old_callback)
-                if getattr(new_callback, "__wrapped__", None) is old_callback:
-                    raise RuntimeError("Cannot use `@functools.wraps` on a middleware.")
-                if new_callback is not old_callback:
-                    update_wrapper(new_callback, old_callback)
-                    new_callback = self._auto_params(new_callback)
+                with startup_profiler.route(endpoint):
+                    with startup_profiler.phase("middlewares"):
+                        new_callback = middleware(old_callback)
+                        if getattr(new_callback, "__wrapped__", None) is old_callback:
+                            raise RuntimeError(
+                                "Cannot use `@functools.wraps` on a middleware."
+                            )
+                        if new_callback is not old_callback:
+                            update_wrapper(new_callback, old_callback)
+                            new_callback = self._auto_params(new_callback)
                 setattr(endpoint, method, staticmethod(new_callback))
         else:
             old_callback = endpoint
-            new_callback = middleware(old_callback)
-            if getattr(new_callback, "__wrapped__", None) is old_callback:
-                raise RuntimeError("Cannot use `@functools.wraps` on a middleware.")
-            if new_callback is not old_callback:
-                update_wrapper(new_callback, old_callback)
-                new_callback = self._auto_params(new_callback)
+            with startup_profiler.route(old_callback):
+                with startup_profiler.phase("middlewares"):
+                    new_callback = middleware(old_callback)
+                    if getattr(new_callback, "__wrapped__", None) is old_callback:
+                        raise RuntimeError(
+                            "Cannot use `@functools.wraps` on a middleware."
+                        )
+                    if new_callback is not old_callback:
+                        update_wrapper(new_callback, old_callback)
+                        new_callback = self._auto_params(new_callback)
             self.endpoint = new_callback  # type: ignore
         return self
 
@@ -58,7 +68,8 @@ class BaseRoute(typing.Generic[ViewType]):
         )
         if self.name == "":
             self.name = self.endpoint.__name__
-        self.endpoint = self._auto_params(self.endpoint)
+        with startup_profiler.route(self.endpoint):
+            self.endpoint = self._auto_params(self.endpoint)
 
 
 @dataclass
@@ -77,13 +88,20 @@ class HttpRoute(BaseRoute[ViewType], typing.Generic[ViewType]):
             w = self.endpoint
 
         if self.summary:
-            setattr(w, "__docs_summary__", self.summary)
+            update_docs(
+                w, functools.partial(setattr, w, "__docs_summary__", self.summary)
+            )
 
         if self.description:
-            setattr(w, "__docs_description__", self.description)
+            update_docs(
+                w,
+                functools.partial(setattr, w, "__docs_description__", self.description),
+            )
 
         if self.tags:
-            setattr(w, "__docs_tags__", list(self.tags))
+            update_docs(
+                w, functools.partial(setattr, w, "__docs_tags__", list(self.tags))
+            )
 
     def extend_middlewares(self, routes: typing.Iterable[BaseRoute[ViewType]]) -> None:
         self._extend_middlewares(getattr(routes, "_http_middlewares", []))
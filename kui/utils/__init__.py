@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .contextvars import bind_contextvar
+from .contextvars import ContextSlotVar, bind_contextvar
 from .importer import import_from_string, import_module
 from .inspect import (
     get_object_filepath,
@@ -18,6 +18,7 @@ __all__ = [
     "Singleton",
     "ImmutableAttribute",
     "bind_contextvar",
+    "ContextSlotVar",
     "FF",
     "F",
     "State",
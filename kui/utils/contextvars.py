@@ -1,41 +1,113 @@
 from __future__ import annotations
 
+import copy
 import typing as t
-from contextlib import contextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 
-__all__ = ["bind_contextvar"]
+__all__ = ["bind_contextvar", "ContextSlotVar", "context_setter"]
 
 T = t.TypeVar("T")
 
 
-def bind_contextvar(contextvar: ContextVar[T]) -> T:
+class ContextSlotVar(t.Generic[T]):
+    """
+    ContextVar-like view of the attribute `name` of the slots object stored
+    in `contextvar`. Several values can be set by one `contextvar.set`.
+
+    `set` stores a copy of the slots object, so the other contexts that share
+    the object are not affected.
+    """
+
+    __slots__ = ("contextvar", "name", "factory")
+
+    def __init__(
+        self, contextvar: ContextVar[t.Any], name: str, factory: t.Callable[[], t.Any]
+    ) -> None:
+        self.contextvar = contextvar
+        self.name = name
+        self.factory = factory
+
+    def get(self, *default: T) -> T:
+        try:
+            return getattr(self.contextvar.get(), self.name)
+        except (LookupError, AttributeError):
+            if default:
+                return default[0]
+            raise LookupError(self) from None
+
+    def set(self, value: T) -> Token[t.Any]:
+        slots = self.contextvar.get(None)
+        slots = self.factory() if slots is None else copy.copy(slots)
+        setattr(slots, self.name, value)
+        return self.contextvar.set(slots)
+
+    def reset(self, token: Token[t.Any]) -> None:
+        self.contextvar.reset(token)
+
+    def __repr__(self) -> str:
+        return f"<ContextSlotVar name={self.name!r} of {self.contextvar!r}>"
+
+
+def bind_contextvar(contextvar: ContextVar[T] | ContextSlotVar[T]) -> T:
+    get: t.Callable[[], T]
+    if isinstance(contextvar, ContextSlotVar):
+        get_slots, slot_name = contextvar.contextvar.get, contextvar.name
+
+        def get() -> T:
+            try:
+                return getattr(get_slots(), slot_name)
+            except AttributeError:
+                raise LookupError(contextvar) from None
+
+    else:
+        get = contextvar.get
+
     class ContextVarBind:
         __slots__ = ()
 
-        def __getattr__(self, name):
-            return getattr(contextvar.get(), name)
+        # `__getattribute__` skips the failed lookup on the proxy itself that
+        # `__getattr__` pays for every attribute access
+        def __getattribute__(self, name):
+            try:
+                value = get()
+            except LookupError:
+                # Let introspection work outside of the context
+                if name.startswith("__"):
+                    return object.__getattribute__(self, name)
+                raise
+            return getattr(value, name)
 
         def __setattr__(self, name, value):
-            setattr(contextvar.get(), name, value)
+            setattr(get(), name, value)
 
         def __delattr__(self, name):
-            delattr(contextvar.get(), name)
+            delattr(get(), name)
 
         def __getitem__(self, index):
-            return contextvar.get()[index]  # type: ignore
+            return get()[index]  # type: ignore
 
         def __setitem__(self, index, value):
-            contextvar.get()[index] = value  # type: ignore
+            get()[index] = value  # type: ignore
 
         def __delitem__(self, index):
-            del contextvar.get()[index]  # type: ignore
+            del get()[index]  # type: ignore
 
     return ContextVarBind()  # type: ignore
 
 
-@contextmanager
-def context_setter(var: ContextVar[T], value: T) -> t.Generator[None, None, None]:
-    token = var.set(value)
-    yield
-    var.reset(token)
+class context_setter(t.Generic[T]):
+    """
+    Set `var` to `value` in the `with` block.
+    """
+
+    __slots__ = ("var", "value", "token")
+
+    def __init__(self, var: ContextVar[T] | ContextSlotVar[T], value: T) -> None:
+        self.var = var
+        self.value = value
+
+    def __enter__(self) -> None:
+        self.token = self.var.set(self.value)
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.var.reset(self.token)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from typing import Any, ContextManager, Dict, Iterator, List, Tuple
+
+from .inspect import get_raw_handler
+
+__all__ = ["StartupProfiler", "startup_profiler"]
+
+_NULL_CONTEXT: ContextManager[None] = contextlib.nullcontext()
+
+# Key of the time spent outside any route
+_OUTSIDE_ROUTES = 0
+
+
+class StartupProfiler:
+    """
+    Record the time spent in each phase of route registration and decoration.
+
+    Enabled by environment variable `KUI_PROFILE_STARTUP=1`, which is read when
+    kui is imported, or by `python -m kui.routing --profile-startup`.
+    The time spent in nested phase isn't counted in the outer phase.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.records: Dict[int, Dict[str, float]] = {}
+        self.handlers: Dict[int, Any] = {}
+        self.paths: Dict[int, List[str]] = {}
+        self._route_stack: List[int] = []
+        self._children_stack: List[float] = []
+
+    def route(self, handler: Any) -> ContextManager[None]:
+        """
+        Attribute the phases in this context to the route of handler.
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._route(handler)
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """
+        Record the time spent in this context.
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._phase(name)
+
+    def add_path(self, handler: Any, path: str) -> None:
+        if not self.enabled:
+            return
+        raw_handler = get_raw_handler(handler)
+        self.handlers[id(raw_handler)] = raw_handler
+        self.paths.setdefault(id(raw_handler), []).append(path)
+
+    @contextlib.contextmanager
+    def _route(self, handler: Any) -> Iterator[None]:
+        raw_handler = get_raw_handler(handler)
+        self.handlers[id(raw_handler)] = raw_handler
+        self._route_stack.append(id(raw_handler))
+        try:
+            yield
+        finally:
+            self._route_stack.pop()
+
+    @contextlib.contextmanager
+    def _phase(self, name: str) -> Iterator[None]:
+        self._children_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children_stack.pop()
+            if self._children_stack:
+                self._children_stack[-1] += elapsed
+            key = self._route_stack[-1] if self._route_stack else _OUTSIDE_ROUTES
+            phases = self.records.setdefault(key, {})
+            phases[name] = phases.get(name, 0.0) + elapsed - children
+
+    def _label(self, key: int) -> str:
+        if key == _OUTSIDE_ROUTES:
+            return "(outside routes)"
+        if key in self.paths:
+            return ", ".join(self.paths[key])
+        handler = self.handlers[key]
+        return getattr(handler, "__qualname__", repr(handler))
+
+    def phase_totals(self) -> List[Tuple[str, float]]:
+        """
+        Total time of each phase, sorted by time in descending order.
+        """
+        totals: Dict[str, float] = {}
+        for phases in self.records.values():
+            for name, seconds in phases.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+    def route_totals(self) -> List[Tuple[str, float, Dict[str, float]]]:
+        """
+        Total time and time of each phase per route, sorted by total time in descending order.
+        """
+        return sorted(
+            (
+                (self._label(key), sum(phases.values()), phases)
+                for key, phases in self.records.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "phases": dict(self.phase_totals()),
+            "routes": [
+                {"route": label, "total": total, "phases": phases}
+                for label, total, phases in self.route_totals()
+            ],
+        }
+
+    def format_report(self, limit: int = 20) -> str:
+        lines = ["Phase                     Seconds"]
+        for name, seconds in self.phase_totals():
+            lines.append(f"{name:<24}  {seconds:>7.3f}")
+        lines.append("")
+        lines.append(f"Slowest routes (top {limit})")
+        for label, total, phases in self.route_totals()[:limit]:
+            detail = ", ".join(
+                f"{name}={seconds:.3f}"
+                for name, seconds in sorted(
+                    phases.items(), key=lambda item: item[1], reverse=True
+                )
+            )
+            lines.append(f"{total:>7.3f}  {label}  ({detail})")
+        return "\n".join(lines)
+
+
+startup_profiler = StartupProfiler(
+    enabled=os.environ.get("KUI_PROFILE_STARTUP", "") not in ("", "0")
+)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from ..exceptions import HTTPException
+from ..exceptions import HTTPException, ValidationErrorRenderer
 from ..openapi.types import UploadFile
 from ..parameters.field_functions import (
     Body,
@@ -12,7 +12,10 @@ from ..parameters.field_functions import (
 )
 from ..security import api_key_auth_dependency, basic_auth, bearer_auth
 from .applications import FactoryClass, Kui
+from .cache import cache_response
+from .compression import compress_response
 from .cors import allow_cors
+from .etag import etag_response
 from .openapi import OpenAPI
 from .parameters import auto_params
 from .requests import (
@@ -49,6 +52,7 @@ __all__ = [
     "request",
     "request_var",
     "HTTPException",
+    "ValidationErrorRenderer",
     "Body",
     "Cookie",
     "Header",
@@ -78,5 +82,8 @@ __all__ = [
     "HttpRoute",
     "SocketRoute",
     "allow_cors",
+    "compress_response",
+    "cache_response",
+    "etag_response",
     "Jinja2Templates",
 ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import functools
+import mmap
 from pathlib import PurePath
 from types import GeneratorType
 from typing import Any, Callable, Iterable, List, Mapping, NoReturn, Optional, Type
@@ -12,14 +13,15 @@ from baize.wsgi import Files, Hosts, Pages, Subpaths
 from baize.wsgi import Router as BaizeRouter
 from pydantic import BaseModel
 
-from ..cors import CORSConfig
+from ..cors import CORSConfig, CORSPolicy
+from ..exceptions import ValidationErrorRenderer
 from ..responses import create_json_encoder
 from ..routing import BaseRoute, MiddlewareType, NoMatchFound, SyncViewType
 from ..utils import ImmutableAttribute, State
 from ..utils.contextvars import context_setter
-from .cors import allow_cors
+from .cors import cors_middleware, get_preflight_response
 from .exceptions import ErrorHandlerType, ExceptionMiddleware, HTTPException
-from .requests import HttpRequest, http_connection_var, request_var
+from .requests import ConnectionContext, HttpRequest, connection_context_var
 from .responses import (
     FileResponse,
     HttpResponse,
@@ -48,6 +50,7 @@ class Kui:
         http_middlewares: List[MiddlewareType] = [],
         exception_handlers: Mapping[int | Type[BaseException], ErrorHandlerType] = {},
         cors_config: Optional[CORSConfig] = None,
+        validation_error_renderer: ValidationErrorRenderer = ValidationErrorRenderer(),
         factory_class: FactoryClass = FactoryClass(),
         response_converters: Mapping[type, Callable[..., HttpResponse]] = {},
         json_encoder: Mapping[type, Callable[[Any], Any]] = {},
@@ -63,11 +66,15 @@ class Kui:
 
         http_middlewares = [*http_middlewares]
 
-        self.exception_middleware = ExceptionMiddleware(exception_handlers)
+        self.exception_middleware = ExceptionMiddleware(
+            exception_handlers, validation_error_renderer
+        )
         http_middlewares.append(self.exception_middleware)
 
+        self.cors_policy: Optional[CORSPolicy] = None
         if cors_config is not None:
-            http_middlewares.append(allow_cors(**cors_config))
+            self.cors_policy = CORSPolicy(**cors_config)
+            http_middlewares.append(cors_middleware(self.cors_policy))
 
         self.router = Router(routes, http_middlewares, [])
 
@@ -89,27 +96,22 @@ class Kui:
 
     def app(self, environ: Environ, start_response: StartResponse) -> Iterable[bytes]:
         request = self.factory_class.http(environ)
-        with (
-            context_setter(http_connection_var, request),
-            context_setter(request_var, request),
-        ):
+        with context_setter(connection_context_var, ConnectionContext(request)):
             try:
                 try:
                     path_params, handler = self.router.search(
                         "http", request.get("PATH_INFO", "")
                     )
+                    request.internals.path_params = path_params
+                    # Kept for middlewares and handlers that read the environ
                     request["PATH_PARAMS"] = path_params
-                    response = handler()
+                    # Answer the preflight request without calling the endpoint
+                    response = (
+                        self.cors_policy is not None
+                        and get_preflight_response(self.cors_policy)
+                    ) or handler()
                 except NoMatchFound:
-                    http_exception: HTTPException[None] = HTTPException(404)
-                    error_handler = self.exception_middleware.lookup_handler(
-                        http_exception
-                    )
-                    if error_handler is None:
-                        raise RuntimeError(
-                            "No exception handler found for HTTPException(404)"
-                        )
-                    response = error_handler(http_exception)
+                    response = self.exception_middleware.not_found()
 
                 if isinstance(response, tuple):
                     response = self.response_converter(*response)
@@ -119,7 +121,9 @@ class Kui:
                 yield from response(environ, start_response)
             finally:
                 try:
-                    request.background_tasks.run()
+                    background_tasks = request.internals.background_tasks
+                    if background_tasks is not None:
+                        background_tasks.run()
                 finally:
                     request.close()
 
@@ -160,6 +164,9 @@ def create_response_converter(
     response_converter.register(list, JSONResponse)
     response_converter.register(tuple, JSONResponse)
     response_converter.register(bytes, PlainTextResponse)
+    response_converter.register(bytearray, PlainTextResponse)
+    response_converter.register(memoryview, PlainTextResponse)
+    response_converter.register(mmap.mmap, PlainTextResponse)
     response_converter.register(str, PlainTextResponse)
     response_converter.register(GeneratorType, SendEventResponse)
     response_converter.register(
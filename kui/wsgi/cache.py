@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from baize.datastructures import MutableHeaders
+from baize.typing import Environ, ExcInfo, StartResponse
+from baize.wsgi import FileResponse as BaiZeFileResponse
+from baize.wsgi.responses import StatusStringMapping, StreamingResponse
+
+from ..cache import (
+    CacheBackend,
+    CacheEntry,
+    MemoryCache,
+    create_cache_key,
+    is_cacheable,
+    replay_headers,
+)
+from ..etag import etag_matches
+from .requests import request
+from .responses import (
+    HttpResponse,
+    convert_response,
+    get_if_none_match,
+    send_not_modified,
+)
+from .routing import SyncViewType
+
+# Render the response as an unconditional GET, so that the cached entry
+# does not depend on the conditional headers of the first request.
+_RENDER_ENVIRON: Environ = {"REQUEST_METHOD": "GET"}
+
+
+class CachedResponse(HttpResponse):
+    """
+    Send a cached entry, respond 304 if its ETag matches `If-None-Match`.
+    """
+
+    def __init__(self, entry: CacheEntry) -> None:
+        super().__init__(entry.status_code, MutableHeaders(entry.headers))
+        self.entry = entry
+        self.body = entry.body
+
+    def list_headers(self, *, as_bytes: bool) -> Any:
+        headers = [
+            *replay_headers(self.entry, self.headers),
+            *(("set-cookie", str(cookie)) for cookie in self.cookies),
+        ]
+        if as_bytes:
+            return [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+        return headers
+
+    def __call__(
+        self, environ: Environ, start_response: StartResponse
+    ) -> Iterable[bytes]:
+        etag = self.headers.get("etag")
+        if etag is not None and etag_matches(get_if_none_match(environ), etag):
+            return send_not_modified(start_response, self)
+        self.headers["content-length"] = str(len(self.body))
+        start_response(
+            StatusStringMapping[self.status_code], self.list_headers(as_bytes=False)
+        )
+        return (self.body,)
+
+
+def render_response(response: HttpResponse) -> CacheEntry:
+    """
+    Render the response to status, headers and body bytes.
+    """
+    captured_status: str = ""
+    captured_headers: List[Tuple[str, str]] = []
+
+    def capture_start_response(
+        status: str,
+        response_headers: List[Tuple[str, str]],
+        exc_info: Optional[ExcInfo] = None,
+    ) -> Any:
+        nonlocal captured_status, captured_headers
+        captured_status, captured_headers = status, response_headers
+
+    body = b"".join(response(dict(_RENDER_ENVIRON), capture_start_response))
+    return CacheEntry(int(captured_status.split(" ", 1)[0]), captured_headers, body)
+
+
+def cache_response(
+    ttl: float = 60,
+    *,
+    query_params: Optional[Iterable[str]] = None,
+    vary: Iterable[str] = (),
+    methods: Iterable[str] = ("GET", "HEAD"),
+    backend: Optional[CacheBackend] = None,
+) -> Callable[[SyncViewType], SyncViewType]:
+    """
+    Cache fully rendered responses
+    """
+    cache: CacheBackend = MemoryCache() if backend is None else backend
+    selected_query_params = None if query_params is None else tuple(query_params)
+    vary_headers = tuple(name.lower() for name in vary)
+    allow_methods = frozenset(method.upper() for method in methods)
+
+    def decorator(endpoint: SyncViewType) -> SyncViewType:
+        def cache_wrapper() -> Any:
+            if request.method not in allow_methods:
+                return endpoint()
+
+            key = create_cache_key(
+                request.method,
+                request.url.path,
+                request.query_params.multi_items(),
+                selected_query_params,
+                request.headers,
+                vary_headers,
+            )
+            entry = cache.get(key)
+            if entry is not None:
+                return CachedResponse(entry)
+
+            response = convert_response(endpoint())
+            if not isinstance(response, HttpResponse) or isinstance(
+                response, (StreamingResponse, BaiZeFileResponse)
+            ):
+                return response
+            entry = render_response(response)
+            if is_cacheable(entry.status_code, entry.headers):
+                cache.set(key, entry, ttl)
+            return CachedResponse(entry)
+
+        return cache_wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from baize.typing import Environ, ExcInfo, StartResponse
+
+from ..compression import (
+    DEFAULT_ENCODINGS,
+    DEFAULT_EXCLUDED_CONTENT_TYPES,
+    Compressor,
+    compressed_headers,
+    create_compressor_factories,
+    negotiate_encoding,
+    should_compress,
+)
+from .requests import request
+from .responses import HttpResponse, convert_response
+from .routing import SyncViewType
+
+
+class CompressResponse(HttpResponse):
+    """
+    Wrap a response and compress the body yielded by it.
+
+    The body with `Content-Length` is compressed in one piece, the streaming body
+    is compressed chunk by chunk and flushed after each chunk.
+    """
+
+    def __init__(
+        self,
+        response: HttpResponse,
+        encoding: str,
+        compressor_factory: Callable[[], Compressor],
+        minimum_size: int,
+        excluded_content_types: AbstractSet[str],
+    ) -> None:
+        super().__init__(response.status_code)
+        # Share headers and cookies, so the outer middlewares can still modify them
+        self.headers = response.headers
+        self.cookies = response.cookies
+        self.response = response
+        self.encoding = encoding
+        self.compressor_factory = compressor_factory
+        self.minimum_size = minimum_size
+        self.excluded_content_types = excluded_content_types
+
+    def __call__(
+        self, environ: Environ, start_response: StartResponse
+    ) -> Iterable[bytes]:
+        captured_status: str = ""
+        captured_headers: List[Tuple[str, str]] = []
+        passthrough = False
+
+        def capture_start_response(
+            status: str,
+            response_headers: List[Tuple[str, str]],
+            exc_info: Optional[ExcInfo] = None,
+        ) -> Any:
+            nonlocal captured_status, captured_headers
+            if passthrough:
+                return start_response(status, response_headers, exc_info)
+            captured_status, captured_headers = status, response_headers
+
+        iterable = iter(self.response(environ, capture_start_response))
+        try:
+            # The start_response is called before the first chunk is yielded
+            first_chunk = next(iterable, b"")
+            status, headers = captured_status, captured_headers
+            if not status:
+                # start_response has not been called, nothing to compress
+                passthrough = True
+                yield first_chunk
+                yield from iterable
+                return
+            content_length: Optional[int] = None
+            for key, value in headers:
+                if key.lower() == "content-length":
+                    content_length = int(value)
+
+            if not should_compress(
+                int(status.split(" ", 1)[0]), headers, self.excluded_content_types
+            ) or (content_length is not None and content_length < self.minimum_size):
+                start_response(status, headers)
+                yield first_chunk
+                yield from iterable
+                return
+
+            compressor = self.compressor_factory()
+            if content_length is not None and len(first_chunk) == content_length:
+                body = compressor.compress(first_chunk) + compressor.finish()
+                start_response(
+                    status, compressed_headers(headers, self.encoding, len(body))
+                )
+                yield body
+                return
+
+            start_response(status, compressed_headers(headers, self.encoding))
+            yield compressor.compress(first_chunk) + compressor.flush()
+            for chunk in iterable:
+                chunk = compressor.compress(chunk) + compressor.flush()
+                if chunk:
+                    yield chunk
+            yield compressor.finish()
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+
+
+def compress_response(
+    minimum_size: int = 500,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    levels: Mapping[str, int] = {},
+    excluded_content_types: Iterable[str] = DEFAULT_EXCLUDED_CONTENT_TYPES,
+) -> Callable[[SyncViewType], SyncViewType]:
+    """
+    Compress response body by the `Accept-Encoding` of request
+    """
+    compressor_factories = create_compressor_factories(encodings, levels)
+    available_encodings = tuple(compressor_factories.keys())
+    excluded = frozenset(excluded_content_types)
+
+    def decorator(endpoint: SyncViewType) -> SyncViewType:
+        def compression_wrapper() -> Any:
+            encoding = negotiate_encoding(
+                request.headers.get("accept-encoding", ""), available_encodings
+            )
+            if encoding is None:
+                return endpoint()
+            return CompressResponse(
+                convert_response(endpoint()),
+                encoding,
+                compressor_factories[encoding],
+                minimum_size,
+                excluded,
+            )
+
+        return compression_wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from baize.typing import Environ, ExcInfo, StartResponse
+
+from ..etag import create_etag, etag_matches
+from .responses import (
+    HttpResponse,
+    convert_response,
+    get_if_none_match,
+    send_not_modified,
+)
+from .routing import SyncViewType
+
+
+class ETagResponse(HttpResponse):
+    """
+    Wrap a response, add ETag generated from the rendered body and
+    respond 304 if it matches `If-None-Match`.
+
+    Streaming responses are sent as is.
+    """
+
+    def __init__(self, response: HttpResponse) -> None:
+        super().__init__(response.status_code)
+        # Share headers and cookies, so the outer middlewares can still modify them
+        self.headers = response.headers
+        self.cookies = response.cookies
+        self.response = response
+
+    def __call__(
+        self, environ: Environ, start_response: StartResponse
+    ) -> Iterable[bytes]:
+        if environ["REQUEST_METHOD"] not in ("GET", "HEAD"):
+            return self.response(environ, start_response)
+
+        if_none_match = get_if_none_match(environ)
+
+        etag = self.headers.get("etag")
+        if etag is not None:
+            # Precomputed version tag, no need to render the body
+            if etag_matches(if_none_match, etag):
+                return send_not_modified(start_response, self)
+            return self.response(environ, start_response)
+
+        return self._generate_etag(environ, start_response, if_none_match)
+
+    def _generate_etag(
+        self, environ: Environ, start_response: StartResponse, if_none_match: str
+    ) -> Iterable[bytes]:
+        captured_status: str = ""
+        captured_headers: List[Tuple[str, str]] = []
+
+        def capture_start_response(
+            status: str,
+            response_headers: List[Tuple[str, str]],
+            exc_info: Optional[ExcInfo] = None,
+        ) -> Any:
+            nonlocal captured_status, captured_headers
+            captured_status, captured_headers = status, response_headers
+
+        iterable = iter(self.response(environ, capture_start_response))
+        try:
+            # The start_response is called before the first chunk is yielded
+            first_chunk = next(iterable, b"")
+            status, headers = captured_status, captured_headers
+            content_length: Optional[int] = None
+            for key, value in headers:
+                if key.lower() == "content-length":
+                    content_length = int(value)
+
+            if not status.startswith("200 ") or content_length != len(first_chunk):
+                start_response(status, headers)
+                yield first_chunk
+                yield from iterable
+                return
+
+            etag = create_etag(first_chunk)
+            self.headers["etag"] = etag
+            if etag_matches(if_none_match, etag):
+                yield from send_not_modified(start_response, self)
+                return
+            start_response(status, [*headers, ("etag", etag)])
+            yield first_chunk
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+
+
+def etag_response() -> Callable[[SyncViewType], SyncViewType]:
+    """
+    Generate ETag for response and answer conditional GET with 304
+    """
+
+    def decorator(endpoint: SyncViewType) -> SyncViewType:
+        def etag_wrapper() -> Any:
+            return ETagResponse(convert_response(endpoint()))
+
+        return etag_wrapper  # type: ignore
+
+    return decorator
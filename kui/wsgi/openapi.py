@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import json
 import time
-from hashlib import md5
 
 from ..openapi import OpenAPI as _OpenAPI
 from .requests import request
-from .responses import HTMLResponse, JSONResponse
+from .responses import HTMLResponse, JSONResponse, PlainTextResponse
 from .routing import HttpRoute, Routes
 
 
@@ -20,23 +18,33 @@ class OpenAPI(_OpenAPI):
             return HTMLResponse(self.html_template)
 
         def json_docs():
-            openapi = self.create_docs(request)
-            return JSONResponse(
-                openapi,
-                headers={
-                    "hash": md5(json.dumps(openapi).encode()).hexdigest(),
-                    "reload": str(self.reload).lower(),
-                },
-            )
+            headers = {
+                "hash": self.docs_hash(request.app),
+                "reload": str(self.reload).lower(),
+            }
+            if self.prebuilt_docs is not None:
+                return PlainTextResponse(
+                    self.prebuilt_docs,
+                    headers=headers,
+                    media_type="application/json",
+                    etag=self.prebuilt_etag,
+                )
+            return JSONResponse(self.create_docs(request), headers=headers)
 
         def heartbeat():
             def g():
-                openapi = self.create_docs(request)
-                yield {
-                    "id": md5(json.dumps(openapi).encode()).hexdigest(),
-                    "data": json.dumps(openapi),
-                }
-                while not request.app.should_exit:
+                app = request.app
+                version = -1
+                docs_hash = ""
+                while not app.should_exit:
+                    if app.router.version != version:
+                        version = app.router.version
+                        if self.docs_hash(app) != docs_hash:
+                            docs_hash = self.docs_hash(app)
+                            yield {
+                                "id": docs_hash,
+                                "data": self.dumps_docs(request),
+                            }
                     time.sleep(0.5)
 
             return g()
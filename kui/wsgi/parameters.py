@@ -20,9 +20,11 @@ from ..parameters import (
     _update_docs,
     _validate_parameters_and_request_body,
     create_auto_params,
+    defer_docs,
 )
 from ..pydantic_compatible import validate_model
 from ..utils import is_gen_callable
+from ..utils.profiler import startup_profiler
 from .requests import http_connection, request
 
 CallableObject = TypeVar("CallableObject", bound=Callable)
@@ -34,16 +36,17 @@ __all__ = [
 
 
 def _create_new_callback(callback: CallableObject) -> CallableObject:
-    sig = inspect.signature(callback)
+    with startup_profiler.phase("signature"):
+        sig = inspect.signature(callback)
 
-    (
-        parameters,
-        request_body,
-        exclusive_models,
-        security_info,
-    ) = _parse_parameters_and_request_body_to_model(sig)
+        (
+            parameters,
+            request_body,
+            exclusive_models,
+            security_info,
+        ) = _parse_parameters_and_request_body_to_model(sig)
 
-    depend_attrs = _parse_depends_attrs(sig)
+        depend_attrs = _parse_depends_attrs(sig)
     depend_functions = {
         name: _create_new_callback(info.call) for name, info in depend_attrs.items()
     }
@@ -59,10 +62,12 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
             need_closes = []
             try:
                 # try to call depend functions
-                cache = http_connection.state.setdefault("depend_functions_cache", {})
+                internals = http_connection.internals
                 for name, function in depend_functions.items():
                     info = depend_attrs[name]
-                    if info.call in cache:
+                    # Read it each time, the dependencies may create the cache
+                    cache = internals.dependency_cache
+                    if cache is not None and info.call in cache:
                         keyword_params[name] = cache[info.call]
                         continue
                     if is_gen_callable(info.call):
@@ -79,7 +84,9 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
                         keyword_params[name] = result
 
                     if info.cache:
-                        cache[info.call] = keyword_params[name]
+                        if internals.dependency_cache is None:
+                            internals.dependency_cache = {}
+                        internals.dependency_cache[info.call] = keyword_params[name]
 
                 data: List[Tuple[Type[BaseModel], Any]]
 
@@ -113,13 +120,18 @@ def _create_new_callback(callback: CallableObject) -> CallableObject:
             callback_with_auto_bound_params, "__signature__", _create_new_signature(sig)
         )
 
-    _update_docs(
-        callback,
+    # Generate the docs when they are read by OpenAPI
+    defer_docs(
         callback_with_auto_bound_params,
-        parameters,
-        request_body,
-        depend_functions,
-        security_info,
+        functools.partial(
+            _update_docs,
+            callback,
+            callback_with_auto_bound_params,
+            parameters,
+            request_body,
+            depend_functions,
+            security_info,
+        ),
     )
 
     return typing_cast(CallableObject, callback_with_auto_bound_params)
@@ -16,7 +16,25 @@ from .background import BackgroundTasks
 if typing.TYPE_CHECKING:
     from .applications import Kui
 
-from ..utils import State, bind_contextvar
+from ..utils import ContextSlotVar, State, bind_contextvar
+
+
+class ConnectionInternals:
+    """
+    Kui's bookkeeping of a connection, kept apart from the user's `state`.
+    The dependency cache and the background tasks are created on first use.
+    """
+
+    __slots__ = ("path_params", "dependency_cache", "background_tasks")
+
+    path_params: typing.Optional[typing.Dict[str, typing.Any]]
+    dependency_cache: typing.Optional[typing.Dict[typing.Any, typing.Any]]
+    background_tasks: typing.Optional[BackgroundTasks]
+
+    def __init__(self) -> None:
+        self.path_params = None
+        self.dependency_cache = None
+        self.background_tasks = None
 
 
 class HTTPConnection(BaiZeHTTPConnection, typing.MutableMapping[str, typing.Any]):
@@ -38,8 +56,23 @@ class HTTPConnection(BaiZeHTTPConnection, typing.MutableMapping[str, typing.Any]
         return self.url.replace(path=self.app.router.url_for(name, path_params))
 
     @cached_property
+    def internals(self) -> ConnectionInternals:
+        return ConnectionInternals()
+
+    @property
+    def path_params(self) -> typing.Dict[str, typing.Any]:
+        """
+        The path parameters parsed by the framework.
+        """
+        path_params = self.internals.path_params
+        return path_params if path_params is not None else self.get("PATH_PARAMS", {})
+
+    @property
     def background_tasks(self) -> BackgroundTasks:
-        return BackgroundTasks()
+        internals = self.internals
+        if internals.background_tasks is None:
+            internals.background_tasks = BackgroundTasks()
+        return internals.background_tasks
 
 
 class HttpRequest(BaiZeRequest, HTTPConnection):
@@ -63,10 +96,32 @@ class HttpRequest(BaiZeRequest, HTTPConnection):
         raise HTTPException(HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
 
 
-http_connection_var: ContextVar[HTTPConnection] = ContextVar("http_connection")
+class ConnectionContext:
+    """
+    The current connection, set by one `connection_context_var.set` for each
+    request.
+    """
+
+    __slots__ = ("http_connection", "request")
+
+    http_connection: HTTPConnection
+    request: HttpRequest
+
+    def __init__(self, request: typing.Optional[HttpRequest] = None) -> None:
+        if request is not None:
+            self.http_connection = self.request = request
+
+
+connection_context_var: ContextVar[ConnectionContext] = ContextVar("connection_context")
+
+http_connection_var: ContextSlotVar[HTTPConnection] = ContextSlotVar(
+    connection_context_var, "http_connection", ConnectionContext
+)
 
 http_connection = bind_contextvar(http_connection_var)
 
-request_var: ContextVar[HttpRequest] = ContextVar("request")
+request_var: ContextSlotVar[HttpRequest] = ContextSlotVar(
+    connection_context_var, "request", ConnectionContext
+)
 
 request = bind_contextvar(request_var)
@@ -4,8 +4,11 @@ import json
 import typing
 
 from baize import wsgi as baize_wsgi
-from baize.typing import ServerSentEvent
+from baize.exceptions import MalformedRangeHeader, RangeNotSatisfiable
+from baize.typing import Environ, ServerSentEvent, StartResponse
+from baize.wsgi.responses import StatusStringMapping
 
+from ..etag import etag_matches, not_modified_headers, quote_etag
 from ..responses import (
     FileResponseMixin,
     HTMLResponseMixin,
@@ -34,15 +37,161 @@ __all__ = [
 HttpResponse = baize_wsgi.Response
 
 
-class JSONResponse(JSONResponseMixin, baize_wsgi.JSONResponse):
+def get_if_none_match(environ: Environ) -> str:
+    if environ["REQUEST_METHOD"] not in ("GET", "HEAD"):
+        return ""
+    return environ.get("HTTP_IF_NONE_MATCH", "")
+
+
+def send_not_modified(
+    start_response: StartResponse, response: HttpResponse
+) -> typing.Iterable[bytes]:
+    headers = not_modified_headers(response.list_headers(as_bytes=False))
+    start_response(StatusStringMapping[304], headers)
+    return (b"",)
+
+
+class ConditionalResponseMixin(HttpResponse):
+    """
+    If the ETag matches `If-None-Match`, respond 304 without rendering the body.
+
+    Use `etag` to supply a precomputed version tag.
+    """
+
+    def __init__(
+        self, *args: typing.Any, etag: typing.Optional[str] = None, **kwargs: typing.Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        if etag is not None:
+            self.headers["etag"] = quote_etag(etag)
+
+    def __call__(
+        self, environ: Environ, start_response: StartResponse
+    ) -> typing.Iterable[bytes]:
+        etag = self.headers.get("etag")
+        if etag is not None and etag_matches(get_if_none_match(environ), etag):
+            return send_not_modified(start_response, self)
+        return super().__call__(environ, start_response)
+
+
+class BufferResponseMixin(HttpResponse):
+    """
+    Send `bytearray`, `memoryview` and `mmap` content in chunks, instead of
+    copying the whole buffer into `bytes`.
+
+    WSGI servers only accept `bytes`, so only one chunk is copied at a time.
+    """
+
+    content: typing.Any
+    media_type: str
+    charset: str
+    chunk_size: int = 4096 * 64
+
+    def __call__(
+        self, environ: Environ, start_response: StartResponse
+    ) -> typing.Iterable[bytes]:
+        if isinstance(self.content, (str, bytes)):
+            return super().__call__(environ, start_response)
+        return self._send_buffer(start_response)
+
+    def _send_buffer(self, start_response: StartResponse) -> typing.Iterable[bytes]:
+        with memoryview(self.content) as view, view.cast("B") as body:
+            body_length = len(body)
+            if "content-length" not in self.headers:
+                self.headers["content-length"] = str(body_length)
+            content_type = self.media_type
+            if content_type and "content-type" not in self.headers:
+                if content_type.startswith("text/"):
+                    content_type += "; charset=" + self.charset
+                self.headers["content-type"] = content_type
+            start_response(
+                StatusStringMapping[self.status_code], self.list_headers(as_bytes=False)
+            )
+            for offset in range(0, body_length, self.chunk_size):
+                yield bytes(body[offset : offset + self.chunk_size])
+            if body_length == 0:
+                yield b""
+
+
+class JSONResponse(
+    JSONResponseMixin, ConditionalResponseMixin, baize_wsgi.JSONResponse
+):
     def render(self, content: typing.Any) -> bytes:
         if not self.json_kwargs.get("default"):
             self.json_kwargs["default"] = request.app.json_encoder
         return json.dumps(content, **self.json_kwargs).encode(self.charset)
 
 
+class _FileRange:
+    """
+    Read at most `length` bytes from the current position of file.
+    """
+
+    def __init__(self, file: typing.BinaryIO, length: int) -> None:
+        self.file = file
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class SendfileResponseMixin(baize_wsgi.FileResponse):
+    """
+    Return the file by `wsgi.file_wrapper` when the server provides it,
+    so that the server can send it by `sendfile`.
+
+    https://peps.python.org/pep-3333/#optional-platform-specific-file-handling
+    """
+
+    def __call__(
+        self, environ: Environ, start_response: StartResponse
+    ) -> typing.Iterable[bytes]:
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if file_wrapper is None or environ["REQUEST_METHOD"] == "HEAD":
+            return super().__call__(environ, start_response)
+
+        file_size = self.stat_result.st_size
+        if "HTTP_RANGE" not in environ or (
+            "HTTP_IF_RANGE" in environ
+            and not self.judge_if_range(environ["HTTP_IF_RANGE"], self.stat_result)
+        ):
+            file = open(self.filepath, "rb")
+            self.headers["content-type"] = str(self.content_type)
+            self.headers["content-length"] = str(file_size)
+            start_response(StatusStringMapping[200], self.list_headers(as_bytes=False))
+            return file_wrapper(file, self.chunk_size)
+
+        try:
+            ranges = self.parse_range(environ["HTTP_RANGE"], file_size)
+        except (MalformedRangeHeader, RangeNotSatisfiable):
+            return super().__call__(environ, start_response)
+        if len(ranges) != 1:
+            return super().__call__(environ, start_response)
+
+        start, end = ranges[0]
+        file = open(self.filepath, "rb")
+        file.seek(start)
+        self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+        self.headers["content-type"] = str(self.content_type)
+        self.headers["content-length"] = str(end - start)
+        start_response(StatusStringMapping[206], self.list_headers(as_bytes=False))
+        return file_wrapper(_FileRange(file, end - start), self.chunk_size)
+
+
 class FileResponse(
     FileResponseMixin,
+    ConditionalResponseMixin,
+    SendfileResponseMixin,
     baize_wsgi.FileResponse,
 ):
     pass
@@ -50,6 +199,8 @@ class FileResponse(
 
 class PlainTextResponse(
     PlainTextResponseMixin,
+    ConditionalResponseMixin,
+    BufferResponseMixin,
     baize_wsgi.PlainTextResponse,
 ):
     pass
@@ -57,6 +208,7 @@ class PlainTextResponse(
 
 class HTMLResponse(
     HTMLResponseMixin,
+    ConditionalResponseMixin,
     baize_wsgi.HTMLResponse,
 ):
     pass
@@ -90,6 +242,8 @@ def TemplateResponse(
     headers: typing.Optional[typing.Mapping[str, str]] = None,
     media_type: typing.Optional[str] = None,
     charset: typing.Optional[str] = None,
+    *,
+    etag: typing.Optional[str] = None,
 ) -> HttpResponse:
     templates = request.app.templates
     if templates is None:
@@ -97,9 +251,12 @@ def TemplateResponse(
             "You must assign a value to `app.templates` to use TemplateResponse"
         )
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         name, context, status_code, headers, media_type, charset
     )
+    if etag is not None:
+        response.headers["etag"] = quote_etag(etag)
+    return response
 
 
 def convert_response(response: typing.Any) -> HttpResponse:
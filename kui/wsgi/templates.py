@@ -7,7 +7,7 @@ from baize.wsgi import SmallResponse
 from typing_extensions import Protocol
 
 from .requests import request
-from .responses import HttpResponse
+from .responses import ConditionalResponseMixin, HttpResponse
 
 __all__ = [
     "BaseTemplates",
@@ -44,7 +44,7 @@ except ImportError:
 
 else:
 
-    class _Jinja2TemplateResponse(SmallResponse):
+    class _Jinja2TemplateResponse(ConditionalResponseMixin, SmallResponse):
         media_type = "text/html"
 
         def __init__(
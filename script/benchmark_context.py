@@ -0,0 +1,72 @@
+"""
+Measure the per-request overhead of the request context plumbing.
+
+Setting the connection context is done once for each request, then kui and
+the handlers read the request through the `request` proxy many times.
+
+    python script/benchmark_context.py --number 1000000
+
+Run it on two commits to compare the results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kui.asgi import Kui, request, request_var  # noqa: E402
+from kui.asgi.requests import (  # noqa: E402
+    ConnectionContext,
+    connection_context_var,
+)
+from kui.utils.contextvars import context_setter  # noqa: E402
+
+
+async def receive():  # pragma: no cover
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):  # pragma: no cover
+    pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000000)
+    args = parser.parse_args()
+    number = args.number
+
+    app = Kui()
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "app": app,
+    }
+    http_request = app.factory_class.http(scope, receive, send)
+
+    def set_context() -> None:
+        with context_setter(connection_context_var, ConnectionContext(http_request)):
+            pass
+
+    def timing(statement) -> float:
+        seconds = min(timeit.repeat(statement, number=number, repeat=5))
+        return seconds / number * 1e9
+
+    print(f"Set context per request: {timing(set_context):.0f}ns")
+    with context_setter(connection_context_var, ConnectionContext(http_request)):
+        print(f"request.method:          {timing(lambda: request.method):.0f}ns")
+        print(
+            f"request_var.get().method: {timing(lambda: request_var.get().method):.0f}ns"
+        )
+        print(f"Local attribute:         {timing(lambda: http_request.method):.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Measure the startup time of an application with many routes.
+
+The cold start is the time to import kui and register the routes,
+the OpenAPI document is generated when it is requested for the first time.
+
+    python script/benchmark_startup.py --routes 1000
+
+Run it on two commits to compare the results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import_start = time.perf_counter()
+
+from pydantic import BaseModel, Field  # noqa: E402
+from typing_extensions import Annotated  # noqa: E402
+
+from kui.asgi import (  # noqa: E402
+    Body,
+    Header,
+    JSONResponse,
+    Kui,
+    OpenAPI,
+    Path,
+    Query,
+)
+
+import_end = time.perf_counter()
+
+
+class Pagination(BaseModel):
+    page: int = Field(1, ge=1, description="Page number")
+    size: int = Field(20, ge=1, le=100, description="Page size")
+
+
+class Error(BaseModel):
+    code: int
+    message: str
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+class ItemList(BaseModel):
+    items: List[Item]
+    total: int
+
+
+def create_app(routes: int) -> Kui:
+    app = Kui()
+    app.router <<= "/docs" // OpenAPI().routes
+
+    for i in range(routes):
+
+        async def list_items(
+            query: Annotated[Pagination, Query(exclusive=True)],
+            authorization: Annotated[str, Header(description="JWT Token")],
+        ) -> Annotated[
+            Any, JSONResponse[200, {}, ItemList], JSONResponse[400, {}, Error]
+        ]:
+            """
+            List items
+
+            Return items of current page.
+            """
+
+        async def update_item(
+            item_id: Annotated[int, Path()],
+            item: Annotated[Item, Body(exclusive=True)],
+        ) -> Annotated[Any, JSONResponse[200, {}, Item], JSONResponse[400, {}, Error]]:
+            """
+            Update item
+            """
+
+        app.router.http.get(f"/resource-{i}/items", name=None)(list_items)
+        app.router.http.put(f"/resource-{i}/items/{{item_id}}", name=None)(update_item)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--routes", type=int, default=1000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    app = create_app(args.routes // 2)
+    registered = time.perf_counter()
+    openapi = OpenAPI()
+    openapi.export_docs(app)
+    generated = time.perf_counter()
+
+    print(f"Routes:               {args.routes}")
+    print(f"Import kui:           {import_end - import_start:.3f}s")
+    print(f"Register routes:      {registered - start:.3f}s")
+    print(
+        f"Cold start:           {registered - start + import_end - import_start:.3f}s"
+    )
+    print(f"Generate OpenAPI:     {generated - registered:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
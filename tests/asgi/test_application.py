@@ -78,3 +78,51 @@ def test_custom_application_response_converter():
     assert isinstance(app.response_converter(tuple()), PlainTextResponse)
     assert isinstance(app.response_converter(list()), PlainTextResponse)
     assert isinstance(app.response_converter(dict()), PlainTextResponse)
+
+
+@pytest.mark.asyncio
+async def test_exception_handler_lookup_cache():
+    from kui.asgi import HTTPException, Kui, PlainTextResponse
+
+    app = Kui()
+
+    class CustomError(Exception):
+        pass
+
+    class SubError(CustomError):
+        pass
+
+    @app.router.http.get("/error")
+    async def error():
+        raise SubError()
+
+    @app.exception_handler(CustomError)
+    async def custom_error(exc: CustomError):
+        return PlainTextResponse("custom", 400)
+
+    middleware = app.exception_middleware
+    assert middleware.lookup_handler(SubError()) is custom_error
+    assert middleware._handler_cache[SubError] is custom_error
+
+    async with httpx.AsyncClient(
+        base_url="http://testserver", transport=httpx.ASGITransport(app=app)
+    ) as client:
+        for _ in range(2):
+            response = await client.get("/not-found")
+            assert response.status_code == 404
+            assert response.text == "Nothing matches the given URI"
+        assert middleware._not_found_response is not None
+
+        @app.exception_handler(SubError)
+        async def sub_error(exc: SubError):
+            return PlainTextResponse("sub", 400)
+
+        @app.exception_handler(404)
+        async def not_found(exc: HTTPException):
+            return PlainTextResponse("nothing here", 404)
+
+        assert middleware._not_found_response is None
+        response = await client.get("/error")
+        assert response.text == "sub"
+        response = await client.get("/not-found")
+        assert response.text == "nothing here"
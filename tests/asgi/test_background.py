@@ -0,0 +1,145 @@
+import asyncio
+
+import httpx
+import pytest
+
+from kui.asgi import Kui, request, request_var
+from kui.asgi.background import BackgroundExecutor, BackgroundTasks
+from kui.asgi.lifespan import Lifespan
+
+
+@pytest.mark.asyncio
+async def test_background_executor():
+    executor = BackgroundExecutor(concurrency=1, max_queue_size=1)
+    app = Kui(background_executor=executor)
+    release = asyncio.Event()
+    results = []
+
+    async def task(value):
+        await release.wait()
+        results.append((value, request.url.path))
+
+    @app.router.http.get("/{value}")
+    async def index():
+        value = request.path_params["value"]
+        request.background_tasks.append(task, value)
+        return value
+
+    await executor.start()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.get("/a")
+        assert resp.text == "a"
+        await asyncio.sleep(0)
+        assert executor.active == 1
+        resp = await client.get("/b")
+        assert resp.text == "b"
+        assert executor.queue_length == 1
+
+        # The queue is full, wait for a free slot
+        third = asyncio.ensure_future(client.get("/c"))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        release.set()
+        assert (await third).text == "c"
+
+    await executor.shutdown()
+    assert results == [("a", "/a"), ("b", "/b"), ("c", "/c")]
+    assert executor.queue_length == 0 and not executor.running
+
+
+@pytest.mark.asyncio
+async def test_background_executor_not_running():
+    executor = BackgroundExecutor()
+    results = []
+    tasks = BackgroundTasks()
+    tasks.append(results.append, 1)
+    await executor.submit(tasks)
+    assert results == [1]
+
+
+@pytest.mark.asyncio
+async def test_background_executor_exception():
+    executor = BackgroundExecutor()
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    try:
+        await executor.start()
+        tasks = BackgroundTasks()
+        tasks.append(lambda: 1 / 0)
+        await executor.submit(tasks)
+        await executor.shutdown()
+    finally:
+        loop.set_exception_handler(None)
+    assert isinstance(errors[0]["exception"], ZeroDivisionError)
+
+
+@pytest.mark.asyncio
+async def test_background_executor_lifespan():
+    executor = BackgroundExecutor()
+    app = Kui(background_executor=executor)
+    results = []
+
+    @app.on_shutdown
+    async def shutdown(app):
+        tasks = BackgroundTasks()
+        tasks.append(results.append, executor.running)
+        await executor.submit(tasks)
+
+    messages = asyncio.Queue()
+    for message in ({"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}):
+        messages.put_nowait(message)
+    sent = []
+
+    async def send(message):
+        if message["type"] == "lifespan.startup.complete":
+            assert executor.running
+        sent.append(message["type"])
+
+    await Lifespan.__call__(app.lifespan, {"app": app}, messages.get, send)
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert results == [True]
+    assert not executor.running
+
+
+@pytest.mark.asyncio
+async def test_background_executor_reads_request():
+    executor = BackgroundExecutor()
+    app = Kui(background_executor=executor)
+    results = []
+    closed = asyncio.Event()
+
+    async def task():
+        form = await request.form
+        results.append(form["name"])
+        results.append(await form["file"].aread())
+
+    @app.router.http.post("/")
+    async def index():
+        current = request_var.get()
+        original_close = current.close
+
+        async def close():
+            results.append("closed")
+            await original_close()
+            closed.set()
+
+        current.close = close  # type: ignore
+        request.background_tasks.append(task)
+        return "ok"
+
+    await executor.start()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.post(
+            "/", data={"name": "kui"}, files={"file": ("a.txt", b"content")}
+        )
+        assert resp.text == "ok"
+    await asyncio.wait_for(closed.wait(), 1)
+    await executor.shutdown()
+    # The request is closed after the tasks
+    assert results == ["kui", b"content", "closed"]
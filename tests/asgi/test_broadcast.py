@@ -0,0 +1,194 @@
+import asyncio
+import os
+import socket
+
+import pytest
+from baize.asgi import WebSocketState
+
+from kui.asgi import Kui, WebSocket, websocket
+from kui.asgi.broadcast import Broadcast, UnixSocketBackend
+
+
+def create_websocket(sent, blocker=None):
+    async def receive():
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if blocker is not None:
+            await blocker.wait()
+        sent.append(message)
+
+    websocket = WebSocket(
+        {"type": "websocket", "path": "/", "headers": []}, receive, send
+    )
+    websocket.application_state = WebSocketState.CONNECTED
+    return websocket
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_broadcast():
+    broadcast = Broadcast()
+    a_sent: list = []
+    b_sent: list = []
+    a, b = create_websocket(a_sent), create_websocket(b_sent)
+
+    await broadcast.join("room", a)
+    await broadcast.join("room", b)
+    await broadcast.join("other", b)
+    assert broadcast.count("room") == 2
+
+    await broadcast.publish("room", {"hello": "world"})
+    await broadcast.publish("other", b"bytes")
+    await settle()
+    assert a_sent == [{"type": "websocket.send", "text": '{"hello": "world"}'}]
+    assert b_sent == [
+        {"type": "websocket.send", "text": '{"hello": "world"}'},
+        {"type": "websocket.send", "bytes": b"bytes"},
+    ]
+    # Serialized once for all websockets
+    assert a_sent[0] is b_sent[0]
+
+    await broadcast.leave("room", b)
+    await broadcast.publish("room", "text")
+    await settle()
+    assert len(a_sent) == 2 and len(b_sent) == 2
+    assert broadcast.count("other") == 1
+
+    await broadcast.leave_all(b)
+    assert broadcast.count("other") == 0
+    await broadcast.disconnect()
+    assert broadcast.groups == {}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_slow_consumer():
+    blocker = asyncio.Event()
+    sent: list = []
+
+    broadcast = Broadcast(queue_size=2, overflow="coalesce")
+    websocket = create_websocket(sent, blocker)
+    await broadcast.join("room", websocket)
+    for i in range(5):
+        await broadcast.publish("room", str(i))
+    await settle()
+    blocker.set()
+    await settle()
+    assert [message["text"] for message in sent] == ["3", "4"]
+    assert broadcast.dropped_messages == 3
+    await broadcast.disconnect()
+
+    blocker.clear()
+    sent.clear()
+    broadcast = Broadcast(queue_size=2, overflow="disconnect")
+    websocket = create_websocket(sent, blocker)
+    await broadcast.join("room", websocket)
+    for i in range(5):
+        await broadcast.publish("room", str(i))
+    assert broadcast.count("room") == 0
+    assert broadcast.dropped_subscribers == 1
+    blocker.set()
+    await settle()
+    assert sent[-1]["type"] == "websocket.close" and sent[-1]["code"] == 1013
+    await broadcast.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_unix_socket_backend(tmp_path):
+    first_sent: list = []
+    second_sent: list = []
+    first = Broadcast(UnixSocketBackend(str(tmp_path)))
+    second = Broadcast(UnixSocketBackend(str(tmp_path)))
+    await first.join("room", create_websocket(first_sent))
+    await second.join("room", create_websocket(second_sent))
+
+    await first.publish("room", "text")
+    await second.publish("room", b"bytes")
+    for _ in range(100):
+        if len(first_sent) == len(second_sent) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert (
+        first_sent
+        == second_sent
+        == [
+            {"type": "websocket.send", "text": "text"},
+            {"type": "websocket.send", "bytes": b"bytes"},
+        ]
+    )
+    await first.disconnect()
+    await second.disconnect()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_broadcast_leave_on_close():
+    app = Kui()
+    broadcast = Broadcast()
+
+    @app.router.websocket("/")
+    async def index():
+        await websocket.accept()
+        await broadcast.join("room")
+        assert broadcast.count("room") == 1
+
+    messages = [{"type": "websocket.connect"}]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    await app({"type": "websocket", "path": "/", "headers": []}, receive, send)
+    assert broadcast.count("room") == 0
+    assert broadcast.groups == {}
+    await broadcast.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_backend_publish(tmp_path, monkeypatch):
+    backend = UnixSocketBackend(str(tmp_path))
+    received: list = []
+
+    async def on_message(group, message):
+        received.append(message)
+
+    await backend.connect(on_message)
+    # A process that never reads its socket
+    stuck = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    stuck.bind(str(tmp_path / "stuck.sock"))
+
+    listdir_calls = 0
+    listdir = os.listdir
+
+    def counting_listdir(path):
+        nonlocal listdir_calls
+        listdir_calls += 1
+        return listdir(path)
+
+    monkeypatch.setattr(os, "listdir", counting_listdir)
+    message = {"type": "websocket.send", "bytes": b"x" * 4096}
+    for _ in range(1000):
+        await backend.publish("room", message)
+        await asyncio.sleep(0)
+        if backend.dropped_messages:
+            break
+    # The publisher doesn't block on a full socket
+    assert backend.dropped_messages == 1
+    assert listdir_calls == 1
+    assert received and received[0] == message
+
+    with pytest.raises(ValueError):
+        await backend.publish(
+            "room",
+            {"type": "websocket.send", "bytes": b"x" * backend.max_message_size},
+        )
+
+    stuck.close()
+    await backend.disconnect()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from kui.asgi import HttpRoute, Kui, PlainTextResponse, cache_response, request
+from kui.cache import MemoryCache
+
+
+@pytest.mark.asyncio
+async def test_cache_response():
+    calls = []
+
+    async def homepage():
+        calls.append(request.query_params.get("page"))
+        await asyncio.sleep(0.01)
+        return {"page": request.query_params.get("page")}
+
+    async def with_cookie():
+        calls.append("cookie")
+        response = PlainTextResponse("cookie")
+        response.set_cookie("key", "value")
+        return response
+
+    backend = MemoryCache(max_size=2)
+    app = Kui(
+        http_middlewares=[
+            cache_response(
+                ttl=60, query_params=["page"], vary=["Accept-Language"], backend=backend
+            )
+        ]
+    )
+    app.router <<= HttpRoute("/", homepage)
+    app.router <<= HttpRoute("/cookie", with_cookie)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/", params={"page": "1", "other": str(i)}) for i in range(5))
+        )
+        assert all(resp.json() == {"page": "1"} for resp in responses)
+        assert calls == ["1"]
+
+        resp = await client.get("/", params={"page": "2"})
+        assert resp.json() == {"page": "2"}
+        assert calls == ["1", "2"]
+
+        resp = await client.get(
+            "/", params={"page": "2"}, headers={"accept-language": "zh"}
+        )
+        assert resp.json() == {"page": "2"}
+        assert calls == ["1", "2", "2"]
+        assert len(backend) == 2
+
+        await client.get("/cookie")
+        resp = await client.get("/cookie")
+        assert resp.cookies["key"] == "value"
+        assert calls == ["1", "2", "2", "cookie", "cookie"]
+
+
+@pytest.mark.asyncio
+async def test_cache_response_repeated_headers():
+    class LinkResponse(PlainTextResponse):
+        def list_headers(self, *, as_bytes):
+            return [
+                *super().list_headers(as_bytes=as_bytes),
+                (b"link", b"</a.css>; rel=preload"),
+                (b"link", b"</b.js>; rel=preload"),
+            ]
+
+    async def homepage():
+        return LinkResponse("homepage")
+
+    app = Kui(http_middlewares=[cache_response(ttl=60)])
+    app.router <<= HttpRoute("/", homepage)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        for _ in range(2):
+            response = await client.get("/")
+            assert response.headers.get_list("link") == [
+                "</a.css>; rel=preload",
+                "</b.js>; rel=preload",
+            ]
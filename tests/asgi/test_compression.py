@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from kui.asgi import (
+    HttpRoute,
+    Kui,
+    PlainTextResponse,
+    StreamResponse,
+    compress_response,
+)
+
+
+@pytest.mark.asyncio
+async def test_compress_response():
+    app = Kui(http_middlewares=[compress_response(minimum_size=10)])
+
+    async def large():
+        return "kui" * 100
+
+    async def small():
+        return "kui"
+
+    async def image():
+        return PlainTextResponse(b"\x00" * 100, media_type="image/png")
+
+    async def stream():
+        async def g():
+            for i in range(3):
+                yield {"id": str(i), "data": "hello"}
+
+        return g()
+
+    async def octet_stream():
+        async def g():
+            for _ in range(3):
+                yield b"kui" * 10
+
+        return StreamResponse(g())
+
+    app.router <<= HttpRoute("/large", large)
+    app.router <<= HttpRoute("/small", small)
+    app.router <<= HttpRoute("/image", image)
+    app.router <<= HttpRoute("/stream", stream)
+    app.router <<= HttpRoute("/octet-stream", octet_stream)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://testserver",
+        headers={"accept-encoding": "gzip"},
+    ) as client:
+        resp = await client.get("/large")
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert int(resp.headers["content-length"]) < 300
+        assert resp.text == "kui" * 100
+
+        resp = await client.get("/small")
+        assert "content-encoding" not in resp.headers
+        assert resp.text == "kui"
+
+        resp = await client.get("/image")
+        assert "content-encoding" not in resp.headers
+
+        resp = await client.get("/stream")
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "content-length" not in resp.headers
+        assert (
+            resp.text.replace(": ping\n\n", "")
+            == "\n".join(f"id: {i}\ndata: hello\n" for i in range(3)) + "\n"
+        )
+
+        # The default media type of StreamResponse
+        resp = await client.get("/octet-stream")
+        assert resp.headers["content-type"] == "application/octet-stream"
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.content == b"kui" * 30
+
+        resp = await client.get("/large", headers={"accept-encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert resp.text == "kui" * 100
@@ -60,3 +60,78 @@ async def test_cors_global():
 
         resp = await client.options("/")
         assert resp.headers["access-control-allow-origin"] == "testserver"
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_skips_endpoint():
+    from kui.asgi import HttpRoute, Kui, required_method
+
+    app = Kui(
+        cors_config={
+            "allow_origins": [
+                "https://a.example",
+                re.compile(r"https://.*\.b\.example"),
+            ],
+            "max_age": 60,
+        }
+    )
+
+    called = []
+
+    @required_method("GET")
+    async def homepage():
+        called.append(1)
+        return "homepage"
+
+    app.router <<= HttpRoute("/", homepage)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.options("/", headers={"origin": "https://a.example"})
+        assert resp.status_code == 200
+        assert resp.headers["access-control-allow-origin"] == "https://a.example"
+        assert resp.headers["access-control-max-age"] == "60"
+        assert resp.headers["content-length"] == "0"
+        assert resp.content == b""
+
+        resp = await client.options("/", headers={"origin": "https://c.b.example"})
+        assert resp.headers["access-control-allow-origin"] == "https://c.b.example"
+        assert called == []
+
+        resp = await client.options("/", headers={"origin": "https://c.example"})
+        assert "access-control-allow-origin" not in resp.headers
+
+        resp = await client.get("/", headers={"origin": "https://a.example.com"})
+        assert resp.status_code == 200
+        assert "access-control-allow-origin" not in resp.headers
+        assert called == [1]
+
+
+def test_cors_policy_origin_memo():
+    from kui.cors import CORSPolicy
+
+    policy = CORSPolicy(
+        [re.compile(r"https://a\.example"), re.compile(r"https://.*\.b\.example")],
+        memo_size=2,
+    )
+    assert policy.origin_pattern is not None
+    assert policy.is_allowed_origin("https://a.example")
+    assert not policy.is_allowed_origin("https://a.example.com")
+    assert policy.is_allowed_origin("https://c.b.example")
+    assert list(policy._memo) == ["https://a.example.com", "https://c.b.example"]
+
+
+def test_cors_policy_numbered_backreference():
+    from kui.cors import CORSPolicy
+
+    policy = CORSPolicy(
+        [
+            re.compile(r"https://(a)\.example"),
+            re.compile(r"https://(\w+)\.\1\.example"),
+        ]
+    )
+    # Joined, `\1` would refer to the group of the first pattern
+    assert policy.origin_pattern is None
+    assert policy.is_allowed_origin("https://b.b.example")
+    assert not policy.is_allowed_origin("https://b.c.example")
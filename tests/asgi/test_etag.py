@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from kui.asgi import HttpRoute, JSONResponse, Kui, etag_response
+
+
+@pytest.mark.asyncio
+async def test_etag_response():
+    app = Kui(http_middlewares=[etag_response()])
+
+    async def homepage():
+        return {"message": "Hello, World!"}
+
+    app.router <<= HttpRoute("/", homepage)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.get("/")
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+
+        resp = await client.get("/", headers={"if-none-match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+
+        resp = await client.get("/", headers={"if-none-match": '"other"'})
+        assert resp.status_code == 200
+        assert resp.json() == {"message": "Hello, World!"}
+
+
+@pytest.mark.asyncio
+async def test_precomputed_etag():
+    rendered = []
+
+    class Content:
+        pass
+
+    async def homepage():
+        return JSONResponse(Content(), etag="v1")
+
+    app = Kui(json_encoder={Content: lambda obj: rendered.append(obj) or "content"})
+    app.router <<= HttpRoute("/", homepage)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.get("/", headers={"if-none-match": 'W/"v1"'})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == '"v1"'
+        assert rendered == []
+
+        resp = await client.get("/")
+        assert resp.status_code == 200
+        assert resp.json() == "content"
+        assert len(rendered) == 1
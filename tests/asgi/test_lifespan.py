@@ -1,6 +1,11 @@
+import asyncio
+import time
+
 import pytest
 
+from kui.asgi import Kui
 from kui.asgi.lifespan import asynccontextmanager_lifespan
+from kui.asgi.threadpool import ThreadPool
 
 
 @pytest.mark.asyncio
@@ -19,3 +24,34 @@ async def test_asynccontextmanager_lifespan(capsys):
     await on_shutdown(None)
     captured = capsys.readouterr()
     assert captured.out == "shutdown\n"
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shutdown_thread_pool():
+    app = Kui(thread_pool=ThreadPool(1))
+    app.thread_pool.get_executor().submit(time.sleep, 0.2)
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    await app({"type": "lifespan"}, receive, send)
+    ticker.cancel()
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert app.thread_pool.executor is None
+    # The event loop kept running while waiting for the thread pool
+    assert ticks > 5
@@ -455,3 +455,122 @@ async def test_request_depends_cache_exception():
         with pytest.raises(NotImplementedError):
             await client.get("/")
         assert closed
+
+
+def test_temporary_model_interning():
+    from kui.parameters import _parse_parameters_and_request_body_to_model
+
+    async def a(page: Annotated[int, Query(1)], size: Annotated[int, Query(10)]):
+        pass
+
+    async def b(page: Annotated[int, Query(1)], size: Annotated[int, Query(10)]):
+        pass
+
+    async def c(page: Annotated[int, Query(1)], size: Annotated[int, Query(20)]):
+        pass
+
+    models_a = _parse_parameters_and_request_body_to_model(inspect.signature(a))[0]
+    models_b = _parse_parameters_and_request_body_to_model(inspect.signature(b))[0]
+    models_c = _parse_parameters_and_request_body_to_model(inspect.signature(c))[0]
+    assert models_a is not None and models_b is not None and models_c is not None
+    assert models_a["query"] is models_b["query"]
+    assert models_a["query"] is not models_c["query"]
+    assert models_a["query"].__name__ == "temporary_model"
+    assert models_c["query"].model_validate({}).model_dump() == {"page": 1, "size": 20}
+
+
+@pytest.mark.asyncio
+async def test_temporary_model_interning_default_factory():
+    app = Kui()
+
+    @app.router.http.get("/a")
+    async def a(n: Annotated[int, Query(default_factory=lambda: 1)]):
+        return [n]
+
+    @app.router.http.get("/b")
+    async def b(n: Annotated[int, Query(default_factory=lambda: 2)]):
+        return [n]
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        assert (await client.get("/a")).json() == [1]
+        assert (await client.get("/b")).json() == [2]
+
+
+@pytest.mark.asyncio
+async def test_validation_error_renderer():
+    from kui.asgi import ValidationErrorRenderer
+
+    app = Kui(
+        validation_error_renderer=ValidationErrorRenderer(
+            max_errors=2, max_input_length=4
+        )
+    )
+
+    @app.router.http.get("/")
+    async def query(
+        a: Annotated[int, Query()],
+        b: Annotated[int, Query()],
+        c: Annotated[int, Query()],
+    ):
+        return "ok"
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.get("/", params={"a": "abcdefgh"})
+        assert resp.status_code == 422
+        assert resp.headers["content-type"] == "application/json"
+        assert b"\n" not in resp.content
+        assert resp.json() == [
+            {
+                "type": "int_parsing",
+                "loc": ["a"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "input": "abcd",
+                "in": "query",
+            },
+            {
+                "type": "missing",
+                "loc": ["b"],
+                "msg": "Field required",
+                "input": {"a": "abcd"},
+                "in": "query",
+            },
+        ]
+
+
+@pytest.mark.asyncio
+async def test_request_internals_on_demand():
+    app = Kui()
+
+    calls = []
+
+    def number() -> int:
+        calls.append(1)
+        return len(calls)
+
+    async def double(n: Annotated[int, Depends(number)]) -> int:
+        return n * 2
+
+    @app.router.http.get("/{name}")
+    async def index(
+        n: Annotated[int, Depends(number)],
+        doubled: Annotated[int, Depends(double)],
+        name: Annotated[str, Path()],
+    ):
+        internals = request.internals
+        assert internals.dependency_cache == {number: 1, double: 2}
+        assert internals.path_params == {"name": name}
+        assert request["path_params"] is internals.path_params
+        assert internals.background_tasks is None
+        assert request.get("state") is None
+        return [n, doubled]
+
+    async with httpx.AsyncClient(
+        base_url="http://testserver", transport=httpx.ASGITransport(app=app)
+    ) as client:
+        resp = await client.get("/kui")
+        assert resp.json() == [1, 2]
+        assert calls == [1]
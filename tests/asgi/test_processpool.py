@@ -0,0 +1,51 @@
+import os
+import threading
+
+import httpx
+import pytest
+from typing_extensions import Annotated
+
+from kui.asgi import Depends, Kui, Query
+from kui.asgi.processpool import ProcessPool, in_processpool
+
+
+def get_lock():
+    return threading.Lock()
+
+
+@in_processpool
+def square(number: Annotated[int, Query()]):
+    return {"square": number * number, "pid": os.getpid()}
+
+
+@in_processpool
+def locked(lock: Annotated[object, Depends(get_lock)]):
+    return "unreachable"
+
+
+@pytest.mark.asyncio
+async def test_processpool():
+    app = Kui(process_pool=ProcessPool(1))
+    app.router.http.get("/square")(square)
+    app.router.http.get("/locked")(locked)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.get("/square", params={"number": 12})
+        assert resp.json()["square"] == 144
+        assert resp.json()["pid"] != os.getpid()
+
+        with pytest.raises(TypeError, match="Cannot pickle argument 'lock' \\(lock\\)"):
+            await client.get("/locked")
+
+    app.process_pool.shutdown()
+    assert app.process_pool.executor is None
+
+
+def test_in_processpool_async_handler():
+    async def handler():
+        pass
+
+    with pytest.raises(TypeError):
+        in_processpool(handler)
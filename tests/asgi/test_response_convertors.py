@@ -32,3 +32,164 @@ async def test_pydantic_base_model():
 
         response = await client.get("/test_response_convertors.py")
         assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_buffer_types():
+    import array
+    import mmap
+
+    app = Kui()
+    data = bytes(range(256)) * 4096
+
+    @app.router.http("/bytearray")
+    async def get_bytearray():
+        return bytearray(data)
+
+    @app.router.http("/memoryview")
+    async def get_memoryview():
+        return memoryview(array.array("I", range(16)))
+
+    @app.router.http("/mmap")
+    async def get_mmap():
+        buffer = mmap.mmap(-1, 16)
+        buffer.write(b"0123456789abcdef")
+        return buffer
+
+    @app.router.http("/empty")
+    async def get_empty():
+        return bytearray()
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        response = await client.get("/bytearray")
+        assert response.status_code == 200
+        assert response.content == data
+        assert response.headers["content-length"] == str(len(data))
+
+        response = await client.get("/memoryview")
+        assert response.content == array.array("I", range(16)).tobytes()
+        assert response.headers["content-length"] == str(16 * 4)
+
+        response = await client.get("/mmap")
+        assert response.content == b"0123456789abcdef"
+
+        response = await client.get("/empty")
+        assert response.content == b""
+        assert response.headers["content-length"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_buffer_chunked_send():
+    from kui.asgi import PlainTextResponse
+
+    response = PlainTextResponse(memoryview(b"x" * 10))
+    response.chunk_size = 4
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    await response({"type": "http", "method": "GET", "headers": []}, receive, send)
+    bodies = [
+        message for message in messages if message["type"] == "http.response.body"
+    ]
+    assert [bytes(message["body"]) for message in bodies] == [b"xxxx", b"xxxx", b"xx"]
+    assert [message["more_body"] for message in bodies] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_file_response_fast_path(tmp_path):
+    from kui.asgi import FileResponse
+
+    filepath = tmp_path / "data.bin"
+    data = bytes(range(256)) * 16
+    filepath.write_bytes(data)
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def call(scope):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        response = FileResponse(str(filepath), chunk_size=1000)
+        await response(
+            {"type": "http", "method": "GET", "headers": [], **scope}, receive, send
+        )
+        return messages
+
+    messages = await call({"extensions": {"http.response.pathsend": {}}})
+    assert messages[0]["status"] == 200
+    assert (b"content-length", str(len(data)).encode()) in messages[0]["headers"]
+    assert messages[1] == {"type": "http.response.pathsend", "path": str(filepath)}
+
+    messages = await call({})
+    bodies = [message["body"] for message in messages[1:]]
+    assert b"".join(bodies) == data
+    assert all(type(body) is bytes for body in bodies)
+    assert len(bodies) == 5
+    assert [message["more_body"] for message in messages[1:]] == [True] * 4 + [False]
+
+    messages = await call(
+        {
+            "headers": [(b"range", b"bytes=100-2099")],
+            "extensions": {"http.response.pathsend": {}},
+        }
+    )
+    assert messages[0]["status"] == 206
+    assert b"".join(message["body"] for message in messages[1:]) == data[100:2100]
+    assert messages[-1]["more_body"] is False
+
+    # The file is truncated after the headers are sent
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    response = FileResponse(str(filepath), chunk_size=1000)
+    sendfile = response.create_send_or_zerocopy({}, send)
+    with open(filepath, "rb") as file:
+        await sendfile(file.fileno(), 3000, 2000)
+    assert b"".join(message["body"] for message in messages) == data[3000:]
+    assert messages[-1]["more_body"] is False
+
+
+@pytest.mark.asyncio
+async def test_file_response_ranges(tmp_path):
+    filepath = tmp_path / "data.bin"
+    data = bytes(range(256)) * 16
+    filepath.write_bytes(data)
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+
+    app = Kui()
+
+    @app.router.http("/data")
+    async def get_data():
+        return filepath
+
+    @app.router.http("/empty")
+    async def get_empty():
+        return empty
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        response = await client.get("/data", headers={"range": "bytes=10-19"})
+        assert response.status_code == 206
+        assert response.content == data[10:20]
+
+        response = await client.get("/data", headers={"range": "bytes=0-9,20-29"})
+        assert response.status_code == 206
+        assert data[:10] in response.content and data[20:30] in response.content
+
+        response = await client.get("/empty")
+        assert response.status_code == 200
+        assert response.content == b""
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from kui.asgi import SendEventResponse
+from kui.asgi.responses import get_ping_timer
+from kui.responses import EventReplayBuffer
+
+
+async def run_response(response, headers=()):
+    bodies = []
+    disconnect = asyncio.Event()
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            bodies.append(message["body"])
+
+    scope = {"type": "http", "method": "GET", "headers": list(headers)}
+    await response(scope, receive, send)
+    return bodies
+
+
+@pytest.mark.asyncio
+async def test_send_event_response_batch():
+    async def events():
+        for i in range(3):
+            yield {"data": str(i)}
+        await asyncio.sleep(0.01)
+        yield {"data": "3"}
+
+    bodies = await run_response(SendEventResponse(events()))
+    assert bodies == [b"data: 0\n\ndata: 1\n\ndata: 2\n\n", b"data: 3\n\n"]
+
+    async def slow_events():
+        for i in range(3):
+            yield {"data": str(i)}
+            await asyncio.sleep(0)
+
+    bodies = await run_response(SendEventResponse(slow_events(), batch_window=0.05))
+    assert bodies == [b"data: 0\n\ndata: 1\n\ndata: 2\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_send_event_response_shared_ping():
+    started = asyncio.Event()
+
+    async def idle():
+        started.set()
+        await asyncio.sleep(0.05)
+        yield {"data": "done"}
+
+    responses = [SendEventResponse(idle(), ping_interval=0.01) for _ in range(2)]
+    tasks = [asyncio.ensure_future(run_response(r)) for r in responses]
+    await started.wait()
+    assert len(get_ping_timer(0.01).ticks) == 2
+    for bodies in await asyncio.gather(*tasks):
+        assert b": ping\n\n" in bodies
+        assert bodies[-1] == b"data: done\n\n"
+    assert get_ping_timer(0.01).handle is None
+
+
+@pytest.mark.asyncio
+async def test_send_event_response_replay():
+    buffer = EventReplayBuffer(3)
+    for i in range(4):
+        buffer.append({"data": str(i)})
+    assert [event["id"] for event in buffer.events] == ["2", "3", "4"]
+    assert buffer.since(None) == []
+    assert buffer.since("1") == list(buffer.events)
+
+    async def events():
+        yield buffer.append({"data": "4"})
+
+    bodies = await run_response(
+        SendEventResponse(events(), replay=buffer), [(b"last-event-id", b"3")]
+    )
+    assert bodies == [b"id: 4\ndata: 3\n\n", b"id: 5\ndata: 4\n\n"]
+    # Shared events are not consumed by encoding
+    assert buffer.events[-1] == {"data": "4", "id": "5"}
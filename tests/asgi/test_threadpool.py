@@ -0,0 +1,97 @@
+import threading
+
+import httpx
+import pytest
+from typing_extensions import Annotated
+
+from kui.asgi import Depends, Kui, Query, request
+from kui.asgi.threadpool import ThreadPool, in_threadpool
+
+
+@pytest.mark.asyncio
+async def test_threadpool_opt_in():
+    app = Kui()
+    main_thread = threading.get_ident()
+
+    def current_path():
+        return [request.url.path, threading.get_ident() != main_thread]
+
+    def on_loop():
+        return threading.get_ident() != main_thread
+
+    @app.router.http.get("/")
+    @in_threadpool
+    def index(
+        name: Annotated[str, Query()],
+        path: Annotated[tuple, Depends(current_path, threadpool=True)],
+        loop: Annotated[bool, Depends(on_loop)],
+    ):
+        return {
+            "name": name,
+            "path": path,
+            "loop": loop,
+            "handler": threading.get_ident() != main_thread,
+        }
+
+    @app.router.http.get("/no-params")
+    @in_threadpool
+    def no_params():
+        return [request.url.path, threading.get_ident() != main_thread]
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.get("/", params={"name": "kui"})
+        assert resp.json() == {
+            "name": "kui",
+            "path": ["/", True],
+            "loop": False,
+            "handler": True,
+        }
+
+        resp = await client.get("/no-params")
+        assert resp.json() == ["/no-params", True]
+
+    app.thread_pool.shutdown()
+    assert app.thread_pool.executor is None
+
+
+@pytest.mark.asyncio
+async def test_threadpool_offload_sync():
+    app = Kui(thread_pool=ThreadPool(2, offload_sync=True))
+    main_thread = threading.get_ident()
+
+    def in_thread():
+        return threading.get_ident() != main_thread
+
+    @app.router.http.get("/")
+    def index(
+        name: Annotated[str, Query()],
+        dependency: Annotated[bool, Depends(in_thread)],
+    ):
+        return {"dependency": dependency, "handler": in_thread()}
+
+    @app.router.http.get("/no-params")
+    def no_params():
+        return {"handler": in_thread()}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        resp = await client.get("/", params={"name": "kui"})
+        assert resp.json() == {"dependency": True, "handler": True}
+        resp = await client.get("/no-params")
+        assert resp.json() == {"handler": True}
+
+    app.thread_pool.shutdown()
+
+
+def test_sync_dependency_unwrapped():
+    from kui.asgi.parameters import _create_new_callback
+
+    def dependency():
+        return 1
+
+    # Called by the wrapper of its dependant, offloaded only if configured
+    assert _create_new_callback(dependency, dependency=True) is dependency
+    assert _create_new_callback(dependency, True, dependency=True) is not dependency
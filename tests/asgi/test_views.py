@@ -44,3 +44,89 @@ async def test_socket_view():
 
         async def on_receive(self, data):
             await websocket.send_json(data)
+
+
+@pytest.mark.asyncio
+async def test_socket_view_send():
+    from httpx_ws import aconnect_ws
+    from httpx_ws.transport import ASGIWebSocketTransport
+
+    app = Kui()
+
+    @app.router.websocket("/json")
+    class Json(SocketView):
+        encoding = "json"
+
+        async def on_receive(self, data):
+            await self.send({"echo": data})
+
+    async with httpx.AsyncClient(transport=ASGIWebSocketTransport(app=app)) as client:
+        async with aconnect_ws("http://testserver/json", client=client) as ws:
+            await ws.send_json([1, 2])
+            assert await ws.receive_json() == {"echo": [1, 2]}
+
+
+@pytest.mark.asyncio
+async def test_socket_view_msgpack():
+    msgpack = pytest.importorskip("msgpack")
+    from httpx_ws import aconnect_ws
+    from httpx_ws.transport import ASGIWebSocketTransport
+
+    app = Kui()
+
+    @app.router.websocket("/msgpack")
+    class MsgPack(SocketView):
+        encoding = "msgpack"
+
+        async def on_receive(self, data):
+            await self.send({"echo": data})
+
+    async with httpx.AsyncClient(transport=ASGIWebSocketTransport(app=app)) as client:
+        async with aconnect_ws("http://testserver/msgpack", client=client) as ws:
+            for value in ([1, 2], "text"):
+                await ws.send_bytes(msgpack.packb(value))
+                assert msgpack.unpackb(await ws.receive_bytes()) == {"echo": value}
+
+
+@pytest.mark.asyncio
+async def test_socket_view_cbor():
+    cbor2 = pytest.importorskip("cbor2")
+    from httpx_ws import aconnect_ws
+    from httpx_ws.transport import ASGIWebSocketTransport
+
+    app = Kui()
+
+    @app.router.websocket("/cbor")
+    class Cbor(SocketView):
+        encoding = "cbor"
+
+        async def on_receive(self, data):
+            await self.send({"echo": data})
+
+    async with httpx.AsyncClient(transport=ASGIWebSocketTransport(app=app)) as client:
+        async with aconnect_ws("http://testserver/cbor", client=client) as ws:
+            for value in ([1, 2], "text"):
+                await ws.send_bytes(cbor2.dumps(value))
+                assert cbor2.loads(await ws.receive_bytes()) == {"echo": value}
+
+
+@pytest.mark.asyncio
+async def test_socket_view_send_queue():
+    from httpx_ws import aconnect_ws
+    from httpx_ws.transport import ASGIWebSocketTransport
+
+    app = Kui()
+
+    @app.router.websocket("/")
+    class Echo(SocketView):
+        encoding = "text"
+        send_queue_size = 4
+
+        async def on_receive(self, data):
+            assert websocket.send_queue is not None
+            await self.send(data)
+
+    async with httpx.AsyncClient(transport=ASGIWebSocketTransport(app=app)) as client:
+        async with aconnect_ws("http://testserver/", client=client) as ws:
+            await ws.send_text("ping")
+            assert await ws.receive_text() == "ping"
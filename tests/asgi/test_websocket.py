@@ -0,0 +1,264 @@
+import asyncio
+
+import pytest
+from baize.asgi import WebSocketDisconnect, WebSocketState
+
+from kui.asgi import WebSocket
+
+
+@pytest.mark.asyncio
+async def test_websocket_is_disconnected():
+    messages: asyncio.Queue = asyncio.Queue()
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    for message in (
+        {"type": "websocket.connect"},
+        {"type": "websocket.receive", "text": "a"},
+        {"type": "websocket.receive", "text": "b"},
+    ):
+        messages.put_nowait(message)
+
+    websocket = WebSocket(
+        {"type": "websocket", "path": "/", "headers": []}, messages.get, send
+    )
+    await websocket.accept()
+    assert not await websocket.is_disconnected()
+    await asyncio.sleep(0)
+    assert not await websocket.is_disconnected()
+    # Messages received by the pump are not lost
+    assert await websocket.receive_text() == "a"
+    assert await websocket.receive_text() == "b"
+
+    messages.put_nowait({"type": "websocket.disconnect", "code": 1000})
+    await asyncio.wait_for(websocket.wait_disconnected(), 1)
+    assert await websocket.is_disconnected()
+    with pytest.raises(WebSocketDisconnect):
+        await websocket.receive_text()
+    await websocket._stop_receive_pump()
+
+
+@pytest.mark.asyncio
+async def test_websocket_stop_receive_pump():
+    async def receive():
+        await asyncio.Event().wait()
+
+    async def send(message):
+        pass
+
+    websocket = WebSocket(
+        {"type": "websocket", "path": "/", "headers": []}, receive, send
+    )
+    assert not await websocket.is_disconnected()
+    await websocket._stop_receive_pump()
+    assert websocket._receive_pump is not None and websocket._receive_pump.done()
+
+
+async def send_nothing(message):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_websocket_receive_pump_backpressure():
+    closed = False
+
+    async def send(message):
+        if closed:
+            raise OSError("The connection is closed")
+
+    messages: asyncio.Queue = asyncio.Queue()
+    messages.put_nowait({"type": "websocket.connect"})
+    websocket = WebSocket(
+        {"type": "websocket", "path": "/", "headers": []}, messages.get, send
+    )
+    await websocket.accept()
+    assert not await websocket.is_disconnected()
+
+    count = WebSocket.receive_queue_size + 10
+    for i in range(count):
+        messages.put_nowait({"type": "websocket.receive", "text": str(i)})
+    messages.put_nowait({"type": "websocket.disconnect", "code": 1000})
+    for _ in range(count):
+        await asyncio.sleep(0)
+    # The pump stops receiving while its buffer is full
+    assert messages.qsize() == 10
+    assert not await websocket.is_disconnected()
+
+    # A handler that only sends sees the disconnect when sending fails
+    closed = True
+    with pytest.raises(OSError):
+        await websocket.send_text("push")
+    assert await websocket.is_disconnected()
+
+    # No message is dropped
+    for i in range(count):
+        assert await websocket.receive_text() == str(i)
+    with pytest.raises(WebSocketDisconnect):
+        await websocket.receive_text()
+    await websocket._stop_receive_pump()
+
+
+@pytest.mark.asyncio
+async def test_websocket_stop_receive_pump_cancelled():
+    async def receive():
+        await asyncio.Event().wait()
+
+    websocket = WebSocket(
+        {"type": "websocket", "path": "/", "headers": []}, receive, send_nothing
+    )
+    assert not await websocket.is_disconnected()
+    stopping = asyncio.ensure_future(websocket._stop_receive_pump())
+    await asyncio.sleep(0)
+    stopping.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stopping
+
+
+@pytest.mark.asyncio
+async def test_websocket_json_many():
+    sent: list = []
+
+    async def send(message):
+        sent.append(message)
+
+    messages: asyncio.Queue = asyncio.Queue()
+    messages.put_nowait({"type": "websocket.connect"})
+    websocket = WebSocket(
+        {"type": "websocket", "path": "/", "headers": []}, messages.get, send
+    )
+    await websocket.accept()
+
+    await websocket.send_json_many([{"a": 1}, [2]])
+    await websocket.send_json_many(iter([{"a": 1}, [2]]), format="ndjson")
+    await websocket.send_json_many([{"a": 1}], mode="binary", format="ndjson")
+    assert sent[1:] == [
+        {"type": "websocket.send", "text": '[{"a": 1}, [2]]'},
+        {"type": "websocket.send", "text": '{"a": 1}\n[2]'},
+        {"type": "websocket.send", "bytes": b'{"a": 1}'},
+    ]
+
+    for message in sent[1:]:
+        messages.put_nowait({**message, "type": "websocket.receive"})
+    assert await websocket.receive_json_many() == [{"a": 1}, [2]]
+    assert await websocket.receive_json_many(format="ndjson") == [{"a": 1}, [2]]
+    assert await websocket.receive_json_many("binary", format="ndjson") == [{"a": 1}]
+
+    # Only "\n" separates values, JSON strings may hold other line breaks
+    messages.put_nowait(
+        {"type": "websocket.receive", "text": '"a\u2028b\x85c"\r\n{"d": "\u2029"}'}
+    )
+    assert await websocket.receive_json_many(format="ndjson") == [
+        "a\u2028b\x85c",
+        {"d": "\u2029"},
+    ]
+
+
+def create_connected_websocket(send):
+    async def receive():
+        await asyncio.Event().wait()
+
+    websocket = WebSocket(
+        {"type": "websocket", "path": "/", "headers": []}, receive, send
+    )
+    websocket.client_state = WebSocketState.CONNECTED
+    websocket.application_state = WebSocketState.CONNECTED
+    return websocket
+
+
+@pytest.mark.asyncio
+async def test_websocket_send_queue_block():
+    release = asyncio.Event()
+    sent: list = []
+
+    async def send(message):
+        await release.wait()
+        sent.append(message)
+
+    websocket = create_connected_websocket(send)
+    queue = websocket.start_send_queue(4, high_watermark=3, low_watermark=1)
+    for text in "abc":
+        await websocket.send_text(text)
+    assert queue.depth == 3 and not queue.writable
+
+    blocked = asyncio.ensure_future(websocket.send_text("d"))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, 1)
+    await websocket.close(1000)
+    await websocket._stop_send_queue()
+    assert [message.get("text") for message in sent] == ["a", "b", "c", "d", None]
+    assert queue.sent == 5 and queue.max_depth == 3 and queue.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_websocket_send_queue_overflow():
+    release = asyncio.Event()
+    sent: list = []
+
+    async def send(message):
+        await release.wait()
+        sent.append(message)
+
+    websocket = create_connected_websocket(send)
+    queue = websocket.start_send_queue(2, overflow="drop_oldest")
+    for text in "abcd":
+        await websocket.send_text(text)
+        await asyncio.sleep(0)
+    release.set()
+    await websocket._stop_send_queue()
+    # The first message is being sent when the others are queued
+    assert [message["text"] for message in sent] == ["a", "c", "d"]
+    assert queue.dropped == 1
+
+    release.clear()
+    sent.clear()
+    websocket = create_connected_websocket(send)
+    queue = websocket.start_send_queue(2, overflow="close")
+    with pytest.raises(WebSocketDisconnect):
+        for text in "abcd":
+            await websocket.send_text(text)
+    await websocket.close(1000)
+    release.set()
+    await websocket._stop_send_queue()
+    assert sent[-1] == {"type": "websocket.close", "code": 1013}
+    assert queue.closed
+
+
+@pytest.mark.asyncio
+async def test_websocket_send_queue_client_gone():
+    async def send(message):
+        raise OSError("Connection lost")
+
+    websocket = create_connected_websocket(send)
+    websocket.start_send_queue(1)
+    await websocket.send_text("a")
+    with pytest.raises(WebSocketDisconnect):
+        for _ in range(3):
+            await websocket.send_text("b")
+    await websocket._stop_send_queue()
+
+
+@pytest.mark.asyncio
+async def test_websocket_send_queue_stalled_client():
+    async def send(message):
+        await asyncio.Event().wait()
+
+    websocket = create_connected_websocket(send)
+    queue = websocket.start_send_queue(2, high_watermark=8, close_timeout=0.05)
+    assert queue.high_watermark == 2
+    for text in "abc":
+        await websocket.send_text(text)
+        await asyncio.sleep(0)
+    # "a" is being sent, "d" has to wait for room even in block mode
+    blocked = asyncio.ensure_future(websocket.send_text("d"))
+    await asyncio.sleep(0.01)
+    assert not blocked.done() and queue.depth == 2
+
+    await asyncio.wait_for(websocket._stop_send_queue(), 1)
+    assert queue.closed and queue.dropped == 2 and queue.depth == 0
+    with pytest.raises(WebSocketDisconnect):
+        await asyncio.wait_for(blocked, 1)
@@ -194,6 +194,7 @@ async def test_openapi_page():
                                     "application/json": {
                                         "schema": {
                                             "type": "array",
+                                            "maxItems": 32,
                                             "items": {
                                                 "type": "object",
                                                 "properties": {
@@ -213,10 +214,14 @@ async def test_openapi_page():
                                                         "description": "error message",
                                                         "type": "string",
                                                     },
+                                                    "input": {
+                                                        "title": "Input",
+                                                        "description": "input value, may be truncated",
+                                                    },
                                                     "ctx": {
                                                         "title": "Context",
                                                         "description": "error context",
-                                                        "type": "string",
+                                                        "type": "object",
                                                     },
                                                     "in": {
                                                         "title": "In",
@@ -271,6 +276,7 @@ async def test_openapi_page():
                                     "application/json": {
                                         "schema": {
                                             "type": "array",
+                                            "maxItems": 32,
                                             "items": {
                                                 "type": "object",
                                                 "properties": {
@@ -290,10 +296,14 @@ async def test_openapi_page():
                                                         "description": "error message",
                                                         "type": "string",
                                                     },
+                                                    "input": {
+                                                        "title": "Input",
+                                                        "description": "input value, may be truncated",
+                                                    },
                                                     "ctx": {
                                                         "title": "Context",
                                                         "description": "error context",
-                                                        "type": "string",
+                                                        "type": "object",
                                                     },
                                                     "in": {
                                                         "title": "In",
@@ -357,6 +367,7 @@ async def test_openapi_page():
                                     "application/json": {
                                         "schema": {
                                             "type": "array",
+                                            "maxItems": 32,
                                             "items": {
                                                 "type": "object",
                                                 "properties": {
@@ -376,10 +387,14 @@ async def test_openapi_page():
                                                         "description": "error message",
                                                         "type": "string",
                                                     },
+                                                    "input": {
+                                                        "title": "Input",
+                                                        "description": "input value, may be truncated",
+                                                    },
                                                     "ctx": {
                                                         "title": "Context",
                                                         "description": "error context",
-                                                        "type": "string",
+                                                        "type": "object",
                                                     },
                                                     "in": {
                                                         "title": "In",
@@ -428,6 +443,7 @@ async def test_openapi_page():
                                     "application/json": {
                                         "schema": {
                                             "type": "array",
+                                            "maxItems": 32,
                                             "items": {
                                                 "type": "object",
                                                 "properties": {
@@ -447,10 +463,14 @@ async def test_openapi_page():
                                                         "description": "error message",
                                                         "type": "string",
                                                     },
+                                                    "input": {
+                                                        "title": "Input",
+                                                        "description": "input value, may be truncated",
+                                                    },
                                                     "ctx": {
                                                         "title": "Context",
                                                         "description": "error context",
-                                                        "type": "string",
+                                                        "type": "object",
                                                     },
                                                     "in": {
                                                         "title": "In",
@@ -709,6 +729,7 @@ def test_openapi_depend_response():
                             "application/json": {
                                 "schema": {
                                     "type": "array",
+                                    "maxItems": 32,
                                     "items": {
                                         "type": "object",
                                         "properties": {
@@ -728,10 +749,14 @@ def test_openapi_depend_response():
                                                 "description": "error message",
                                                 "type": "string",
                                             },
+                                            "input": {
+                                                "title": "Input",
+                                                "description": "input value, may be truncated",
+                                            },
                                             "ctx": {
                                                 "title": "Context",
                                                 "description": "error context",
-                                                "type": "string",
+                                                "type": "object",
                                             },
                                             "in": {
                                                 "title": "In",
@@ -884,3 +909,110 @@ async def test_openapi_components_schemas():
                 },
             ],
         }, openapi_docs_text
+
+
+@pytest.mark.asyncio
+async def test_openapi_docs_cache():
+    app = Kui()
+    openapi = OpenAPI()
+    app.router <<= Routes("/docs" // openapi.routes, namespace="docs")
+
+    @app.router.http.get("/hello")
+    async def hello():
+        """
+        hello
+        """
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        response = await client.get("/docs/json")
+        docs_hash = response.headers["hash"]
+        assert list(response.json()["paths"].keys()) == ["/hello"]
+
+        cached_docs = openapi._get_cached_docs(app)[0]
+        response = await client.get("/docs/json", headers={"host": "example.com"})
+        assert response.headers["hash"] == docs_hash
+        assert response.json()["servers"][1]["variables"]["address"] == {
+            "default": "example.com",
+            "description": "api server's host[:port]",
+        }
+        assert openapi._get_cached_docs(app)[0] is cached_docs
+        assert "servers" not in cached_docs
+
+        @app.router.http.get("/world")
+        async def world():
+            """
+            world
+            """
+
+        response = await client.get("/docs/json")
+        assert response.headers["hash"] != docs_hash
+        assert list(response.json()["paths"].keys()) == ["/hello", "/world"]
+
+
+def test_openapi_lazy_docs():
+    from kui.asgi import Query
+
+    app = Kui()
+    openapi = OpenAPI()
+
+    @app.router.http.get("/hello", summary="Say hello")
+    async def hello(name: Annotated[str, Query()]) -> Annotated[Any, JSONResponse[200]]:
+        """
+        Hello
+
+        Return hello with name
+        """
+
+    _, endpoint = app.router.search("http", "/hello")
+    assert not hasattr(endpoint, "__docs_parameters__")
+    assert not hasattr(endpoint, "__docs_summary__")
+
+    operation = openapi.export_docs(app)["paths"]["/hello"]["get"]
+    assert operation["summary"] == "Say hello"
+    assert operation["description"] == "Return hello with name"
+    assert operation["parameters"][0]["name"] == "name"
+    assert hasattr(endpoint, "__docs_parameters__")
+
+
+def test_resolve_docs_threads():
+    import threading
+
+    from kui.parameters import defer_docs, resolve_docs
+
+    started = threading.Event()
+    proceed = threading.Event()
+
+    def handler():
+        pass
+
+    def slow_update():
+        started.set()
+        proceed.wait(5)
+        handler.__docs_summary__ = "slow"  # type: ignore
+
+    def last_update():
+        handler.__docs_description__ = "last"  # type: ignore
+
+    defer_docs(handler, slow_update)
+    defer_docs(handler, last_update)
+
+    first = threading.Thread(target=resolve_docs, args=(handler,))
+    first.start()
+    assert started.wait(5)
+    seen = []
+
+    def read_docs():
+        resolve_docs(handler)
+        seen.append(getattr(handler, "__docs_description__", None))
+
+    second = threading.Thread(target=read_docs)
+    second.start()
+    second.join(0.1)
+    # The second thread waits for the updates instead of reading half of them
+    assert seen == []
+    proceed.set()
+    first.join(5)
+    second.join(5)
+    assert seen == ["last"]
@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+from kui.asgi import Kui, OpenAPI, Routes
+from kui.openapi.commands import dump_docs, export_docs
+
+
+def test_export_docs(tmp_path):
+    output = tmp_path / "openapi.json"
+    subprocess.run(
+        [sys.executable, "-m", "kui.openapi", "export", "example:app", "-o", output],
+        check=True,
+    )
+    content = output.read_bytes()
+    assert b"\n" not in content and b": " not in content
+    openapi = json.loads(content)
+    assert openapi["servers"] == [{"url": "/", "description": "Current server"}]
+    assert "/sources/{filepath}" in openapi["paths"]
+
+    yaml = pytest.importorskip("yaml")
+    yaml_output = tmp_path / "openapi.yaml"
+    export_docs("example:app", str(yaml_output))
+    assert yaml.safe_load(yaml_output.read_text(encoding="utf8")) == openapi
+
+
+def test_dump_docs():
+    openapi = {"openapi": "3.1.0", "info": {"title": "Kuí", "version": "1.0.0"}}
+    assert dump_docs(openapi, "json") == (  # type: ignore
+        '{"openapi":"3.1.0","info":{"title":"Kuí","version":"1.0.0"}}'.encode()
+    )
+    with pytest.raises(ValueError):
+        dump_docs(openapi, "xml")  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_prebuilt_docs(tmp_path):
+    app = Kui()
+
+    @app.router.http.get("/hello")
+    async def hello():
+        """
+        hello
+        """
+
+    output = tmp_path / "openapi.json"
+    output.write_bytes(dump_docs(OpenAPI().export_docs(app), "json"))
+
+    openapi = OpenAPI(prebuilt_docs=output)
+    app.router <<= Routes("/docs" // openapi.routes)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        response = await client.get("/docs/json")
+        assert response.status_code == 200
+        assert response.content == output.read_bytes()
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["etag"] == openapi.prebuilt_etag
+        assert len(response.headers["hash"]) == 32
+        assert "/hello" in response.json()["paths"]
+
+        response = await client.get(
+            "/docs/json", headers={"if-none-match": openapi.prebuilt_etag}
+        )
+        assert response.status_code == 304
@@ -15,3 +15,28 @@ from kui.openapi.extra_docs import merge_openapi_info
 )
 def test_merge_openapi_info(f, s, r):
     assert merge_openapi_info(f, s) == r
+
+
+def test_merge_openapi_info_copy_on_write():
+    from kui.openapi.extra_docs import merge_openapi_info
+
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    operation = {"requestBody": {"schema": schema}, "tags": ["a"]}
+    merged = merge_openapi_info(
+        operation,
+        {
+            "requestBody": {"schema": {"properties": {"age": {"type": "integer"}}}},
+            "tags": ["b"],
+        },
+    )
+    assert merged == {
+        "requestBody": {
+            "schema": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+            }
+        },
+        "tags": ["a", "b"],
+    }
+    assert schema == {"type": "object", "properties": {"name": {"type": "string"}}}
+    assert operation["tags"] == ["a"]
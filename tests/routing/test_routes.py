@@ -194,3 +194,31 @@ def test_middleware_check_wraps():
         match="Cannot use `@functools.wraps` on a middleware.",
     ):
         _ = HttpRoute("/hello", endpoint) @ middleware
+
+
+@pytest.mark.asyncio
+async def test_router_wait_for_change():
+    import asyncio
+
+    from kui.asgi import Kui
+
+    app = Kui()
+    version = app.router.version
+
+    waiters = [
+        asyncio.ensure_future(app.router.wait_for_change(version)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert not any(waiter.done() for waiter in waiters)
+
+    @app.router.http("/hello")
+    async def hello():
+        return "hello world"
+
+    assert await asyncio.gather(*waiters) == [version + 1] * 3
+    assert await app.router.wait_for_change(version) == version + 1
+
+    waiter = asyncio.ensure_future(app.router.wait_for_change(app.router.version))
+    await asyncio.sleep(0)
+    app.should_exit = True
+    assert await waiter == version + 1
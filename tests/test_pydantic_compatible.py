@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from kui.pydantic_compatible import get_model_json_schema
+
+
+def test_get_model_json_schema_cache():
+    class Pagination(BaseModel):
+        page: int = Field(1, description="Page number")
+        size: Optional[int] = None
+
+    schema = get_model_json_schema(Pagination)
+    assert schema == Pagination.model_json_schema(
+        ref_template="#/components/schemas/{model}"
+    )
+
+    schema.pop("title")
+    assert get_model_json_schema(Pagination)["title"] == "Pagination"
+    # Nested objects are shared with the cache, not copied for each call
+    assert get_model_json_schema(Pagination)["properties"] is schema["properties"]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import contextvars
+
+import pytest
+
+from kui.utils import ContextSlotVar, bind_contextvar
+from kui.utils.contextvars import context_setter
+
+
+class Slots:
+    __slots__ = ("first", "second")
+
+
+def test_context_slot_var():
+    contextvar: contextvars.ContextVar[Slots] = contextvars.ContextVar("slots")
+    first: ContextSlotVar[str] = ContextSlotVar(contextvar, "first", Slots)
+    second: ContextSlotVar[str] = ContextSlotVar(contextvar, "second", Slots)
+    proxy = bind_contextvar(first)
+
+    with pytest.raises(LookupError):
+        first.get()
+    assert first.get("default") == "default"
+    with pytest.raises(LookupError):
+        proxy.upper()
+    assert isinstance(proxy.__class__, type)
+
+    with context_setter(first, "hello"):
+        assert first.get() == "hello"
+        assert proxy.upper() == "HELLO"
+        assert proxy.__class__ is str
+        with pytest.raises(LookupError):
+            second.get()
+
+        slots = contextvar.get()
+        token = second.set("world")
+        assert (first.get(), second.get()) == ("hello", "world")
+        # The slots object shared by other contexts is not modified
+        assert not hasattr(slots, "second")
+        second.reset(token)
+        assert contextvar.get() is slots
+
+    with pytest.raises(LookupError):
+        first.get()
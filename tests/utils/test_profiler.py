@@ -0,0 +1,56 @@
+import json
+
+from typing_extensions import Annotated
+
+from kui.utils.profiler import StartupProfiler, startup_profiler
+
+
+def test_profiler_disabled():
+    profiler = StartupProfiler()
+    with profiler.route(test_profiler_disabled), profiler.phase("signature"):
+        pass
+    assert profiler.records == {}
+    assert profiler.phase_totals() == []
+
+
+def test_profiler_nested_phases():
+    profiler = StartupProfiler(enabled=True)
+
+    def handler(): ...
+
+    with profiler.route(handler):
+        with profiler.phase("auto_params"):
+            with profiler.phase("create_model"):
+                pass
+    profiler.add_path(handler, "/handler")
+    with profiler.phase("json_schema"):
+        pass
+
+    assert {name for name, _ in profiler.phase_totals()} == {
+        "auto_params",
+        "create_model",
+        "json_schema",
+    }
+    labels = [label for label, _, _ in profiler.route_totals()]
+    assert sorted(labels) == ["(outside routes)", "/handler"]
+    report = json.loads(json.dumps(profiler.to_dict()))
+    assert set(report["phases"]) == {"auto_params", "create_model", "json_schema"}
+    assert "/handler" in profiler.format_report()
+
+
+def test_profile_startup(monkeypatch):
+    from kui.asgi import Kui, Query
+
+    monkeypatch.setattr(startup_profiler, "enabled", True)
+    monkeypatch.setattr(startup_profiler, "records", {})
+    monkeypatch.setattr(startup_profiler, "paths", {})
+
+    app = Kui()
+
+    @app.router.http.get("/items")
+    async def items(name: Annotated[str, Query()]):
+        pass
+
+    phases = dict(startup_profiler.phase_totals())
+    assert {"auto_params", "signature", "create_model", "radix_tree"} <= set(phases)
+    assert startup_profiler.route_totals()[0][0] == "/items"
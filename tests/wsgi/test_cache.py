@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import httpx
+
+from kui.cache import MemoryCache
+from kui.wsgi import HttpRoute, Kui, PlainTextResponse, cache_response, request
+
+
+def test_cache_response():
+    calls = []
+
+    def homepage():
+        calls.append(request.query_params.get("page"))
+        return {"page": request.query_params.get("page")}
+
+    def with_cookie():
+        calls.append("cookie")
+        response = PlainTextResponse("cookie")
+        response.set_cookie("key", "value")
+        return response
+
+    backend = MemoryCache(max_size=2)
+    app = Kui(
+        http_middlewares=[
+            cache_response(
+                ttl=60, query_params=["page"], vary=["Accept-Language"], backend=backend
+            )
+        ]
+    )
+    app.router <<= HttpRoute("/", homepage)
+    app.router <<= HttpRoute("/cookie", with_cookie)
+
+    with httpx.Client(
+        base_url="http://testserver",
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+    ) as client:
+        for i in range(5):
+            resp = client.get("/", params={"page": "1", "other": str(i)})
+            assert resp.json() == {"page": "1"}
+        assert calls == ["1"]
+
+        resp = client.get("/", params={"page": "2"})
+        assert resp.json() == {"page": "2"}
+        assert calls == ["1", "2"]
+
+        resp = client.get("/", params={"page": "2"}, headers={"accept-language": "zh"})
+        assert resp.json() == {"page": "2"}
+        assert calls == ["1", "2", "2"]
+        assert len(backend) == 2
+
+        client.get("/cookie")
+        resp = client.get("/cookie")
+        assert resp.cookies["key"] == "value"
+        assert calls == ["1", "2", "2", "cookie", "cookie"]
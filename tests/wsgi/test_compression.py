@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import httpx
+
+from kui.compression import GzipCompressor
+from kui.wsgi import (
+    HttpResponse,
+    HttpRoute,
+    Kui,
+    PlainTextResponse,
+    StreamResponse,
+    compress_response,
+)
+from kui.wsgi.compression import CompressResponse
+
+
+def test_compress_response():
+    app = Kui(http_middlewares=[compress_response(minimum_size=10)])
+
+    def large():
+        return "kui" * 100
+
+    def small():
+        return "kui"
+
+    def image():
+        return PlainTextResponse(b"\x00" * 100, media_type="image/png")
+
+    def stream():
+        def g():
+            for i in range(3):
+                yield {"id": str(i), "data": "hello"}
+
+        return g()
+
+    def octet_stream():
+        def g():
+            for _ in range(3):
+                yield b"kui" * 10
+
+        return StreamResponse(g())
+
+    app.router <<= HttpRoute("/large", large)
+    app.router <<= HttpRoute("/small", small)
+    app.router <<= HttpRoute("/image", image)
+    app.router <<= HttpRoute("/stream", stream)
+    app.router <<= HttpRoute("/octet-stream", octet_stream)
+
+    with httpx.Client(
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+        base_url="http://testserver",
+        headers={"accept-encoding": "gzip"},
+    ) as client:
+        resp = client.get("/large")
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert int(resp.headers["content-length"]) < 300
+        assert resp.text == "kui" * 100
+
+        resp = client.get("/small")
+        assert "content-encoding" not in resp.headers
+        assert resp.text == "kui"
+
+        resp = client.get("/image")
+        assert "content-encoding" not in resp.headers
+
+        resp = client.get("/stream")
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "content-length" not in resp.headers
+        assert (
+            resp.text.replace(": ping\n\n", "")
+            == "\n".join(f"id: {i}\ndata: hello\n" for i in range(3)) + "\n"
+        )
+
+        # The default media type of StreamResponse
+        resp = client.get("/octet-stream")
+        assert resp.headers["content-type"] == "application/octet-stream"
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.content == b"kui" * 30
+
+        resp = client.get("/large", headers={"accept-encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert resp.text == "kui" * 100
+
+
+def test_compress_response_without_start_response():
+    class LazyResponse(HttpResponse):
+        def __call__(self, environ, start_response):
+            # The empty body is returned before start_response is called
+            return []
+
+    calls: list = []
+    response = CompressResponse(
+        LazyResponse(), "gzip", lambda: GzipCompressor(6), 10, frozenset()
+    )
+    assert b"".join(response({}, lambda *args: calls.append(args))) == b""
+    assert calls == []
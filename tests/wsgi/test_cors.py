@@ -57,3 +57,31 @@ def test_cors_global():
 
         resp = client.options("/")
         assert resp.headers["access-control-allow-origin"] == "testserver"
+
+
+def test_cors_preflight_skips_endpoint():
+    from kui.wsgi import HttpRoute, Kui, required_method
+
+    app = Kui(cors_config={"allow_origins": ["https://a.example"]})
+
+    called = []
+
+    @required_method("GET")
+    def homepage():
+        called.append(1)
+        return "homepage"
+
+    app.router <<= HttpRoute("/", homepage)
+
+    with httpx.Client(
+        base_url="http://testServer",
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+    ) as client:
+        resp = client.options("/", headers={"origin": "https://a.example"})
+        assert resp.status_code == 200
+        assert resp.headers["access-control-allow-origin"] == "https://a.example"
+        assert resp.content == b""
+
+        resp = client.options("/", headers={"origin": "https://c.example"})
+        assert "access-control-allow-origin" not in resp.headers
+        assert called == []
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import httpx
+
+from kui.wsgi import HttpRoute, JSONResponse, Kui, etag_response
+
+
+def test_etag_response():
+    app = Kui(http_middlewares=[etag_response()])
+
+    def homepage():
+        return {"message": "Hello, World!"}
+
+    app.router <<= HttpRoute("/", homepage)
+
+    with httpx.Client(
+        base_url="http://testserver",
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+    ) as client:
+        resp = client.get("/")
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+
+        resp = client.get("/", headers={"if-none-match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+
+        resp = client.get("/", headers={"if-none-match": '"other"'})
+        assert resp.status_code == 200
+        assert resp.json() == {"message": "Hello, World!"}
+
+
+def test_precomputed_etag():
+    rendered = []
+
+    class Content:
+        pass
+
+    def homepage():
+        return JSONResponse(Content(), etag="v1")
+
+    app = Kui(json_encoder={Content: lambda obj: rendered.append(obj) or "content"})
+    app.router <<= HttpRoute("/", homepage)
+
+    with httpx.Client(
+        base_url="http://testserver",
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+    ) as client:
+        resp = client.get("/", headers={"if-none-match": 'W/"v1"'})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == '"v1"'
+        assert rendered == []
+
+        resp = client.get("/")
+        assert resp.status_code == 200
+        assert resp.json() == "content"
+        assert len(rendered) == 1
@@ -0,0 +1,36 @@
+import httpx
+
+from kui.wsgi import Kui, StreamResponse
+
+
+def test_not_found():
+    app = Kui()
+    middleware = app.exception_middleware
+
+    with httpx.Client(
+        base_url="http://testserver",
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+    ) as client:
+        for _ in range(2):
+            response = client.get("/not-found")
+            assert response.status_code == 404
+            assert response.text == "Nothing matches the given URI"
+        assert middleware._not_found_response is not None
+
+
+def test_not_found_stream_response():
+    def stream(content, status_code=200, headers=None):
+        return StreamResponse(iter([content.encode()]), status_code, headers)
+
+    app = Kui(response_converters={str: stream})
+
+    with httpx.Client(
+        base_url="http://testserver",
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+    ) as client:
+        # The iterator is consumed when sent, so it isn't reused
+        for _ in range(2):
+            response = client.get("/not-found")
+            assert response.status_code == 404
+            assert response.text == "Nothing matches the given URI"
+        assert app.exception_middleware._not_found_response is None
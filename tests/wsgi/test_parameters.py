@@ -28,6 +28,7 @@ def test_path():
     @app.router.http.get("/{name}", name=None)
     @app.router.http.get("/{id:int}", name=None)
     def path(name: Annotated[str, Path()]):
+        assert request["PATH_PARAMS"] == {"name": name}
         return name
 
     with Client(
@@ -31,3 +31,104 @@ def test_pydantic_base_model():
 
     response = client.get("/test_response_convertors.py")
     assert response.status_code == 200
+
+
+def test_buffer_types():
+    import array
+    import mmap
+
+    app = Kui()
+    data = bytes(range(256)) * 4096
+
+    @app.router.http("/bytearray")
+    def get_bytearray():
+        return bytearray(data)
+
+    @app.router.http("/memoryview")
+    def get_memoryview():
+        return memoryview(array.array("I", range(16)))
+
+    @app.router.http("/mmap")
+    def get_mmap():
+        buffer = mmap.mmap(-1, 16)
+        buffer.write(b"0123456789abcdef")
+        return buffer
+
+    @app.router.http("/empty")
+    def get_empty():
+        return bytearray()
+
+    client = httpx.Client(
+        base_url="http://testserver",
+        transport=httpx.WSGITransport(app=app),  # type: ignore
+    )
+    response = client.get("/bytearray")
+    assert response.status_code == 200
+    assert response.content == data
+    assert response.headers["content-length"] == str(len(data))
+
+    response = client.get("/memoryview")
+    assert response.content == array.array("I", range(16)).tobytes()
+    assert response.headers["content-length"] == str(16 * 4)
+
+    response = client.get("/mmap")
+    assert response.content == b"0123456789abcdef"
+
+    response = client.get("/empty")
+    assert response.content == b""
+    assert response.headers["content-length"] == "0"
+
+
+def test_buffer_chunked_iterable():
+    from kui.wsgi import PlainTextResponse
+
+    response = PlainTextResponse(memoryview(b"x" * 10))
+    response.chunk_size = 4
+    chunks = list(response({"REQUEST_METHOD": "GET"}, lambda status, headers: None))
+    assert chunks == [b"xxxx", b"xxxx", b"xx"]
+    assert all(type(chunk) is bytes for chunk in chunks)
+
+
+def test_file_response_file_wrapper(tmp_path):
+    from wsgiref.util import FileWrapper
+
+    from kui.wsgi import FileResponse
+
+    filepath = tmp_path / "data.bin"
+    data = bytes(range(256)) * 16
+    filepath.write_bytes(data)
+
+    def call(environ):
+        captured = {}
+
+        def start_response(status, headers, exc_info=None):
+            captured.update(status=status, headers=headers)
+
+        response = FileResponse(str(filepath), chunk_size=1000)
+        iterable = response(
+            {"REQUEST_METHOD": "GET", "wsgi.file_wrapper": FileWrapper, **environ},
+            start_response,
+        )
+        try:
+            return captured, iterable, b"".join(iterable)
+        finally:
+            iterable.close()
+
+    captured, iterable, body = call({})
+    assert isinstance(iterable, FileWrapper)
+    assert captured["status"] == "200 OK"
+    assert body == data
+
+    captured, iterable, body = call({"HTTP_RANGE": "bytes=100-2099"})
+    assert isinstance(iterable, FileWrapper)
+    assert captured["status"].startswith("206")
+    assert ("content-length", "2000") in captured["headers"]
+    assert body == data[100:2100]
+
+    captured, iterable, body = call({"HTTP_RANGE": "bytes=0-9,20-29"})
+    assert not isinstance(iterable, FileWrapper)
+    assert captured["status"].startswith("206")
+    assert data[:10] in body and data[20:30] in body
+
+    captured, iterable, body = call({"HTTP_RANGE": "bytes=9999-"})
+    assert captured["status"].startswith("416")